@@ -0,0 +1,28 @@
+import pytest
+from fastapi.testclient import TestClient
+
+from src.api.routes import create_app
+from src.utils.config import load_settings
+
+API_ROWS = 10_000
+
+
+@pytest.fixture(scope="module")
+def client(seeded_db, large_profile):
+    return TestClient(create_app(load_settings(), large_profile, seeded_db(API_ROWS), None))
+
+
+@pytest.mark.parametrize(
+    "path",
+    ["/api/jobs/pending?limit=50", "/api/jobs/pending?limit=50&include_prompt=true", "/api/stats"],
+)
+def test_api_latency(benchmark, client, path):
+    response = benchmark(client.get, path)
+    assert response.status_code == 200
+
+
+@pytest.mark.parametrize("path", ["/api/jobs/pending?limit=50", "/api/stats"])
+def test_api_revalidation_latency(benchmark, client, path):
+    etag = client.get(path).headers["etag"]
+    response = benchmark(client.get, path, headers={"If-None-Match": etag})
+    assert response.status_code == 304
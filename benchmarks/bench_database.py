@@ -0,0 +1,36 @@
+import itertools
+
+BATCH = 100
+_counter = itertools.count()
+
+
+def test_ingest_new_offers(benchmark, seeded_db, make_offer, rows):
+    repository = seeded_db(rows)
+
+    def fresh_batch():
+        start = next(_counter) * BATCH
+        return ([make_offer("wttj", f"bench-{rows}-{start + index}") for index in range(BATCH)],), {}
+
+    benchmark.pedantic(repository.add_job_offers, setup=fresh_batch, rounds=20)
+
+
+def test_ingest_duplicate_offers(benchmark, seeded_db, make_offer, rows):
+    repository = seeded_db(rows)
+    offers = [make_offer("wttj", f"dup-{index}") for index in range(BATCH)]
+    repository.add_job_offers(offers)
+    benchmark(repository.add_job_offers, offers)
+
+
+def test_get_pending_jobs(benchmark, seeded_db, rows):
+    repository = seeded_db(rows)
+    assert benchmark(repository.get_pending_jobs, 40, 50)
+
+
+def test_get_pending_linkedin_jobs(benchmark, seeded_db, rows):
+    repository = seeded_db(rows)
+    assert benchmark(repository.get_pending_linkedin_jobs, 50, 5)
+
+
+def test_get_stats(benchmark, seeded_db, rows):
+    repository = seeded_db(rows)
+    assert benchmark(repository.get_stats)["total"] >= rows
@@ -0,0 +1,13 @@
+def test_algolia_hits_to_offers(benchmark, algolia_pages, wttj_parser):
+    hits = [hit for page in algolia_pages for hit in page["hits"]]
+    offers = benchmark(lambda: [wttj_parser.hit_to_job(hit) for hit in hits])
+    assert all(offers)
+
+
+def test_linkedin_alert_emails(benchmark, alert_emails, linkedin_parser):
+    offers = benchmark(lambda: [linkedin_parser._parse_jobs_from_html(html) for html in alert_emails])
+    assert all(offers)
+
+
+def test_linkedin_job_pages(benchmark, job_pages, linkedin_parser):
+    benchmark(lambda: [linkedin_parser._parse_job_page(html) for html in job_pages])
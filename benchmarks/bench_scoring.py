@@ -0,0 +1,9 @@
+from src.matcher.keyword_matcher import calculate_keyword_score, calculate_provisional_score
+
+
+def test_keyword_score_large_profile(benchmark, wttj_offers, large_profile):
+    benchmark(lambda: [calculate_keyword_score(offer, large_profile) for offer in wttj_offers])
+
+
+def test_provisional_score_large_profile(benchmark, wttj_offers, large_profile):
+    benchmark(lambda: [calculate_provisional_score(offer, large_profile) for offer in wttj_offers])
@@ -0,0 +1,202 @@
+from __future__ import annotations
+
+import copy
+import json
+import os
+import random
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Callable, Dict, List
+
+import pytest
+from sqlalchemy import insert
+
+from src.database.models import Job
+from src.database.repository import DatabaseManager
+from src.scrapers.base_scraper import JobOffer
+from src.utils.config import load_profile, project_root
+from src.utils.deduplication import generate_job_hash
+
+FIXTURES = Path(__file__).resolve().parent / "fixtures"
+BASELINES = Path(__file__).resolve().parent / ".baselines"
+BASELINE_NAME = "baseline"
+REGRESSION_TOLERANCE = "median:30%"
+LINKEDIN_FIXTURES = project_root() / "tests" / "fixtures" / "linkedin"
+
+# BENCH_ROWS=10000 keeps a local run short; the baseline covers all three sizes.
+ROW_COUNTS = [int(value) for value in os.getenv("BENCH_ROWS", "10000,100000,1000000").split(",") if value]
+SEED_CHUNK = 20_000
+
+SKILL_STEMS = [
+    "Power BI", "SQL", "DAX", "Python", "Excel", "Tableau", "Snowflake", "Azure", "dbt", "Airflow",
+    "Looker", "BigQuery", "Spark", "SAP", "Salesforce", "Qlik", "Talend", "Alteryx", "Kafka", "Databricks",
+]
+
+
+# Why this run does not check for regressions; None when it compares against a baseline or records one.
+UNCHECKED = pytest.StashKey[str]()
+
+
+def pytest_configure(config):
+    """With BENCH_COMPARE=1, fail on median regressions against the baseline saved on this machine.
+
+    Baselines are local (``benchmarks/.baselines/`` is git-ignored): timings from another host say nothing about
+    this one, so a comparison only makes sense against a baseline recorded here from the parent commit. A run that
+    compares nothing says so loudly in its summary instead of passing as if it had been checked.
+    """
+    from pytest_benchmark.utils import get_machine_id, parse_compare_fail
+
+    config.stash[UNCHECKED] = None
+    if config.getoption("benchmark_storage").startswith("file://./.benchmarks"):
+        config.option.benchmark_storage = f"file://{BASELINES}"
+    if config.getoption("benchmark_compare") or config.getoption("benchmark_save"):
+        return
+    if os.getenv("BENCH_COMPARE") != "1":
+        config.stash[UNCHECKED] = "BENCH_COMPARE=1 is not set, so no timing is compared against a baseline."
+        return
+    if not any((BASELINES / get_machine_id()).glob(f"*_{BASELINE_NAME}.json")):
+        raise pytest.UsageError(
+            f"BENCH_COMPARE=1 but this machine has no saved baseline in {BASELINES}; "
+            "record one from the parent commit first (see README, section 7.7)."
+        )
+    config.option.benchmark_compare = f"*_{BASELINE_NAME}"
+    config.option.benchmark_compare_fail = config.getoption("benchmark_compare_fail") or [
+        parse_compare_fail(REGRESSION_TOLERANCE)
+    ]
+
+
+@pytest.hookimpl(trylast=True)
+def pytest_terminal_summary(terminalreporter, exitstatus, config):
+    reason = config.stash.get(UNCHECKED, None)
+    if reason:
+        terminalreporter.write_sep("!", "NO REGRESSION CHECK", red=True, bold=True)
+        terminalreporter.write_line(f"{reason} A slower build would have passed this run.", red=True, bold=True)
+
+
+def pytest_generate_tests(metafunc):
+    if "rows" in metafunc.fixturenames:
+        metafunc.parametrize("rows", ROW_COUNTS)
+
+
+def _offer(source: str, key: str, description: str = "Power BI, SQL et Python pour le reporting.") -> JobOffer:
+    return JobOffer(
+        source=source,
+        external_id=key,
+        url=f"https://example.com/{source}/jobs/{key}",
+        title="Data Analyst",
+        company="Example",
+        location="Paris, France",
+        contract_type="CDI",
+        salary_min=None,
+        salary_max=None,
+        description=description,
+    )
+
+
+@pytest.fixture(scope="session")
+def make_offer() -> Callable[..., JobOffer]:
+    return _offer
+
+
+@pytest.fixture(scope="session")
+def large_profile() -> dict:
+    """The real profile padded to several hundred skills, aliases and bonuses."""
+    profile = copy.deepcopy(load_profile())
+    skills = profile.setdefault("skills", {})
+    rng = random.Random(7)
+    for index in range(300):
+        stem = SKILL_STEMS[index % len(SKILL_STEMS)]
+        skill = {
+            "keyword": f"{stem} {index}",
+            "weight": rng.randint(1, 10),
+            "aliases": [f"{stem}-{index}", f"{stem.lower()} v{index}"],
+        }
+        skills.setdefault(("important", "nice_to_have", "nice_to_have")[index % 3], []).append(skill)
+    for index in range(60):
+        skills.setdefault("not_known", []).append({"keyword": f"Legacy tool {index}", "penalty": -3})
+    profile.setdefault("bonuses", []).extend({"keyword": f"bonus {index}", "bonus": 1} for index in range(40))
+    return profile
+
+
+@pytest.fixture(scope="session")
+def algolia_pages() -> List[dict]:
+    return [json.loads(path.read_text(encoding="utf-8")) for path in sorted((FIXTURES / "algolia").glob("*.json"))]
+
+
+@pytest.fixture(scope="session")
+def alert_emails() -> List[str]:
+    return [path.read_text(encoding="utf-8") for path in sorted(LINKEDIN_FIXTURES.glob("alert_email_*.html"))]
+
+
+@pytest.fixture(scope="session")
+def job_pages() -> List[str]:
+    return [path.read_text(encoding="utf-8") for path in sorted(LINKEDIN_FIXTURES.glob("job_page_*.html"))]
+
+
+@pytest.fixture(scope="session")
+def wttj_parser():
+    from src.scrapers.wttj_scraper import WttjScraper
+
+    return WttjScraper("https://www.welcometothejungle.com", [], None, None)
+
+
+@pytest.fixture(scope="session")
+def linkedin_parser():
+    from src.scrapers.linkedin_email import LinkedInEmailScraper
+
+    return LinkedInEmailScraper("LinkedIn Jobs", 0, "", "")
+
+
+@pytest.fixture(scope="session")
+def wttj_offers(algolia_pages, wttj_parser) -> List[JobOffer]:
+    hits = [hit for page in algolia_pages for hit in page["hits"]]
+    return [job for job in map(wttj_parser.hit_to_job, hits) if job]
+
+
+@pytest.fixture(scope="session")
+def seeded_db(tmp_path_factory) -> Callable[[int], DatabaseManager]:
+    """Build (once per session) a database holding ``rows`` jobs with a realistic status mix."""
+    cache: Dict[int, DatabaseManager] = {}
+
+    def build(rows: int) -> DatabaseManager:
+        if rows not in cache:
+            repository = DatabaseManager(str(tmp_path_factory.mktemp(f"db{rows}") / "jobs.db"))
+            repository.init_db()
+            _seed(repository, rows)
+            cache[rows] = repository
+        return cache[rows]
+
+    return build
+
+
+def _seed(repository: DatabaseManager, rows: int) -> None:
+    rng = random.Random(rows)
+    now = datetime.utcnow()
+    with repository.engine.begin() as conn:
+        for start in range(0, rows, SEED_CHUNK):
+            batch = []
+            for index in range(start, min(start + SEED_CHUNK, rows)):
+                source = "linkedin" if index % 2 else "wttj"
+                status = rng.choices(("new", "scored", "notified"), weights=(6, 3, 1))[0]
+                url = f"https://example.com/{source}/seed/{index}"
+                title = "Data Analyst"
+                company = f"Company {index % 5000}"
+                batch.append(
+                    {
+                        "hash": generate_job_hash(url, title, company),
+                        "source": source,
+                        "external_id": str(index),
+                        "url": url,
+                        "title": title,
+                        "company": company,
+                        "location": "Paris",
+                        "contract_type": "CDI",
+                        "description": "Power BI, SQL, DAX et Python. " * 3,
+                        "keyword_score": round(rng.uniform(0, 100), 1),
+                        "status": status,
+                        "detail_status": rng.choice(("pending", "fetched", "fetched", "failed")),
+                        "fetch_priority": round(rng.uniform(0, 100), 1) if source == "linkedin" else None,
+                        "scraped_at": now - timedelta(minutes=rng.randint(0, 60 * 24 * 29)),
+                    }
+                )
+            conn.execute(insert(Job), batch)
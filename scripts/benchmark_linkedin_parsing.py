@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import argparse
+import timeit
+
+from bs4 import BeautifulSoup
+
+from src.scrapers.linkedin_email import LinkedInEmailScraper
+from src.utils.config import project_root
+
+
+FIXTURES = project_root() / "tests" / "fixtures" / "linkedin"
+
+FILLER_BLOCK = """
+<li class="jobs-search__results-list-item">
+  <div class="base-card relative w-full hover:no-underline" data-entity-urn="urn:li:jobPosting:{index}">
+    <a class="base-card__full-link" href="https://fr.linkedin.com/jobs/view/similar-{index}">
+      <span class="sr-only">Data Analyst {index}</span>
+    </a>
+    <div class="base-search-card__info">
+      <h3 class="base-search-card__title">Data Analyst {index}</h3>
+      <h4 class="base-search-card__subtitle"><a href="https://fr.linkedin.com/company/c{index}">Company {index}</a></h4>
+      <div class="base-search-card__metadata"><span class="job-search-card__location">Paris, France</span>
+      <time class="job-search-card__listdate" datetime="2024-03-12">Il y a 1 jour</time></div>
+    </div>
+  </div>
+  <script type="application/json">{{"trackingId": "{index}", "payload": "{padding}"}}</script>
+</li>
+"""
+
+
+def inflate(html: str, target_bytes: int) -> str:
+    blocks = []
+    size = len(html)
+    index = 0
+    while size < target_bytes:
+        block = FILLER_BLOCK.format(index=index, padding="x" * 400)
+        blocks.append(block)
+        size += len(block)
+        index += 1
+    return html.replace("</main>", f"<ul>{''.join(blocks)}</ul></main>")
+
+
+def report(label: str, size: int, seconds: float, baseline: float) -> None:
+    print(f"{label:<34} {size / 1024:>8.0f} KiB {seconds * 1000:>9.2f} ms  x{baseline / seconds:.1f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark LinkedIn alert and job-page parsing")
+    parser.add_argument("--size-kb", type=int, default=1200, help="Inflated job page size in KiB")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    scraper = LinkedInEmailScraper("LinkedIn Jobs", 50, "unused", "unused")
+    job_page = inflate((FIXTURES / "job_page_guest.html").read_text(encoding="utf-8"), args.size_kb * 1024)
+    alert = (FIXTURES / "alert_email_fr.html").read_text(encoding="utf-8")
+
+    cases = [
+        ("job page", job_page, scraper._parse_job_page),
+        ("alert email", alert, scraper._parse_jobs_from_html),
+    ]
+    print(f"{'case':<34} {'size':>12} {'time':>12}  speedup")
+    for label, html, parse in cases:
+        number = 1 if len(html) > 100_000 else 200
+        soup_time = min(timeit.repeat(lambda: BeautifulSoup(html, "lxml"), number=number, repeat=args.repeat))
+        parse_time = min(timeit.repeat(lambda: parse(html), number=number, repeat=args.repeat))
+        soup_time /= number
+        parse_time /= number
+        report(f"{label} (full BeautifulSoup tree)", len(html), soup_time, soup_time)
+        report(f"{label} (lxml XPath)", len(html), parse_time, soup_time)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+
+from src.database.repository import DatabaseManager
+from src.fakes.server import FakeServices, FakeServicesConfig
+from src.main import run_scrape_cycle
+from src.utils.config import load_profile, load_settings
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Measure run_scrape_cycle throughput against the fake services")
+    parser.add_argument("--algolia-pages", type=int, default=10)
+    parser.add_argument("--emails", type=int, default=50)
+    parser.add_argument("--jobs-per-email", type=int, default=10)
+    parser.add_argument("--max-fetches", type=int, default=200)
+    parser.add_argument("--rate-limit-every", type=int, default=0)
+    parser.add_argument("--block-every", type=int, default=0)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    args = parser.parse_args()
+
+    config = FakeServicesConfig(
+        algolia_pages=args.algolia_pages,
+        emails=args.emails,
+        jobs_per_email=args.jobs_per_email,
+        rate_limit_every=args.rate_limit_every,
+        block_every=args.block_every,
+        latency_ms=args.latency_ms,
+    )
+    workdir = Path(tempfile.mkdtemp(prefix="jobhunter-load-"))
+    with FakeServices(config) as services:
+        settings = services.apply_to_settings(load_settings())
+        settings["scraping"]["wttj"]["max_pages"] = args.algolia_pages
+        settings["scraping"]["linkedin"]["max_fetches_per_run"] = args.max_fetches
+        os.environ["GMAIL_TOKEN_PATH"] = str(services.write_gmail_token(workdir / "token.json"))
+        os.environ.setdefault("LINKEDIN_LI_AT_COOKIE", "fake-cookie")
+
+        repository = DatabaseManager(str(workdir / "jobs.db"))
+        repository.init_db()
+        run_id = repository.start_scrape_run("all")
+        started = time.perf_counter()
+        result = run_scrape_cycle(settings, load_profile(), repository, run_id=run_id)
+        elapsed = time.perf_counter() - started
+
+        print(f"{result['jobs_found']} offers, {result['jobs_new']} new in {elapsed:.2f}s "
+              f"({result['jobs_found'] / elapsed:.0f} offers/s)")
+        for row in repository.get_source_runs([run_id]).get(run_id, []):
+            print(f"{row.source:<10} found={row.jobs_found} new={row.jobs_new} "
+                  f"bytes={row.bytes_downloaded} rate_limits={row.rate_limit_events} "
+                  f"stages={row.stage_timings}")
+        print(json.dumps(services.stats()))
+
+
+if __name__ == "__main__":
+    main()
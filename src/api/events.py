@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import asyncio
+import json
+from typing import AsyncIterator, Optional
+
+from starlette.concurrency import run_in_threadpool
+from starlette.requests import Request
+
+
+class JobEventSignal:
+    """Wakes the SSE streams of one event loop when job events are published, from whichever thread publishes them.
+
+    ``version`` changes on every publish of an event id past ``last_id``, so a stream that read it before fetching
+    cannot miss a wake-up that happens while the fetch runs. ``close()`` ends all streams, e.g. when the server starts
+    shutting down.
+    """
+
+    def __init__(self) -> None:
+        self.version = 0
+        self.last_id = 0
+        self.closed = False
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._changed: Optional[asyncio.Event] = None
+
+    def bind(self, loop: asyncio.AbstractEventLoop) -> None:
+        if self._loop is None:
+            self._loop = loop
+            self._changed = asyncio.Event()
+
+    def notify(self, last_id: int) -> None:
+        """Wake the streams for events up to ``last_id``; an id at or below one already announced wakes nobody."""
+        self._call_soon(self._publish, last_id)
+
+    def close(self) -> None:
+        self._call_soon(self._close)
+
+    async def wait(self, seen: int, timeout: float) -> bool:
+        """Wait until ``version`` moves past ``seen`` or the signal closes; False on timeout."""
+        if self.version != seen or self.closed:
+            return True
+        try:
+            await asyncio.wait_for(self._changed.wait(), timeout)
+        except asyncio.TimeoutError:
+            return False
+        return True
+
+    def _call_soon(self, callback, *args) -> None:
+        loop = self._loop
+        if loop is None or loop.is_closed():
+            return
+        try:
+            loop.call_soon_threadsafe(callback, *args)
+        except RuntimeError:  # The loop closed in between.
+            pass
+
+    def _publish(self, last_id: int) -> None:
+        if last_id > self.last_id:
+            self.last_id = last_id
+            self._bump()
+
+    def _bump(self) -> None:
+        self.version += 1
+        self._changed.set()
+        self._changed = asyncio.Event()
+
+    def _close(self) -> None:
+        self.closed = True
+        self._bump()
+
+
+async def job_event_stream(
+    request: Request, repository, signal: JobEventSignal, cursor: int, poll_seconds: float
+) -> AsyncIterator[str]:
+    """Server-Sent Events for the job feed; each event id is the cursor to resume from via ``Last-Event-ID``.
+
+    Idle streams wait on ``signal`` rather than in a worker thread, and end when the client disconnects or the
+    signal is closed.
+    """
+    signal.bind(asyncio.get_running_loop())
+    yield "retry: 5000\n\n"
+    while not signal.closed and not await request.is_disconnected():
+        seen = signal.version
+        events = await run_in_threadpool(repository.get_job_events, cursor)
+        for event in events:
+            cursor = event.id
+            data = json.dumps({"job_id": event.job_id, "keyword_score": event.keyword_score})
+            yield f"id: {event.id}\nevent: job\ndata: {data}\n\n"
+        if events:
+            continue
+        # Only a publish after ``seen`` ends the wait early, so an empty fetch never turns into a busy loop.
+        if not await signal.wait(seen, poll_seconds):
+            yield ": keepalive\n\n"
@@ -0,0 +1,166 @@
+from __future__ import annotations
+
+import hashlib
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Any, Dict, Iterable, Iterator, Optional
+
+import orjson
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.middleware.gzip import GZipMiddleware
+from starlette.responses import Response, StreamingResponse
+
+try:
+    import brotli
+except ImportError:  # Optional: without it clients fall back to gzip.
+    brotli = None
+
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+NDJSON_CHUNK_BYTES = 64 * 1024
+
+
+class OrjsonResponse(Response):
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content)
+
+
+def ndjson_response(rows: Iterable[Dict[str, Any]], **kwargs) -> StreamingResponse:
+    return StreamingResponse(_ndjson_chunks(rows), media_type=NDJSON_MEDIA_TYPE, **kwargs)
+
+
+def _ndjson_chunks(rows: Iterable[Dict[str, Any]]) -> Iterator[bytes]:
+    # Rows are grouped into chunks so a compressing middleware does not flush a tiny block per line.
+    buffer = bytearray()
+    for row in rows:
+        buffer += orjson.dumps(row)
+        buffer += b"\n"
+        if len(buffer) >= NDJSON_CHUNK_BYTES:
+            yield bytes(buffer)
+            buffer.clear()
+    if buffer:
+        yield bytes(buffer)
+
+
+def entity_tag(*parts: Any) -> str:
+    """Weak ETag: bodies differ byte-wise between gzip, brotli and identity encodings."""
+    return f'W/"{hashlib.blake2b(repr(parts).encode("utf-8"), digest_size=12).hexdigest()}"'
+
+
+def validator_headers(etag: str, last_modified: Optional[datetime]) -> Dict[str, str]:
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    # HTTP dates have one-second resolution: announcing the current second could hide a write later in it.
+    if last_modified is not None and last_modified.replace(microsecond=0) < datetime.utcnow().replace(microsecond=0):
+        headers["Last-Modified"] = format_datetime(last_modified.replace(tzinfo=timezone.utc), usegmt=True)
+    return headers
+
+
+def is_not_modified(request_headers: Headers, etag: str, last_modified: Optional[datetime]) -> bool:
+    """RFC 9110 evaluation: If-None-Match wins; If-Modified-Since is only consulted without it."""
+    if_none_match = request_headers.get("if-none-match")
+    if if_none_match is not None:
+        if if_none_match.strip() == "*":
+            return True
+        return _opaque_tag(etag) in {_opaque_tag(tag) for tag in if_none_match.split(",")}
+    if_modified_since = request_headers.get("if-modified-since")
+    if if_modified_since is None or last_modified is None:
+        return False
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+    if since.tzinfo is None:
+        since = since.replace(tzinfo=timezone.utc)
+    return last_modified.replace(tzinfo=timezone.utc, microsecond=0) <= since
+
+
+def _opaque_tag(tag: str) -> str:
+    tag = tag.strip()
+    return tag[2:] if tag.startswith("W/") else tag
+
+
+class CompressionMiddleware:
+    """Starlette's gzip middleware, preferring brotli when the client accepts ``br`` and ``brotli`` is installed."""
+
+    def __init__(self, app, minimum_size: int = 1000, compresslevel: int = 6, brotli_quality: int = 5) -> None:
+        self.app = app
+        self.gzip = GZipMiddleware(app, minimum_size=minimum_size, compresslevel=compresslevel)
+        self.minimum_size = minimum_size
+        self.brotli_quality = brotli_quality
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] == "http" and brotli is not None and _accepts(Headers(scope=scope), "br"):
+            responder = BrotliResponder(self.app, self.minimum_size, self.brotli_quality)
+            await responder(scope, receive, send)
+            return
+        await self.gzip(scope, receive, send)
+
+
+class BrotliResponder:
+    """Compresses one response, streaming bodies chunk by chunk; already-encoded and SSE responses pass through."""
+
+    def __init__(self, app, minimum_size: int, quality: int) -> None:
+        self.app = app
+        self.minimum_size = minimum_size
+        self.quality = quality
+        self.send = None
+        self.initial_message: Dict[str, Any] = {}
+        self.started = False
+        self.passthrough = False
+        self.compressor = None
+
+    async def __call__(self, scope, receive, send) -> None:
+        self.send = send
+        await self.app(scope, receive, self.send_compressed)
+
+    async def send_compressed(self, message) -> None:
+        if message["type"] == "http.response.start":
+            self.initial_message = message
+            headers = Headers(raw=message["headers"])
+            self.passthrough = "content-encoding" in headers or headers.get("content-type", "").startswith(
+                "text/event-stream"
+            )
+            return
+        if message["type"] != "http.response.body":
+            await self.send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+        if not self.started:
+            self.started = True
+            if self.passthrough or (not more_body and len(body) < self.minimum_size):
+                self.passthrough = True
+                await self.send(self.initial_message)
+                await self.send(message)
+                return
+            self.compressor = brotli.Compressor(quality=self.quality)
+            headers = MutableHeaders(raw=self.initial_message["headers"])
+            headers["Content-Encoding"] = "br"
+            headers.add_vary_header("Accept-Encoding")
+            data = self._compress(body, more_body)
+            if more_body:
+                del headers["Content-Length"]
+            else:
+                headers["Content-Length"] = str(len(data))
+            await self.send(self.initial_message)
+            await self.send({"type": "http.response.body", "body": data, "more_body": more_body})
+            return
+        if self.passthrough:
+            await self.send(message)
+            return
+        await self.send({"type": "http.response.body", "body": self._compress(body, more_body), "more_body": more_body})
+
+    def _compress(self, body: bytes, more_body: bool) -> bytes:
+        data = self.compressor.process(body)
+        return data + (self.compressor.flush() if more_body else self.compressor.finish())
+
+
+def _accepts(headers: Headers, encoding: str) -> bool:
+    for item in headers.get("accept-encoding", "").split(","):
+        name, _, params = item.strip().partition(";")
+        if name.strip().lower() == encoding:
+            return params.replace(" ", "") not in ("q=0", "q=0.0")
+    return False
@@ -1,11 +1,35 @@
 from __future__ import annotations
 
-from typing import List, Optional
+import asyncio
+import json
+import uuid
+from contextlib import asynccontextmanager
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
 
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, Header, HTTPException, Query, Request, Response
+from fastapi.responses import PlainTextResponse, StreamingResponse
+from starlette.concurrency import run_in_threadpool
 from pydantic import BaseModel, Field
 
-from ..matcher.ai_scorer import build_scoring_prompt
+from ..matcher.ai_scorer import DEFAULT_DESCRIPTION_TOKENS, PromptCache
+from ..notifier.outbox import NotificationWorker
+from .events import JobEventSignal, job_event_stream
+from .responses import (
+    NDJSON_MEDIA_TYPE,
+    CompressionMiddleware,
+    OrjsonResponse,
+    entity_tag,
+    is_not_modified,
+    ndjson_response,
+    validator_headers,
+)
+from ..utils.metrics import REGISTRY, MetricsMiddleware
+
+
+DEFAULT_LEASE_TTL_SECONDS = 600
+DEFAULT_EVENTS_POLL_SECONDS = 15.0
+DEFAULT_PROMPT_CACHE_SIZE = 2048
 
 
 class JobForScoring(BaseModel):
@@ -20,6 +44,17 @@ class JobForScoring(BaseModel):
     prompt: Optional[str] = None
 
 
+class JobClaim(BaseModel):
+    agent_id: str
+    lease_expires_at: Optional[datetime] = None
+    jobs: List[JobForScoring]
+
+
+class LeaseRelease(BaseModel):
+    agent_id: str
+    job_ids: List[int]
+
+
 class ScoreSubmission(BaseModel):
     job_id: int
     ai_score: float = Field(ge=0, le=100)
@@ -30,64 +65,241 @@ class BulkScoreSubmission(BaseModel):
     scores: List[ScoreSubmission]
 
 
+class ScrapeSourceRun(BaseModel):
+    id: int
+    source: str
+    status: str
+    started_at: Optional[datetime] = None
+    completed_at: Optional[datetime] = None
+    jobs_found: int = 0
+    jobs_new: int = 0
+    jobs_duplicate: int = 0
+    stage_timings: Dict[str, float] = Field(default_factory=dict)
+    bytes_downloaded: int = 0
+    rate_limit_events: int = 0
+    error_message: Optional[str] = None
+
+
+class ScrapeRun(ScrapeSourceRun):
+    sources: List[ScrapeSourceRun] = Field(default_factory=list)
+
+
+def _source_run(row) -> ScrapeSourceRun:
+    return ScrapeSourceRun(
+        id=row.id,
+        source=row.source,
+        status=row.status,
+        started_at=row.started_at,
+        completed_at=row.completed_at,
+        jobs_found=row.jobs_found or 0,
+        jobs_new=row.jobs_new or 0,
+        jobs_duplicate=row.jobs_duplicate or 0,
+        stage_timings=json.loads(row.stage_timings) if row.stage_timings else {},
+        bytes_downloaded=row.bytes_downloaded or 0,
+        rate_limit_events=row.rate_limit_events or 0,
+        error_message=row.error_message,
+    )
+
+
+def _scrape_run(row, sources) -> ScrapeRun:
+    return ScrapeRun(**_source_run(row).model_dump(), sources=[_source_run(source) for source in sources])
+
+
+def _parse_fields(fields: Optional[str]) -> Optional[Tuple[str, ...]]:
+    if not fields:
+        return None
+    requested = tuple(dict.fromkeys(name.strip() for name in fields.split(",") if name.strip()))
+    unknown = [name for name in requested if name not in JobForScoring.model_fields]
+    if unknown:
+        raise HTTPException(status_code=422, detail=f"Unknown fields: {', '.join(unknown)}")
+    return requested
+
+
+def _job_payload(
+    job, profile: dict, prompts: Optional[PromptCache], fields: Optional[Tuple[str, ...]]
+) -> Dict[str, Any]:
+    """Plain-dict form of ``JobForScoring``, projected to ``fields`` when given, for direct orjson encoding."""
+    payload = {
+        "id": job.id,
+        "title": job.title,
+        "company": job.company,
+        "location": job.location,
+        "contract_type": job.contract_type,
+        "description": job.description or "",
+        "keyword_score": job.keyword_score or 0.0,
+        "url": job.url,
+        "prompt": prompts.get(job, profile) if prompts is not None else None,
+    }
+    if fields is None:
+        return payload
+    return {name: payload[name] for name in fields}
+
+
 def create_app(settings: dict, profile: dict, repository, notifier, scrape_callable=None) -> FastAPI:
-    app = FastAPI(title="Job Hunter API", version="1.0.0")
+    @asynccontextmanager
+    async def lifespan(app: FastAPI):
+        app.state.job_events.bind(asyncio.get_running_loop())
+        outbox = app.state.outbox
+        if outbox is not None:
+            outbox.start()
+        try:
+            yield
+        finally:
+            app.state.job_events.close()
+            if repository is not None:
+                repository.unsubscribe_job_events(app.state.job_events.notify)
+            if outbox is not None:
+                outbox.stop(timeout=10)
+
+    app = FastAPI(title="Job Hunter API", version="1.0.0", lifespan=lifespan)
     app.state.settings = settings
     app.state.profile = profile
     app.state.repository = repository
     app.state.notifier = notifier
     app.state.scrape_callable = scrape_callable
+    app.state.job_events = JobEventSignal()
+    if repository is not None:
+        repository.subscribe_job_events(app.state.job_events.notify)
+    # Score submissions only enqueue notifications; this worker delivers them outside the request.
+    app.state.outbox = (
+        NotificationWorker.from_settings(settings, repository, notifier)
+        if repository is not None and notifier is not None and notifier.enabled
+        else None
+    )
+    # Part of every ETag, so validators handed out before a restart (possibly with another profile) never match.
+    app.state.instance_id = uuid.uuid4().hex
+    app.state.prompt_cache = PromptCache(
+        settings.get("api", {}).get("prompt_cache_size", DEFAULT_PROMPT_CACHE_SIZE),
+        frequencies=repository.get_shingle_frequencies if repository is not None else None,
+        description_tokens=settings.get("scoring", {}).get("prompt_description_tokens", DEFAULT_DESCRIPTION_TOKENS),
+    )
+    app.add_middleware(CompressionMiddleware)
+    app.add_middleware(MetricsMiddleware)
+
+    def prompt_cache(include_prompt: bool, fields: Optional[Tuple[str, ...]]) -> Optional[PromptCache]:
+        wanted = include_prompt if fields is None else "prompt" in fields
+        return app.state.prompt_cache if wanted else None
+
+    def validators(request: Request, *variant, lease_sensitive: bool = False) -> Tuple[Dict[str, str], bool]:
+        """Validator headers for the current DB generation, and whether the client's cached copy is still fresh."""
+        generation, last_modified = app.state.repository.get_generation()
+        watermark = app.state.repository.get_lease_watermark() if lease_sensitive else None
+        if watermark is not None and (last_modified is None or watermark > last_modified):
+            last_modified = watermark
+        etag = entity_tag(app.state.instance_id, generation, watermark, request.url.path, *variant)
+        return validator_headers(etag, last_modified), is_not_modified(request.headers, etag, last_modified)
 
     @app.get("/api/jobs/pending", response_model=List[JobForScoring])
-    def get_pending_jobs(limit: int = 50, include_prompt: bool = False):
+    def get_pending_jobs(
+        request: Request,
+        limit: int = 50,
+        include_prompt: bool = False,
+        fields: Optional[str] = None,
+        response_format: Optional[str] = Query(None, alias="format", pattern="^(json|ndjson)$"),
+        accept: Optional[str] = Header(None),
+    ):
+        projection = _parse_fields(fields)
+        ndjson = response_format == "ndjson" or (response_format is None and NDJSON_MEDIA_TYPE in (accept or ""))
+        # Expired leases put jobs back in the pool without a write, hence the lease watermark in the validator.
+        headers, fresh = validators(request, limit, include_prompt, projection, ndjson, lease_sensitive=True)
+        if fresh:
+            return Response(status_code=304, headers=headers)
         threshold = app.state.settings["scoring"]["keyword_prefilter_threshold"]
         jobs = app.state.repository.get_pending_jobs(threshold, limit=limit)
-        results: List[JobForScoring] = []
-        for job in jobs:
-            prompt = build_scoring_prompt(job, app.state.profile) if include_prompt else None
-            results.append(
-                JobForScoring(
-                    id=job.id,
-                    title=job.title,
-                    company=job.company,
-                    location=job.location,
-                    contract_type=job.contract_type,
-                    description=job.description or "",
-                    keyword_score=job.keyword_score or 0.0,
-                    url=job.url,
-                    prompt=prompt,
-                )
-            )
-        return results
+        prompts = prompt_cache(include_prompt, projection)
+        rows = (_job_payload(job, app.state.profile, prompts, projection) for job in jobs)
+        if ndjson:
+            return ndjson_response(rows, headers=headers)
+        return OrjsonResponse(list(rows), headers=headers)
+
+    @app.post("/api/jobs/claim", response_model=JobClaim)
+    def claim_jobs(
+        agent_id: str,
+        n: int = Query(10, ge=1, le=200),
+        ttl_seconds: Optional[int] = Query(None, ge=1),
+        include_prompt: bool = False,
+        fields: Optional[str] = None,
+    ):
+        projection = _parse_fields(fields)
+        threshold = app.state.settings["scoring"]["keyword_prefilter_threshold"]
+        ttl = ttl_seconds or app.state.settings.get("api", {}).get("lease_ttl_seconds", DEFAULT_LEASE_TTL_SECONDS)
+        jobs = app.state.repository.claim_jobs(agent_id, threshold, limit=n, ttl_seconds=ttl)
+        prompts = prompt_cache(include_prompt, projection)
+        return OrjsonResponse(
+            {
+                "agent_id": agent_id,
+                "lease_expires_at": jobs[0].lease_expires_at if jobs else None,
+                "jobs": [_job_payload(job, app.state.profile, prompts, projection) for job in jobs],
+            }
+        )
+
+    @app.post("/api/jobs/release")
+    def release_jobs(release: LeaseRelease):
+        return {"released": app.state.repository.release_jobs(release.job_ids, agent_id=release.agent_id)}
+
+    @app.get("/api/jobs/events")
+    async def stream_job_events(
+        request: Request,
+        cursor: Optional[int] = Query(None, ge=0),
+        last_event_id: Optional[int] = Header(None, ge=0),
+    ):
+        resume_from = cursor if cursor is not None else last_event_id
+        if resume_from is None:
+            resume_from = await run_in_threadpool(app.state.repository.latest_job_event_id)
+        poll_seconds = app.state.settings.get("api", {}).get("events_poll_seconds", DEFAULT_EVENTS_POLL_SECONDS)
+        return StreamingResponse(
+            job_event_stream(request, app.state.repository, app.state.job_events, resume_from, poll_seconds),
+            media_type="text/event-stream",
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        )
 
     @app.post("/api/jobs/scores")
     def submit_scores(submission: BulkScoreSubmission):
         weights = app.state.settings["scoring"]["weights"]
+        threshold = app.state.settings["scoring"]["ai_scoring_threshold"]
+        outbox = app.state.outbox
         updated_jobs = app.state.repository.update_ai_scores(
-            [score.model_dump() for score in submission.scores], weights
+            [score.model_dump() for score in submission.scores],
+            weights,
+            notify_threshold=threshold if outbox is not None else None,
         )
-        threshold = app.state.settings["scoring"]["ai_scoring_threshold"]
-        jobs_to_notify = [
-            job for job in updated_jobs if job.final_score is not None and job.final_score >= threshold
-        ]
-        if jobs_to_notify:
-            jobs_by_source = {}
-            for job in jobs_to_notify:
-                jobs_by_source.setdefault(job.source, []).append(job)
-            if app.state.notifier.send_daily_recap(jobs_by_source):
-                for job in jobs_to_notify:
-                    app.state.repository.mark_notified(job.id)
+        if outbox is not None and any(
+            job.final_score is not None and job.final_score >= threshold for job in updated_jobs
+        ):
+            outbox.wake()
         return {"updated": len(updated_jobs)}
 
     @app.get("/api/stats")
-    def get_stats():
-        return app.state.repository.get_stats()
+    def get_stats(request: Request):
+        headers, fresh = validators(request)
+        if fresh:
+            return Response(status_code=304, headers=headers)
+        return OrjsonResponse(app.state.repository.get_stats(), headers=headers)
 
-    @app.post("/api/trigger-scrape")
+    @app.post("/api/trigger-scrape", status_code=202)
     def trigger_scrape():
         if not app.state.scrape_callable:
             raise HTTPException(status_code=503, detail="Scrape trigger not configured")
-        app.state.scrape_callable()
-        return {"status": "started"}
+        run_id, started = app.state.scrape_callable()
+        if run_id is None:
+            raise HTTPException(status_code=409, detail="A scrape run is already starting")
+        return {"status": "started" if started else "already_running", "run_id": run_id}
+
+    @app.get("/api/scrape-runs", response_model=List[ScrapeRun])
+    def list_scrape_runs(limit: int = 20):
+        runs = app.state.repository.get_scrape_runs(limit=limit)
+        sources = app.state.repository.get_source_runs([run.id for run in runs])
+        return [_scrape_run(run, sources.get(run.id, [])) for run in runs]
+
+    @app.get("/api/scrape-runs/{run_id}", response_model=ScrapeRun)
+    def get_scrape_run(run_id: int):
+        run = app.state.repository.get_scrape_run(run_id)
+        if run is None:
+            raise HTTPException(status_code=404, detail="Scrape run not found")
+        return _scrape_run(run, app.state.repository.get_source_runs([run.id]).get(run.id, []))
+
+    @app.get("/metrics", response_class=PlainTextResponse, include_in_schema=False)
+    def metrics():
+        return PlainTextResponse(REGISTRY.render(), media_type="text/plain; version=0.0.4; charset=utf-8")
 
     return app
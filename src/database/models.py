@@ -12,6 +12,7 @@ class Job(Base):
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     hash = Column(String, unique=True, nullable=False)
+    content_fingerprint = Column(String, index=True)
 
     source = Column(String, nullable=False)
     external_id = Column(String)
@@ -29,9 +30,13 @@ class Job(Base):
     ai_score = Column(Float)
     final_score = Column(Float)
     ai_reasoning = Column(Text)
+    ai_score_reused_from = Column(Integer)
 
     status = Column(String, default="new")
     detail_status = Column(String, default="pending")
+    fetch_priority = Column(Float)
+    leased_by = Column(String)
+    lease_expires_at = Column(DateTime, index=True)
     scraped_at = Column(DateTime, server_default=func.now())
     scored_at = Column(DateTime)
     notified_at = Column(DateTime)
@@ -44,11 +49,75 @@ class ScrapeLog(Base):
     __tablename__ = "scrape_logs"
 
     id = Column(Integer, primary_key=True, autoincrement=True)
+    run_id = Column(Integer, index=True)
     source = Column(String, nullable=False)
     started_at = Column(DateTime, nullable=False, server_default=func.now())
     completed_at = Column(DateTime)
     jobs_found = Column(Integer, default=0)
     jobs_new = Column(Integer, default=0)
     jobs_duplicate = Column(Integer, default=0)
+    stage_timings = Column(Text)
+    bytes_downloaded = Column(Integer, default=0)
+    rate_limit_events = Column(Integer, default=0)
     error_message = Column(Text)
     status = Column(String, default="running")
+
+
+class JobEvent(Base):
+    """Append-only feed of jobs that passed the keyword pre-filter; ``id`` is the resume cursor."""
+
+    __tablename__ = "job_events"
+    # Ids are resume cursors: without AUTOINCREMENT SQLite may hand out the ids of deleted rows again.
+    __table_args__ = {"sqlite_autoincrement": True}
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    job_id = Column(Integer, nullable=False)
+    keyword_score = Column(Float)
+    created_at = Column(DateTime, server_default=func.now())
+
+
+class NotificationOutbox(Base):
+    """Jobs awaiting their Discord notification; a row is deleted in the transaction that marks its job notified."""
+
+    __tablename__ = "notification_outbox"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    job_id = Column(Integer, nullable=False, unique=True)
+    attempts = Column(Integer, nullable=False, default=0)
+    next_attempt_at = Column(DateTime, nullable=False, index=True)
+    created_at = Column(DateTime, server_default=func.now())
+
+
+class ShingleScope(Base):
+    """Number of descriptions recorded per boilerplate scope (a normalized company name, or ``*`` for all)."""
+
+    __tablename__ = "shingle_scopes"
+
+    scope = Column(String, primary_key=True)
+    documents = Column(Integer, nullable=False, default=0)
+
+
+class ShingleCount(Base):
+    __tablename__ = "shingle_counts"
+
+    scope = Column(String, primary_key=True)
+    shingle = Column(Integer, primary_key=True)
+    documents = Column(Integer, nullable=False, default=0)
+
+
+class ShingleDocument(Base):
+    """One description counted in the shingle tables, so duplicates are skipped and deleted jobs can be uncounted."""
+
+    __tablename__ = "shingle_documents"
+
+    fingerprint = Column(String, primary_key=True)
+    scope = Column(String, nullable=False)
+    shingles = Column(Text, nullable=False)
+
+
+class SyncState(Base):
+    __tablename__ = "sync_state"
+
+    key = Column(String, primary_key=True)
+    value = Column(Text)
+    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
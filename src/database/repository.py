@@ -1,41 +1,139 @@
 from __future__ import annotations
 
+import json
 from contextlib import contextmanager
 from datetime import datetime, timedelta
-from typing import Iterator, List, Optional, Tuple
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
 
 from pathlib import Path
 
-from sqlalchemy import create_engine, inspect, select, text, or_
+from sqlalchemy import Select, bindparam, create_engine, event, func, inspect, select, text, or_, update
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session, sessionmaker
 
-from .models import Base, Job
+from .models import (
+    Base,
+    Job,
+    JobEvent,
+    NotificationOutbox,
+    ScrapeLog,
+    ShingleCount,
+    ShingleDocument,
+    ShingleScope,
+    SyncState,
+)
+from ..matcher.compaction import CORPUS_SCOPE, ShingleFrequencies, company_scope, description_shingles
 from ..scrapers.base_scraper import JobOffer
-from ..utils.deduplication import generate_job_hash
+from ..utils.deduplication import generate_content_fingerprint, generate_job_hash
+from ..utils.metrics import instrument_methods
 
 
+JOB_COLUMN_MIGRATIONS = {
+    "detail_status": "TEXT DEFAULT 'pending'",
+    "fetch_priority": "FLOAT",
+    "leased_by": "TEXT",
+    "lease_expires_at": "DATETIME",
+    "content_fingerprint": "TEXT",
+    "ai_score_reused_from": "INTEGER",
+}
+
+SCRAPE_LOG_COLUMN_MIGRATIONS = {
+    "run_id": "INTEGER",
+    "stage_timings": "TEXT",
+    "bytes_downloaded": "INTEGER DEFAULT 0",
+    "rate_limit_events": "INTEGER DEFAULT 0",
+}
+
+# SyncState row bumped by every committed write; read-heavy endpoints use it as a cheap change detector.
+GENERATION_KEY = "db_generation"
+
+COLUMN_MIGRATIONS = {
+    "jobs": JOB_COLUMN_MIGRATIONS,
+    "scrape_logs": SCRAPE_LOG_COLUMN_MIGRATIONS,
+}
+
+
+@instrument_methods(exclude=("init_db", "session_scope", "subscribe_job_events", "unsubscribe_job_events"))
 class DatabaseManager:
     def __init__(self, db_path: str) -> None:
         path = Path(db_path).resolve()
         self.engine = create_engine(f"sqlite:///{path.as_posix()}", future=True)
         self.SessionLocal = sessionmaker(bind=self.engine, expire_on_commit=False)
+        self._job_event_listeners: List[Callable[[int], None]] = []
+        event.listen(self.SessionLocal, "after_flush", _mark_write)
+        event.listen(self.SessionLocal, "do_orm_execute", _mark_bulk_write)
 
     def init_db(self) -> None:
+        untracked_shingles = not inspect(self.engine).has_table(ShingleDocument.__tablename__)
         Base.metadata.create_all(self.engine)
+        if untracked_shingles:
+            # Counts recorded before documents were tracked can never be uncounted: start them over.
+            with self.engine.begin() as conn:
+                conn.execute(ShingleCount.__table__.delete())
+                conn.execute(ShingleScope.__table__.delete())
+        self._ensure_job_events_autoincrement()
         inspector = inspect(self.engine)
-        if "jobs" in inspector.get_table_names():
-            columns = [col["name"] for col in inspector.get_columns("jobs")]
-            if "detail_status" not in columns:
+        tables = inspector.get_table_names()
+        added: Dict[str, List[str]] = {}
+        for table, migrations in COLUMN_MIGRATIONS.items():
+            if table not in tables:
+                continue
+            columns = [col["name"] for col in inspector.get_columns(table)]
+            missing = {name: ddl for name, ddl in migrations.items() if name not in columns}
+            if missing:
                 with self.engine.connect() as conn:
-                    conn.execute(text("ALTER TABLE jobs ADD COLUMN detail_status TEXT DEFAULT 'pending'"))
+                    for name, ddl in missing.items():
+                        conn.execute(text(f"ALTER TABLE {table} ADD COLUMN {name} {ddl}"))
                     conn.commit()
+                added[table] = list(missing)
+            for index in Base.metadata.tables[table].indexes:
+                index.create(self.engine, checkfirst=True)
+        if "content_fingerprint" in added.get("jobs", []):
+            self._backfill_content_fingerprints()
+        with self.engine.begin() as conn:
+            conn.execute(
+                text("INSERT OR IGNORE INTO sync_state (key, value, updated_at) VALUES (:key, '0', :now)"),
+                {"key": GENERATION_KEY, "now": datetime.utcnow()},
+            )
+
+    def _ensure_job_events_autoincrement(self) -> None:
+        # Tables created before ``sqlite_autoincrement`` was set are rebuilt once, keeping their ids.
+        with self.engine.begin() as conn:
+            ddl = conn.execute(
+                text("SELECT sql FROM sqlite_master WHERE type = 'table' AND name = 'job_events'")
+            ).scalar()
+            if ddl is None or "AUTOINCREMENT" in ddl.upper():
+                return
+            conn.execute(text("ALTER TABLE job_events RENAME TO job_events_old"))
+            JobEvent.__table__.create(conn)
+            conn.execute(
+                text(
+                    "INSERT INTO job_events (id, job_id, keyword_score, created_at) "
+                    "SELECT id, job_id, keyword_score, created_at FROM job_events_old"
+                )
+            )
+            conn.execute(text("DROP TABLE job_events_old"))
+
+    def _backfill_content_fingerprints(self) -> None:
+        # Only AI-scored jobs can donate a score, so they are the only rows worth fingerprinting up front.
+        with self.session_scope() as session:
+            for job in session.execute(select(Job).where(Job.ai_score.is_not(None))).scalars():
+                job.content_fingerprint = generate_content_fingerprint(job.title, job.company, job.description)
 
     @contextmanager
     def session_scope(self) -> Iterator[Session]:
         session = self.SessionLocal()
         try:
             yield session
+            session.flush()
+            if session.info.pop("writes", False):
+                session.execute(
+                    text(
+                        "UPDATE sync_state SET value = CAST(value AS INTEGER) + 1, updated_at = :now WHERE key = :key"
+                    ),
+                    {"key": GENERATION_KEY, "now": datetime.utcnow()},
+                )
             session.commit()
         except Exception:
             session.rollback()
@@ -45,25 +143,8 @@ class DatabaseManager:
 
     def add_job_offer(self, offer: JobOffer) -> Tuple[Optional[Job], bool]:
         job_hash = generate_job_hash(offer.url, offer.title, offer.company)
-        detail_status = offer.detail_status
-        if not detail_status:
-            detail_status = "fetched" if offer.source != "linkedin" else "pending"
         with self.session_scope() as session:
-            job = Job(
-                hash=job_hash,
-                source=offer.source,
-                external_id=offer.external_id,
-                url=offer.url,
-                title=offer.title,
-                company=offer.company,
-                location=offer.location,
-                contract_type=offer.contract_type,
-                salary_min=offer.salary_min,
-                salary_max=offer.salary_max,
-                description=offer.description,
-                detail_status=detail_status,
-                scraped_at=offer.scraped_at,
-            )
+            job = self._new_job(offer, job_hash)
             session.add(job)
             try:
                 session.flush()
@@ -73,11 +154,110 @@ class DatabaseManager:
                 existing = session.execute(select(Job).where(Job.hash == job_hash)).scalar_one_or_none()
                 return existing, False
 
-    def update_keyword_score(self, job_id: int, score: float) -> None:
+    def add_job_offers(self, offers: List[JobOffer]) -> List[Tuple[Optional[Job], bool]]:
+        hashes = [generate_job_hash(offer.url, offer.title, offer.company) for offer in offers]
+        try:
+            with self.session_scope() as session:
+                known = {
+                    job.hash: job
+                    for job in session.execute(select(Job).where(Job.hash.in_(set(hashes)))).scalars()
+                }
+                results: List[Tuple[Optional[Job], bool]] = []
+                for offer, job_hash in zip(offers, hashes):
+                    if job_hash in known:
+                        results.append((known[job_hash], False))
+                        continue
+                    job = self._new_job(offer, job_hash)
+                    session.add(job)
+                    known[job_hash] = job
+                    results.append((job, True))
+                session.flush()
+            return results
+        except IntegrityError:
+            return [self.add_job_offer(offer) for offer in offers]
+
+    def _new_job(self, offer: JobOffer, job_hash: str) -> Job:
+        detail_status = offer.detail_status
+        if not detail_status:
+            detail_status = "fetched" if offer.source != "linkedin" else "pending"
+        return Job(
+            hash=job_hash,
+            content_fingerprint=generate_content_fingerprint(offer.title, offer.company, offer.description),
+            source=offer.source,
+            external_id=offer.external_id,
+            url=offer.url,
+            title=offer.title,
+            company=offer.company,
+            location=offer.location,
+            contract_type=offer.contract_type,
+            salary_min=offer.salary_min,
+            salary_max=offer.salary_max,
+            description=offer.description,
+            detail_status=detail_status,
+            scraped_at=offer.scraped_at,
+        )
+
+    def update_keyword_scores(self, scores: Dict[int, float], publish_threshold: Optional[float] = None) -> None:
+        """Store keyword scores; those at or above ``publish_threshold`` are also appended to the job event feed."""
+        if not scores:
+            return
         with self.session_scope() as session:
-            job = session.get(Job, job_id)
-            if job:
-                job.keyword_score = score
+            waiting: Dict[int, float] = {}
+            for job in session.execute(select(Job).where(Job.id.in_(list(scores)))).scalars():
+                job.keyword_score = scores[job.id]
+                if job.status == "new":
+                    waiting[job.id] = scores[job.id]
+            published = self._publish_job_events(session, waiting, publish_threshold)
+        self._signal_job_events(published)
+
+    def update_fetch_priorities(self, priorities: Dict[int, float]) -> None:
+        if not priorities:
+            return
+        with self.session_scope() as session:
+            for job in session.execute(select(Job).where(Job.id.in_(list(priorities)))).scalars():
+                job.fetch_priority = priorities[job.id]
+
+    def get_job_events(self, after_id: int, limit: int = 100) -> List[JobEvent]:
+        with self.session_scope() as session:
+            stmt = select(JobEvent).where(JobEvent.id > after_id).order_by(JobEvent.id).limit(limit)
+            return list(session.execute(stmt).scalars())
+
+    def latest_job_event_id(self) -> int:
+        with self.session_scope() as session:
+            return session.execute(select(func.max(JobEvent.id))).scalar() or 0
+
+    def subscribe_job_events(self, listener: Callable[[int], None]) -> None:
+        """Call ``listener`` with the last event id whenever this process publishes job events.
+
+        Listeners run on the publishing thread and must not block. Events written by another process (a cron scrape)
+        are not signalled; subscribers still have to poll for them.
+        """
+        self._job_event_listeners.append(listener)
+
+    def unsubscribe_job_events(self, listener: Callable[[int], None]) -> None:
+        if listener in self._job_event_listeners:
+            self._job_event_listeners.remove(listener)
+
+    @staticmethod
+    def _publish_job_events(session: Session, scores: Dict[int, float], threshold: Optional[float]) -> int:
+        if threshold is None:
+            return 0
+        events = [
+            JobEvent(job_id=job_id, keyword_score=score)
+            for job_id, score in sorted(scores.items())
+            if score >= threshold
+        ]
+        if not events:
+            return 0
+        session.add_all(events)
+        session.flush()
+        return events[-1].id
+
+    def _signal_job_events(self, last_id: int) -> None:
+        if not last_id:
+            return
+        for listener in list(self._job_event_listeners):
+            listener(last_id)
 
     def update_job_details(self, job_id: int, offer: JobOffer) -> None:
         with self.session_scope() as session:
@@ -96,33 +276,77 @@ class DatabaseManager:
                 job.location = offer.location
             if offer.detail_status:
                 job.detail_status = offer.detail_status
+            job.content_fingerprint = generate_content_fingerprint(job.title, job.company, job.description)
+
+    def get_job_by_hash(self, job_hash: str) -> Optional[Job]:
+        with self.session_scope() as session:
+            return session.execute(select(Job).where(Job.hash == job_hash)).scalar_one_or_none()
 
     def get_pending_jobs(self, keyword_threshold: float, limit: int = 50) -> List[Job]:
         with self.session_scope() as session:
-            stmt = (
-                select(Job)
-                .where(Job.status == "new")
-                .where(Job.keyword_score.is_not(None))
-                .where(Job.keyword_score >= keyword_threshold)
-                .where(or_(Job.source != "linkedin", Job.detail_status == "fetched"))
-                .order_by(Job.keyword_score.desc())
-                .limit(limit)
-            )
+            stmt = self._pending_jobs_stmt(keyword_threshold, datetime.utcnow()).limit(limit)
+            return list(session.execute(stmt).scalars())
+
+    def claim_jobs(self, agent_id: str, keyword_threshold: float, limit: int, ttl_seconds: int) -> List[Job]:
+        """Lease up to ``limit`` pending jobs to ``agent_id``; a single UPDATE keeps concurrent claims disjoint."""
+        now = datetime.utcnow()
+        candidates = self._pending_jobs_stmt(keyword_threshold, now).with_only_columns(Job.id).limit(limit)
+        with self.session_scope() as session:
+            claimed = session.execute(
+                update(Job)
+                .where(Job.id.in_(candidates.scalar_subquery()))
+                .values(leased_by=agent_id, lease_expires_at=now + timedelta(seconds=ttl_seconds))
+                .returning(Job.id)
+                .execution_options(synchronize_session=False)
+            ).scalars().all()
+            if not claimed:
+                return []
+            stmt = select(Job).where(Job.id.in_(claimed)).order_by(Job.keyword_score.desc())
             return list(session.execute(stmt).scalars())
 
-    def get_pending_linkedin_jobs(self, limit: int = 50) -> List[Job]:
+    def release_jobs(self, job_ids: List[int], agent_id: Optional[str] = None) -> int:
+        if not job_ids:
+            return 0
+        with self.session_scope() as session:
+            stmt = update(Job).where(Job.id.in_(job_ids)).where(Job.leased_by.is_not(None))
+            if agent_id is not None:
+                stmt = stmt.where(Job.leased_by == agent_id)
+            result = session.execute(
+                stmt.values(leased_by=None, lease_expires_at=None).execution_options(synchronize_session=False)
+            )
+            return result.rowcount
+
+    @staticmethod
+    def _pending_jobs_stmt(keyword_threshold: float, now: datetime) -> Select:
+        return (
+            select(Job)
+            .where(Job.status == "new")
+            .where(Job.keyword_score.is_not(None))
+            .where(Job.keyword_score >= keyword_threshold)
+            .where(or_(Job.source != "linkedin", Job.detail_status == "fetched"))
+            # COALESCE keeps SQLite from answering this through the lease index as a MULTI-INDEX OR.
+            .where(func.coalesce(Job.lease_expires_at, datetime.min) <= now)
+            .order_by(Job.keyword_score.desc())
+        )
+
+    def get_pending_linkedin_jobs(self, limit: int = 50, decay_per_day: float = 0.0) -> List[Job]:
+        age_days = func.julianday("now") - func.julianday(Job.scraped_at)
+        effective_priority = func.coalesce(Job.fetch_priority, 0.0) - func.max(age_days, 0.0) * decay_per_day
         with self.session_scope() as session:
             stmt = (
                 select(Job)
                 .where(Job.source == "linkedin")
                 .where(Job.status == "new")
                 .where(Job.detail_status == "pending")
-                .order_by(Job.scraped_at.asc())
+                .order_by(effective_priority.desc(), Job.scraped_at.asc())
                 .limit(limit)
             )
             return list(session.execute(stmt).scalars())
 
-    def update_ai_scores(self, scores: List[dict], weights: dict) -> List[Job]:
+    def update_ai_scores(
+        self, scores: List[dict], weights: dict, notify_threshold: Optional[float] = None
+    ) -> List[Job]:
+        """Store AI scores; jobs reaching ``notify_threshold`` are queued in the notification outbox atomically."""
         updated_jobs: List[Job] = []
         with self.session_scope() as session:
             for item in scores:
@@ -132,17 +356,145 @@ class DatabaseManager:
                 ai_score = float(item["ai_score"])
                 job.ai_score = ai_score
                 job.ai_reasoning = item.get("reasoning")
-                keyword_score = job.keyword_score or 0.0
-                job.final_score = round(
-                    (weights.get("keyword_score", 0.0) * keyword_score)
-                    + (weights.get("ai_score", 1.0) * ai_score),
-                    2,
-                )
-                job.status = "scored"
+                job.final_score = self._final_score(job.keyword_score, ai_score, weights)
+                # A re-scored job that was already notified keeps that status instead of being announced twice.
+                job.status = "notified" if job.notified_at else "scored"
                 job.scored_at = datetime.utcnow()
+                job.leased_by = None
+                job.lease_expires_at = None
                 updated_jobs.append(job)
+            if notify_threshold is not None:
+                self._enqueue_notifications(
+                    session,
+                    [
+                        job.id
+                        for job in updated_jobs
+                        if job.final_score is not None and job.final_score >= notify_threshold and not job.notified_at
+                    ],
+                )
         return updated_jobs
 
+    @staticmethod
+    def _enqueue_notifications(session: Session, job_ids: List[int]) -> None:
+        if not job_ids:
+            return
+        now = datetime.utcnow()
+        session.execute(
+            sqlite_insert(NotificationOutbox)
+            .values([{"job_id": job_id, "attempts": 0, "next_attempt_at": now} for job_id in job_ids])
+            .on_conflict_do_nothing(index_elements=["job_id"])
+        )
+
+    def get_due_notifications(self, limit: int, now: Optional[datetime] = None) -> List[Job]:
+        """Outbox jobs whose next delivery attempt is due, oldest first."""
+        now = now or datetime.utcnow()
+        with self.session_scope() as session:
+            return list(
+                session.execute(
+                    select(Job)
+                    .join(NotificationOutbox, NotificationOutbox.job_id == Job.id)
+                    .where(NotificationOutbox.next_attempt_at <= now)
+                    .order_by(NotificationOutbox.id)
+                    .limit(limit)
+                ).scalars()
+            )
+
+    def complete_notifications(self, job_ids: List[int]) -> None:
+        """Record confirmed deliveries: the jobs become ``notified`` and leave the outbox in one transaction."""
+        if not job_ids:
+            return
+        with self.session_scope() as session:
+            session.execute(
+                update(Job).where(Job.id.in_(job_ids)).values(status="notified", notified_at=datetime.utcnow())
+            )
+            session.query(NotificationOutbox).filter(NotificationOutbox.job_id.in_(job_ids)).delete(
+                synchronize_session=False
+            )
+
+    def defer_notifications(self, job_ids: List[int], base_delay: float, max_delay: float) -> None:
+        """Reschedule failed deliveries with exponential backoff on each row's attempt count."""
+        if not job_ids:
+            return
+        now = datetime.utcnow()
+        with self.session_scope() as session:
+            for row in session.execute(
+                select(NotificationOutbox).where(NotificationOutbox.job_id.in_(job_ids))
+            ).scalars():
+                delay = min(base_delay * 2**row.attempts, max_delay)
+                row.attempts += 1
+                row.next_attempt_at = now + timedelta(seconds=delay)
+
+    def count_pending_notifications(self) -> int:
+        with self.session_scope() as session:
+            return session.query(NotificationOutbox).count()
+
+    def reuse_ai_scores(
+        self,
+        scores: Dict[int, float],
+        max_age_days: float,
+        weights: dict,
+        notify_threshold: Optional[float] = None,
+    ) -> List[Job]:
+        """Give new jobs the AI score of a recently scored offer with the same content fingerprint.
+
+        ``scores`` maps job ids to their fresh keyword scores. Reused jobs keep the donor's ``scored_at``, so chains
+        of reposts cannot stretch a score past ``max_age_days``. A repost of an offer that was already announced is
+        stored as ``notified`` so it is not announced twice; otherwise it is ``scored`` and, like
+        :meth:`update_ai_scores`, queued in the notification outbox when it reaches ``notify_threshold``.
+        """
+        if not scores:
+            return []
+        cutoff = datetime.utcnow() - timedelta(days=max_age_days)
+        with self.session_scope() as session:
+            jobs = session.execute(
+                select(Job)
+                .where(Job.id.in_(list(scores)))
+                .where(Job.status == "new")
+                .where(Job.content_fingerprint.is_not(None))
+            ).scalars().all()
+            if not jobs:
+                return []
+            donors: Dict[str, Job] = {}
+            stmt = (
+                select(Job)
+                .where(Job.content_fingerprint.in_({job.content_fingerprint for job in jobs}))
+                .where(Job.ai_score.is_not(None))
+                .where(Job.scored_at >= cutoff)
+                .order_by(Job.scored_at.asc())
+            )
+            for donor in session.execute(stmt).scalars():
+                donors[donor.content_fingerprint] = donor
+            reused: List[Job] = []
+            for job in jobs:
+                donor = donors.get(job.content_fingerprint)
+                if donor is None or donor.id == job.id:
+                    continue
+                job.keyword_score = scores[job.id]
+                job.ai_score = donor.ai_score
+                job.ai_reasoning = donor.ai_reasoning
+                job.final_score = self._final_score(job.keyword_score, donor.ai_score, weights)
+                job.ai_score_reused_from = donor.ai_score_reused_from or donor.id
+                job.scored_at = donor.scored_at
+                if donor.notified_at:
+                    job.status = "notified"
+                    job.notified_at = donor.notified_at
+                else:
+                    job.status = "scored"
+                reused.append(job)
+            if notify_threshold is not None:
+                self._enqueue_notifications(
+                    session,
+                    [job.id for job in reused if job.status == "scored" and job.final_score >= notify_threshold],
+                )
+            return reused
+
+    @staticmethod
+    def _final_score(keyword_score: Optional[float], ai_score: float, weights: dict) -> float:
+        return round(
+            (weights.get("keyword_score", 0.0) * (keyword_score or 0.0)) + (weights.get("ai_score", 1.0) * ai_score),
+            2,
+        )
+
     def mark_notified(self, job_id: int) -> None:
         with self.session_scope() as session:
             job = session.get(Job, job_id)
@@ -157,17 +509,255 @@ class DatabaseManager:
             deleted = len(jobs)
             for job in jobs:
                 session.delete(job)
+            session.flush()
+            session.query(NotificationOutbox).filter(NotificationOutbox.job_id.not_in(select(Job.id))).delete(
+                synchronize_session=False
+            )
+            session.query(JobEvent).filter(JobEvent.created_at < cutoff).delete(synchronize_session=False)
+            self._prune_shingle_documents(session)
         return deleted
 
+    def start_scrape_run(self, source: str) -> int:
+        with self.session_scope() as session:
+            run = ScrapeLog(source=source, started_at=datetime.utcnow(), status="running")
+            session.add(run)
+            session.flush()
+            return run.id
+
+    def finish_scrape_run(
+        self,
+        run_id: int,
+        status: str,
+        jobs_found: int = 0,
+        jobs_new: int = 0,
+        error_message: Optional[str] = None,
+        bytes_downloaded: int = 0,
+        rate_limit_events: int = 0,
+    ) -> None:
+        with self.session_scope() as session:
+            run = session.get(ScrapeLog, run_id)
+            if run is None:
+                return
+            run.status = status
+            run.completed_at = datetime.utcnow()
+            run.jobs_found = jobs_found
+            run.jobs_new = jobs_new
+            run.jobs_duplicate = max(jobs_found - jobs_new, 0)
+            run.bytes_downloaded = bytes_downloaded
+            run.rate_limit_events = rate_limit_events
+            run.error_message = error_message
+
+    def log_source_run(
+        self,
+        run_id: Optional[int],
+        source: str,
+        started_at: datetime,
+        status: str,
+        jobs_found: int,
+        jobs_new: int,
+        stats: dict,
+        error_message: Optional[str] = None,
+    ) -> int:
+        with self.session_scope() as session:
+            row = ScrapeLog(
+                run_id=run_id,
+                source=source,
+                started_at=started_at,
+                completed_at=datetime.utcnow(),
+                status=status,
+                jobs_found=jobs_found,
+                jobs_new=jobs_new,
+                jobs_duplicate=max(jobs_found - jobs_new, 0),
+                stage_timings=json.dumps(stats.get("stage_seconds", {}), sort_keys=True),
+                bytes_downloaded=stats.get("bytes_downloaded", 0),
+                rate_limit_events=stats.get("rate_limit_events", 0),
+                error_message=error_message,
+            )
+            session.add(row)
+            session.flush()
+            return row.id
+
+    def get_scrape_run(self, run_id: int) -> Optional[ScrapeLog]:
+        with self.session_scope() as session:
+            return session.get(ScrapeLog, run_id)
+
+    def get_scrape_runs(self, limit: int = 20) -> List[ScrapeLog]:
+        with self.session_scope() as session:
+            stmt = (
+                select(ScrapeLog)
+                .where(ScrapeLog.run_id.is_(None))
+                .order_by(ScrapeLog.started_at.desc(), ScrapeLog.id.desc())
+                .limit(limit)
+            )
+            return list(session.execute(stmt).scalars().all())
+
+    def get_source_runs(self, run_ids: List[int]) -> Dict[int, List[ScrapeLog]]:
+        if not run_ids:
+            return {}
+        with self.session_scope() as session:
+            stmt = select(ScrapeLog).where(ScrapeLog.run_id.in_(run_ids)).order_by(ScrapeLog.id)
+            grouped: Dict[int, List[ScrapeLog]] = {}
+            for row in session.execute(stmt).scalars():
+                grouped.setdefault(row.run_id, []).append(row)
+            return grouped
+
+    def record_description_shingles(self, offers: List[JobOffer]) -> None:
+        """Count each description's section sketches once for its company and once for the whole corpus.
+
+        Descriptions are identified by content fingerprint, so a repost or a cross-post of an offer that was already
+        counted does not make its own text look like company boilerplate.
+        """
+        documents: Dict[str, Tuple[str, Set[int]]] = {}
+        for offer in offers:
+            shingles = description_shingles(offer.description)
+            if shingles:
+                fingerprint = generate_content_fingerprint(offer.title, offer.company, offer.description)
+                documents.setdefault(fingerprint, (company_scope(offer.company), shingles))
+        if not documents:
+            return
+        with self.session_scope() as session:
+            recorded = set(
+                session.execute(
+                    select(ShingleDocument.fingerprint).where(ShingleDocument.fingerprint.in_(list(documents)))
+                ).scalars()
+            )
+            fresh = {key: document for key, document in documents.items() if key not in recorded}
+            if not fresh:
+                return
+            session.add_all(
+                ShingleDocument(fingerprint=fingerprint, scope=scope, shingles=json.dumps(sorted(shingles)))
+                for fingerprint, (scope, shingles) in fresh.items()
+            )
+            scope_totals, counts = _shingle_totals(fresh.values())
+            scopes = sqlite_insert(ShingleScope).values(
+                [{"scope": scope, "documents": total} for scope, total in scope_totals.items()]
+            )
+            session.execute(
+                scopes.on_conflict_do_update(
+                    index_elements=[ShingleScope.scope],
+                    set_={"documents": ShingleScope.documents + scopes.excluded.documents},
+                )
+            )
+            rows = [
+                {"scope": scope, "shingle": shingle, "documents": total} for (scope, shingle), total in counts.items()
+            ]
+            for start in range(0, len(rows), 500):
+                stmt = sqlite_insert(ShingleCount).values(rows[start : start + 500])
+                session.execute(
+                    stmt.on_conflict_do_update(
+                        index_elements=[ShingleCount.scope, ShingleCount.shingle],
+                        set_={"documents": ShingleCount.documents + stmt.excluded.documents},
+                    )
+                )
+
+    @staticmethod
+    def _prune_shingle_documents(session: Session) -> None:
+        """Uncount the descriptions that no remaining job carries, and drop the counts that fall to zero."""
+        live = select(Job.content_fingerprint).where(Job.content_fingerprint.is_not(None))
+        orphans = session.execute(select(ShingleDocument).where(ShingleDocument.fingerprint.not_in(live))).scalars()
+        scope_totals, counts = _shingle_totals(
+            (document.scope, set(json.loads(document.shingles))) for document in orphans
+        )
+        if not scope_totals:
+            return
+        connection = session.connection()
+        connection.execute(
+            update(ShingleScope)
+            .where(ShingleScope.scope == bindparam("b_scope"))
+            .values(documents=ShingleScope.documents - bindparam("b_total")),
+            [{"b_scope": scope, "b_total": total} for scope, total in scope_totals.items()],
+        )
+        connection.execute(
+            update(ShingleCount)
+            .where(ShingleCount.scope == bindparam("b_scope"), ShingleCount.shingle == bindparam("b_shingle"))
+            .values(documents=ShingleCount.documents - bindparam("b_total")),
+            [{"b_scope": scope, "b_shingle": shingle, "b_total": total} for (scope, shingle), total in counts.items()],
+        )
+        session.query(ShingleCount).filter(ShingleCount.documents <= 0).delete(synchronize_session=False)
+        session.query(ShingleScope).filter(ShingleScope.documents <= 0).delete(synchronize_session=False)
+        session.query(ShingleDocument).filter(ShingleDocument.fingerprint.not_in(live)).delete(
+            synchronize_session=False
+        )
+
+    def get_shingle_frequencies(self, company: Optional[str], shingles: Set[int]) -> List[ShingleFrequencies]:
+        scopes = [CORPUS_SCOPE, company_scope(company)]
+        frequencies = {scope: ShingleFrequencies(scope) for scope in scopes}
+        if not shingles:
+            return list(frequencies.values())
+        with self.session_scope() as session:
+            for row in session.execute(select(ShingleScope).where(ShingleScope.scope.in_(scopes))).scalars():
+                frequencies[row.scope].documents = row.documents
+            stmt = (
+                select(ShingleCount)
+                .where(ShingleCount.scope.in_(scopes))
+                .where(ShingleCount.shingle.in_(list(shingles)))
+            )
+            for row in session.execute(stmt).scalars():
+                frequencies[row.scope].counts[row.shingle] = row.documents
+        return list(frequencies.values())
+
+    def get_generation(self) -> Tuple[int, Optional[datetime]]:
+        """Return the write generation and when it last changed; both move on every committed write."""
+        with self.session_scope() as session:
+            state = session.get(SyncState, GENERATION_KEY)
+            if state is None:
+                return 0, None
+            return int(state.value or 0), state.updated_at
+
+    def get_lease_watermark(self) -> Optional[datetime]:
+        """Latest lease expiry already in the past: it moves whenever a lease lapses and a job re-enters the pool."""
+        with self.session_scope() as session:
+            return session.execute(
+                select(func.max(Job.lease_expires_at)).where(Job.lease_expires_at <= datetime.utcnow())
+            ).scalar()
+
+    def get_sync_state(self, key: str) -> Optional[str]:
+        with self.session_scope() as session:
+            state = session.get(SyncState, key)
+            return state.value if state else None
+
+    def set_sync_state(self, key: str, value: Optional[str]) -> None:
+        with self.session_scope() as session:
+            state = session.get(SyncState, key)
+            if state is None:
+                session.add(SyncState(key=key, value=value))
+            else:
+                state.value = value
+
     def get_stats(self) -> dict:
         with self.session_scope() as session:
             total = session.query(Job).count()
             new = session.query(Job).filter(Job.status == "new").count()
             scored = session.query(Job).filter(Job.status == "scored").count()
             notified = session.query(Job).filter(Job.status == "notified").count()
+            outbox = session.query(NotificationOutbox).count()
         return {
             "total": total,
             "new": new,
             "scored": scored,
             "notified": notified,
+            "notifications_pending": outbox,
         }
+
+
+def _shingle_totals(
+    documents: Iterable[Tuple[str, Set[int]]]
+) -> Tuple[Dict[str, int], Dict[Tuple[str, int], int]]:
+    """Per-scope document totals and per-(scope, shingle) counts; every document counts for its company and ``*``."""
+    scope_totals: Dict[str, int] = {}
+    counts: Dict[Tuple[str, int], int] = {}
+    for company, shingles in documents:
+        for scope in {CORPUS_SCOPE, company}:
+            scope_totals[scope] = scope_totals.get(scope, 0) + 1
+            for shingle in shingles:
+                counts[(scope, shingle)] = counts.get((scope, shingle), 0) + 1
+    return scope_totals, counts
+
+
+def _mark_write(session: Session, flush_context) -> None:
+    session.info["writes"] = True
+
+
+def _mark_bulk_write(state) -> None:
+    if state.is_insert or state.is_update or state.is_delete:
+        state.session.info["writes"] = True
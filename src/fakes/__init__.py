@@ -0,0 +1 @@
+"""Local stand-in services for offline end-to-end and load runs."""
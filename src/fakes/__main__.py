@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+import argparse
+import json
+
+from .server import FakeServices, FakeServicesConfig
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Serve fake WTTJ/Algolia, Gmail, LinkedIn and Discord endpoints")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--algolia-pages", type=int, default=5)
+    parser.add_argument("--hits-per-page", type=int, default=20)
+    parser.add_argument("--emails", type=int, default=20)
+    parser.add_argument("--jobs-per-email", type=int, default=10)
+    parser.add_argument("--rate-limit-every", type=int, default=0, help="Answer 429 to every Nth job-page request")
+    parser.add_argument("--block-every", type=int, default=0, help="Answer 999 to every Nth job-page request")
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    args = parser.parse_args()
+
+    config = FakeServicesConfig(
+        algolia_pages=args.algolia_pages,
+        hits_per_page=args.hits_per_page,
+        emails=args.emails,
+        jobs_per_email=args.jobs_per_email,
+        rate_limit_every=args.rate_limit_every,
+        block_every=args.block_every,
+        latency_ms=args.latency_ms,
+    )
+    services = FakeServices(config, host=args.host, port=args.port)
+    print(f"Fake services listening on {services.url}")
+    print("Settings overrides:")
+    print(json.dumps(services.apply_to_settings({}), indent=2))
+    try:
+        services.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,359 @@
+from __future__ import annotations
+
+import base64
+import html
+import json
+import random
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+
+
+ALGOLIA_APP_ID = "FAKEAPP"
+ALGOLIA_API_KEY = "fake-search-key"
+ALGOLIA_INDEX = "wttj_jobs_production_fr"
+GMAIL_LABEL_ID = "Label_LinkedIn"
+FIRST_HISTORY_ID = 1000
+
+TITLES = ["Data Analyst", "Consultant Data", "Data Analyst Power BI", "BI Analyst", "Analytics Engineer"]
+COMPANIES = ["Capgemini Invent", "Sia Partners", "Wavestone", "Devoteam", "Ekimetrics", "Qonto", "Doctolib"]
+CITIES = ["Paris", "Nanterre", "Boulogne-Billancourt", "Levallois-Perret"]
+SKILLS = ["Power BI", "SQL", "DAX", "Power Query", "Python", "Excel", "Snowflake", "Azure", "dbt", "Airflow"]
+
+
+@dataclass
+class FakeServicesConfig:
+    algolia_pages: int = 5
+    hits_per_page: int = 20
+    emails: int = 20
+    jobs_per_email: int = 10
+    # Every Nth LinkedIn job-page request answers 429 / 999 (0 disables the fault).
+    rate_limit_every: int = 0
+    block_every: int = 0
+    latency_ms: float = 0.0
+    seed: int = 42
+    # Discord webhook bucket: N messages per window, with X-RateLimit-* headers and 429 beyond (0 disables).
+    discord_bucket_size: int = 0
+    discord_bucket_seconds: float = 2.0
+
+
+class FakeServices:
+    """WTTJ/Algolia, Gmail, LinkedIn job pages and a Discord webhook sink on one local HTTP port."""
+
+    def __init__(self, config: Optional[FakeServicesConfig] = None, host: str = "127.0.0.1", port: int = 0) -> None:
+        self.config = config or FakeServicesConfig()
+        self.requests: Counter = Counter()
+        self.discord_messages: List[Dict[str, Any]] = []
+        self.read_messages: set = set()
+        self._lock = threading.Lock()
+        self._linkedin_requests = 0
+        self._discord_window: List[float] = []
+        self._emails = self._generate_emails()
+        self._server = ThreadingHTTPServer((host, port), _handler_for(self))
+        self._server.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def discord_webhook_url(self) -> str:
+        return f"{self.url}/api/webhooks/0/fake"
+
+    def start(self) -> "FakeServices":
+        self._thread = threading.Thread(target=self._server.serve_forever, name="fake-services", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join(5)
+
+    def serve_forever(self) -> None:
+        self._server.serve_forever()
+
+    def __enter__(self) -> "FakeServices":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def apply_to_settings(self, settings: dict) -> dict:
+        """Point every scraper and the Discord notifier of ``settings`` at this server, without delays."""
+        scraping = settings.setdefault("scraping", {})
+        wttj = scraping.setdefault("wttj", {})
+        wttj.update({"base_url": self.url, "algolia_url": self.url, "delay_between_requests": 0})
+        linkedin = scraping.setdefault("linkedin", {})
+        linkedin.update(
+            {
+                "gmail_api_endpoint": self.url,
+                "job_page_base_url": self.url,
+                "delay_between_requests": 0,
+                "min_delay_between_requests": 0,
+            }
+        )
+        discord = settings.setdefault("notifications", {}).setdefault("discord", {})
+        discord.update({"enabled": True, "webhook_url": self.discord_webhook_url})
+        return settings
+
+    def write_gmail_token(self, path: Path) -> Path:
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(
+            json.dumps(
+                {
+                    "token": "fake-token",
+                    "refresh_token": "fake",
+                    "client_id": "fake",
+                    "client_secret": "fake",
+                    "expiry": "2099-01-01T00:00:00Z",
+                }
+            ),
+            encoding="utf-8",
+        )
+        return path
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "requests": dict(self.requests),
+                "discord_messages": len(self.discord_messages),
+                "read_messages": len(self.read_messages),
+            }
+
+    # -- WTTJ / Algolia -------------------------------------------------------------------------
+
+    def wttj_page(self) -> str:
+        env = {
+            "ALGOLIA_APPLICATION_ID": ALGOLIA_APP_ID,
+            "ALGOLIA_API_KEY_CLIENT": ALGOLIA_API_KEY,
+            "ALGOLIA_JOBS_INDEX_PREFIX": ALGOLIA_INDEX,
+        }
+        return f"<html><head><script>window.env = {json.dumps(env, separators=(',', ':'))}</script></head></html>"
+
+    def algolia_query(self, body: Dict[str, Any]) -> Dict[str, Any]:
+        query = str(body.get("query", ""))
+        page = int(body.get("page", 0))
+        per_page = self.config.hits_per_page
+        hits = []
+        if page < self.config.algolia_pages:
+            rng = random.Random(f"{self.config.seed}:{query}:{page}")
+            for index in range(per_page):
+                number = page * per_page + index
+                skills = rng.sample(SKILLS, 4)
+                slug = f"{query.lower().replace(' ', '-')}-{number}"
+                hits.append(
+                    {
+                        "objectID": slug,
+                        "name": rng.choice(TITLES),
+                        "organization": {"name": rng.choice(COMPANIES)},
+                        "public_url": f"/fr/companies/fake/jobs/{slug}",
+                        "office": {"city": rng.choice(CITIES), "country": "France"},
+                        "contract_type": "CDI",
+                        "description": "<p>Mission data.</p><ul>"
+                        + "".join(f"<li><strong>{skill}</strong> requis</li>" for skill in skills)
+                        + "</ul>",
+                    }
+                )
+        return {"hits": hits, "page": page, "nbPages": self.config.algolia_pages, "hitsPerPage": per_page}
+
+    # -- Gmail ----------------------------------------------------------------------------------
+
+    def _generate_emails(self) -> List[Dict[str, Any]]:
+        rng = random.Random(self.config.seed)
+        emails = []
+        for index in range(self.config.emails):
+            rows = []
+            for position in range(self.config.jobs_per_email):
+                job_id = 4_100_000_000 + index * 1000 + position
+                title = html.escape(rng.choice(TITLES))
+                company = html.escape(rng.choice(COMPANIES))
+                rows.append(
+                    f'<tr><td><span><a href="https://www.linkedin.com/jobs/view/{job_id}/">{title}</a>'
+                    f" &middot; {company} &middot; {rng.choice(CITIES)}, France</span></td></tr>"
+                )
+            body = f"<html><body><table><tbody>{''.join(rows)}</tbody></table></body></html>"
+            emails.append(
+                {
+                    "id": f"msg{index:05d}",
+                    "history_id": FIRST_HISTORY_ID + index + 1,
+                    "html": body,
+                }
+            )
+        return emails
+
+    def gmail(self, method: str, path: str, params: Dict[str, List[str]]) -> Tuple[int, Dict[str, Any]]:
+        parts = [part for part in path.split("/") if part]
+        if parts == ["labels"]:
+            return 200, {"labels": [{"id": "INBOX", "name": "INBOX"}, {"id": GMAIL_LABEL_ID, "name": "LinkedIn Jobs"}]}
+        if parts == ["profile"]:
+            return 200, {"historyId": str(self._emails[-1]["history_id"] if self._emails else FIRST_HISTORY_ID)}
+        if parts == ["history"]:
+            return self._gmail_history(params)
+        if parts == ["messages"]:
+            limit = int(params.get("maxResults", ["100"])[0])
+            return 200, {"messages": [{"id": email["id"]} for email in self._emails[:limit]]}
+        if len(parts) == 2 and parts[0] == "messages":
+            email = next((email for email in self._emails if email["id"] == parts[1]), None)
+            if email is None:
+                return 404, {"error": {"code": 404, "message": "Not Found"}}
+            data = base64.urlsafe_b64encode(email["html"].encode("utf-8")).decode("ascii")
+            return 200, {"payload": {"mimeType": "text/html", "body": {"data": data}}}
+        if len(parts) == 3 and parts[0] == "messages" and parts[2] == "modify" and method == "POST":
+            with self._lock:
+                self.read_messages.add(parts[1])
+            return 200, {"id": parts[1]}
+        return 404, {"error": {"code": 404, "message": f"Unknown Gmail path {path}"}}
+
+    def _gmail_history(self, params: Dict[str, List[str]]) -> Tuple[int, Dict[str, Any]]:
+        start = int(params.get("startHistoryId", ["0"])[0])
+        if start < FIRST_HISTORY_ID:
+            return 404, {"error": {"code": 404, "message": "Requested entity was not found."}}
+        offset = int(params.get("pageToken", ["0"])[0])
+        records = [email for email in self._emails if email["history_id"] > start]
+        page = records[offset : offset + 50]
+        payload: Dict[str, Any] = {
+            "history": [
+                {
+                    "id": str(email["history_id"]),
+                    "messagesAdded": [{"message": {"id": email["id"], "labelIds": [GMAIL_LABEL_ID]}}],
+                }
+                for email in page
+            ],
+            "historyId": str(self._emails[-1]["history_id"] if self._emails else start),
+        }
+        if offset + 50 < len(records):
+            payload["nextPageToken"] = str(offset + 50)
+        return 200, payload
+
+    # -- LinkedIn job pages ---------------------------------------------------------------------
+
+    def linkedin_job_page(self, job_id: str) -> Tuple[int, str]:
+        with self._lock:
+            self._linkedin_requests += 1
+            count = self._linkedin_requests
+        if self.config.block_every and count % self.config.block_every == 0:
+            return 999, ""
+        if self.config.rate_limit_every and count % self.config.rate_limit_every == 0:
+            return 429, "Too Many Requests"
+        rng = random.Random(f"{self.config.seed}:{job_id}")
+        skills = ", ".join(rng.sample(SKILLS, 5))
+        page = (
+            "<html><body><section class='description'>"
+            "<div class='show-more-less-html__markup'>"
+            f"<p>Poste de data analyst (offre {html.escape(job_id)}).</p><p>Stack : {skills}.</p>"
+            "<p>2 ans d'expérience minimum, CDI, Paris.</p></div>"
+            "<ul class='description__job-criteria-list'>"
+            "<li class='description__job-criteria-item'>"
+            "<h3 class='description__job-criteria-subheader'>Type d’emploi</h3>"
+            "<span class='description__job-criteria-text'>Temps plein</span></li>"
+            "</ul></section></body></html>"
+        )
+        return 200, page
+
+    # -- Discord --------------------------------------------------------------------------------
+
+    def discord_webhook(self, payload: Dict[str, Any]) -> Tuple[int, Dict[str, Any], Dict[str, str]]:
+        with self._lock:
+            size = self.config.discord_bucket_size
+            if not size:
+                self.discord_messages.append(payload)
+                return 204, {}, {}
+            now = time.monotonic()
+            window = self.config.discord_bucket_seconds
+            self._discord_window = [sent for sent in self._discord_window if sent > now - window]
+            reset_after = self._discord_window[0] + window - now if self._discord_window else window
+            headers = {"X-RateLimit-Limit": str(size), "X-RateLimit-Bucket": "fake-webhook"}
+            if len(self._discord_window) >= size:
+                self.requests["discord_429"] += 1
+                headers.update({"X-RateLimit-Remaining": "0", "X-RateLimit-Reset-After": f"{reset_after:.3f}"})
+                body = {"message": "You are being rate limited.", "retry_after": round(reset_after, 3), "global": False}
+                return 429, body, headers
+            self._discord_window.append(now)
+            self.discord_messages.append(payload)
+            headers.update(
+                {
+                    "X-RateLimit-Remaining": str(size - len(self._discord_window)),
+                    "X-RateLimit-Reset-After": f"{self._discord_window[0] + window - now:.3f}",
+                }
+            )
+            return 204, {}, headers
+
+
+def _handler_for(services: FakeServices):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self) -> None:
+            self._dispatch("GET")
+
+        def do_POST(self) -> None:
+            self._dispatch("POST")
+
+        def log_message(self, format: str, *args) -> None:
+            pass
+
+        def _dispatch(self, method: str) -> None:
+            parsed = urlparse(self.path)
+            path = parsed.path
+            params = parse_qs(parsed.query)
+            length = int(self.headers.get("Content-Length") or 0)
+            raw_body = self.rfile.read(length) if length else b""
+            if services.config.latency_ms:
+                time.sleep(services.config.latency_ms / 1000)
+
+            if method == "GET" and path.rstrip("/") == "/en/jobs":
+                self._count("wttj")
+                self._send(200, services.wttj_page(), "text/html; charset=utf-8")
+            elif method == "POST" and path.startswith("/1/indexes/") and path.endswith("/query"):
+                self._count("algolia")
+                self._send_json(200, services.algolia_query(json.loads(raw_body or b"{}")))
+            elif path.startswith("/gmail/v1/users/me/"):
+                self._count("gmail")
+                status, payload = services.gmail(method, path[len("/gmail/v1/users/me/") :], params)
+                self._send_json(status, payload)
+            elif method == "GET" and path.startswith("/jobs/view/"):
+                self._count("linkedin")
+                status, page = services.linkedin_job_page(path.rstrip("/").rsplit("/", 1)[-1])
+                self._send(status, page, "text/html; charset=utf-8")
+            elif method == "POST" and path.startswith("/api/webhooks/"):
+                self._count("discord")
+                status, payload, headers = services.discord_webhook(json.loads(raw_body or b"{}"))
+                if status == 204:
+                    self._send(204, "", "text/plain", headers)
+                else:
+                    self._send_json(status, payload, headers)
+            elif method == "GET" and path == "/_fake/stats":
+                self._send_json(200, services.stats())
+            else:
+                self._send_json(404, {"error": f"no fake route for {method} {path}"})
+
+        def _count(self, service: str) -> None:
+            with services._lock:
+                services.requests[service] += 1
+
+        def _send_json(self, status: int, payload: Dict[str, Any], headers: Optional[Dict[str, str]] = None) -> None:
+            self._send(status, json.dumps(payload), "application/json; charset=utf-8", headers)
+
+        def _send(self, status: int, body: str, content_type: str, headers: Optional[Dict[str, str]] = None) -> None:
+            data = body.encode("utf-8")
+            self.send_response(status)
+            for name, value in (headers or {}).items():
+                self.send_header(name, value)
+            if status != 204:
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            if status != 204:
+                self.wfile.write(data)
+
+    return Handler
@@ -1,35 +1,45 @@
 from __future__ import annotations
 
 import argparse
+import json
 import logging
 import os
-from typing import Optional
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
 from pathlib import Path
 
-import uvicorn
-
-from .api.routes import create_app
 from .database.repository import DatabaseManager
-from .matcher.keyword_matcher import calculate_keyword_score
+from .matcher.ai_scorer import AI_SCORES_REUSED, AI_TOKENS_SAVED, build_scoring_prompt, estimate_tokens
+from .matcher.keyword_matcher import calculate_keyword_score, calculate_provisional_score
 from .notifier.discord_notifier import DiscordNotifier
-from .scrapers.base_scraper import JobOffer
-from .scrapers.linkedin_email import LinkedInEmailScraper
-from .scrapers.wttj_scraper import WttjScraper
+from .scheduler import ScheduledSource, ScrapeScheduler
+from .scrapers.base_scraper import BaseScraper, JobOffer
+from .scrapers.telemetry import DB_WRITE, SCORING, ScrapeStats
 from .utils.config import load_env, load_profile, load_settings, project_root
 from .utils.logger import setup_logging
+from .utils.page_archive import ALGOLIA_HIT, JOB_PAGE, PageArchive
 
 
-def run_scrape_cycle(
-    settings: dict, profile: dict, repository: DatabaseManager, notifier: Optional[DiscordNotifier] = None
-) -> None:
-    logger = logging.getLogger("ScrapeCycle")
-    scraping = settings.get("scraping", {})
+LINKEDIN_HISTORY_KEY = "linkedin_gmail_history_id"
+LINKEDIN_FETCH_STATE_KEY = "linkedin_fetch_state"
+
 
-    scrapers = []
-    linkedin_scraper: Optional[LinkedInEmailScraper] = None
+def build_scrapers(
+    settings: dict,
+    repository: DatabaseManager,
+    notifier: Optional[DiscordNotifier] = None,
+    archive: Optional[PageArchive] = None,
+) -> List[BaseScraper]:
+    scraping = settings.get("scraping", {})
+    scrapers: List[BaseScraper] = []
 
     wttj_cfg = scraping.get("wttj", {})
     if wttj_cfg.get("enabled"):
+        from .scrapers.wttj_scraper import WttjScraper
+
         scrapers.append(
             WttjScraper(
                 base_url=wttj_cfg.get("base_url", "https://www.welcometothejungle.com"),
@@ -38,11 +48,15 @@ def run_scrape_cycle(
                 contract_type=wttj_cfg.get("contract_type"),
                 max_pages=wttj_cfg.get("max_pages", 5),
                 delay_between_requests=wttj_cfg.get("delay_between_requests", 2),
+                archive=archive,
+                algolia_url=wttj_cfg.get("algolia_url"),
             )
         )
 
     linkedin_cfg = scraping.get("linkedin", {})
     if linkedin_cfg.get("enabled"):
+        from .scrapers.linkedin_email import LinkedInEmailScraper
+
         credentials_path = Path(
             os.getenv(
                 "GMAIL_CREDENTIALS_PATH",
@@ -57,98 +71,462 @@ def run_scrape_cycle(
         )
         li_at_cookie = os.getenv("LINKEDIN_LI_AT_COOKIE")
         linkedin_scraper = LinkedInEmailScraper(
-                email_label=linkedin_cfg.get("email_label", "LinkedIn Jobs"),
-                max_emails_per_run=linkedin_cfg.get("max_emails_per_run", 50),
-                credentials_path=str(credentials_path),
-                token_path=str(token_path),
-                fetch_details=linkedin_cfg.get("fetch_details", True),
-                delay_between_requests=linkedin_cfg.get("delay_between_requests", 15),
-                max_fetches_per_run=linkedin_cfg.get("max_fetches_per_run", 30),
-                user_agents=linkedin_cfg.get("user_agents"),
-                li_at_cookie=li_at_cookie,
-                cookie_alert_callback=notifier.send_message if notifier else None,
+            email_label=linkedin_cfg.get("email_label", "LinkedIn Jobs"),
+            max_emails_per_run=linkedin_cfg.get("max_emails_per_run", 50),
+            credentials_path=str(credentials_path),
+            token_path=str(token_path),
+            fetch_details=linkedin_cfg.get("fetch_details", True),
+            delay_between_requests=linkedin_cfg.get("delay_between_requests", 15),
+            max_fetches_per_run=linkedin_cfg.get("max_fetches_per_run", 30),
+            user_agents=linkedin_cfg.get("user_agents"),
+            li_at_cookie=li_at_cookie,
+            cookie_alert_callback=notifier.send_message if notifier else None,
+            history_id=repository.get_sync_state(LINKEDIN_HISTORY_KEY),
+            min_delay_between_requests=linkedin_cfg.get("min_delay_between_requests", 5),
+            max_delay_between_requests=linkedin_cfg.get("max_delay_between_requests", 120),
+            rate_limit_cooldown_minutes=linkedin_cfg.get("rate_limit_cooldown_minutes", 60),
+            block_cooldown_minutes=linkedin_cfg.get("block_cooldown_minutes", 360),
+            archive=archive,
+            gmail_api_endpoint=linkedin_cfg.get("gmail_api_endpoint"),
+            job_page_base_url=linkedin_cfg.get("job_page_base_url"),
         )
+        fetch_state = repository.get_sync_state(LINKEDIN_FETCH_STATE_KEY)
+        if fetch_state:
+            linkedin_scraper.restore_fetch_state(json.loads(fetch_state))
         scrapers.append(linkedin_scraper)
 
-    new_jobs = 0
+    return scrapers
+
+
+def run_scrape_cycle(
+    settings: dict,
+    profile: dict,
+    repository: DatabaseManager,
+    notifier: Optional[DiscordNotifier] = None,
+    archive: Optional[PageArchive] = None,
+    scrapers: Optional[List[BaseScraper]] = None,
+    run_id: Optional[int] = None,
+) -> Dict[str, Any]:
+    logger = logging.getLogger("ScrapeCycle")
+    scraping = settings.get("scraping", {})
+    linkedin_cfg = scraping.get("linkedin", {})
+
+    if scrapers is None:
+        scrapers = build_scrapers(settings, repository, notifier, archive)
+    linkedin_scraper = next((scraper for scraper in scrapers if scraper.source_name == "linkedin"), None)
+
+    fetch_details = bool(linkedin_scraper) and linkedin_cfg.get("fetch_details", True)
+    max_workers = scraping.get("max_workers") or max(1, len(scrapers))
+    batch_size = scraping.get("batch_size", 20)
+    scoring = settings.get("scoring", {})
+
     for scraper in scrapers:
-        if not scraper.is_available():
-            logger.warning("Scraper unavailable: %s", scraper.source_name)
-            continue
-        try:
-            offers = scraper.scrape()
-        except Exception as exc:
-            logger.error("Scraper failed (%s): %s", scraper.source_name, exc)
-            continue
+        scraper.stats = ScrapeStats()
+    started: Dict[str, datetime] = {}
+    found: Dict[str, int] = {}
+    new: Dict[str, int] = {}
+    errors: Dict[str, str] = {}
+    skipped: Dict[str, str] = {}
+
+    def finish_source(source) -> None:
+        # Source rows hang off their run; a cycle started outside ScrapeRunner has no run to attach them to.
+        if run_id is None:
+            return
+        name = source.source_name
+        status = "failed" if name in errors else "skipped" if name in skipped else "completed"
+        repository.log_source_run(
+            run_id,
+            name,
+            started.get(name, datetime.utcnow()),
+            status,
+            found.get(name, 0),
+            new.get(name, 0),
+            source.stats.snapshot(),
+            errors.get(name) or skipped.get(name),
+        )
 
-        logger.info("Scraper %s returned %s offers", scraper.source_name, len(offers))
+    events: "queue.Queue[Tuple[str, Any, Any]]" = queue.Queue()
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="scraper") as pool:
+        for scraper in scrapers:
+            pool.submit(_stream_offers, scraper, events, batch_size)
+        active = len(scrapers)
 
-        for offer in offers:
-            job, created = repository.add_job_offer(offer)
-            if job is None:
+        while active:
+            kind, source, payload = events.get()
+            name = source.source_name
+            if kind == "started":
+                started[name] = payload
                 continue
 
-            if not created and offer.detail_status == "fetched" and job.detail_status != "fetched":
-                repository.update_job_details(job.id, offer)
+            if kind == "batch":
+                found[name] = found.get(name, 0) + len(payload)
+                new[name] = new.get(name, 0) + _ingest_offers(repository, profile, payload, source.stats, scoring)
+                continue
 
-            if offer.source == "linkedin" and offer.detail_status != "fetched":
+            if kind == "details":
+                job, offer = payload
+                _store_linkedin_details(repository, profile, job, offer, source.stats, scoring)
                 continue
 
-            if job.keyword_score is None:
-                score = calculate_keyword_score(offer, profile)
-                repository.update_keyword_score(job.id, score)
+            if kind == "error":
+                errors[name] = payload
+                continue
 
-            if created:
-                new_jobs += 1
-
-    if (
-        linkedin_scraper
-        and linkedin_cfg.get("enabled")
-        and linkedin_cfg.get("fetch_details", True)
-        and not linkedin_scraper.cookie_issue_detected
-    ):
-        remaining_fetches = linkedin_scraper.max_fetches_per_run - linkedin_scraper.last_fetch_count
-        if remaining_fetches > 0:
-            pending_jobs = repository.get_pending_linkedin_jobs(limit=remaining_fetches)
-            if pending_jobs:
-                pending_offers = [
-                    JobOffer(
-                        source=job.source,
-                        external_id=job.external_id,
-                        url=job.url,
-                        title=job.title,
-                        company=job.company,
-                        location=job.location,
-                        contract_type=job.contract_type,
-                        salary_min=job.salary_min,
-                        salary_max=job.salary_max,
-                        description=job.description or "",
-                        detail_status=job.detail_status or "pending",
-                    )
-                    for job in pending_jobs
-                ]
-                updated_offers = linkedin_scraper.fetch_job_details(
-                    pending_offers, max_fetches=remaining_fetches
+            if kind == "skipped":
+                skipped[name] = payload
+                continue
+
+            active -= 1
+            if kind == "details_done":
+                logger.info("LinkedIn detail fetch: %s attempts", linkedin_scraper.last_fetch_count)
+                repository.set_sync_state(LINKEDIN_FETCH_STATE_KEY, json.dumps(linkedin_scraper.fetch_state()))
+                finish_source(source)
+                continue
+
+            logger.info("Scraper %s returned %s offers", name, found.get(name, 0))
+            if source is linkedin_scraper and linkedin_scraper.last_history_id:
+                repository.set_sync_state(LINKEDIN_HISTORY_KEY, linkedin_scraper.last_history_id)
+                linkedin_scraper.history_id = linkedin_scraper.last_history_id
+            if source is linkedin_scraper and fetch_details and name not in skipped:
+                pending_jobs = repository.get_pending_linkedin_jobs(
+                    limit=linkedin_scraper.max_fetches_per_run,
+                    decay_per_day=linkedin_cfg.get("fetch_priority_decay_per_day", 5),
                 )
-                for job, offer in zip(pending_jobs, updated_offers):
-                    repository.update_job_details(job.id, offer)
-                    if offer.detail_status == "fetched" and job.keyword_score is None:
-                        score = calculate_keyword_score(offer, profile)
-                        repository.update_keyword_score(job.id, score)
+                if pending_jobs:
+                    pool.submit(_stream_linkedin_details, linkedin_scraper, pending_jobs, events)
+                    active += 1
+                    continue
+            finish_source(source)
 
     cleanup_days = settings.get("database", {}).get("cleanup_days", 30)
     repository.cleanup_old_jobs(cleanup_days)
+    if archive:
+        archive.prune(cleanup_days)
+    new_jobs = sum(new.values())
     logger.info("Scraping complete. New jobs: %s", new_jobs)
+    snapshots = [scraper.stats.snapshot() for scraper in scrapers]
+    return {
+        "jobs_found": sum(found.values()),
+        "jobs_new": new_jobs,
+        "bytes_downloaded": sum(snapshot["bytes_downloaded"] for snapshot in snapshots),
+        "rate_limit_events": sum(snapshot["rate_limit_events"] for snapshot in snapshots),
+        "errors": errors,
+        "skipped": skipped,
+    }
+
+
+class ScrapeRunner:
+    def __init__(
+        self,
+        settings: dict,
+        profile: dict,
+        repository: DatabaseManager,
+        notifier: Optional[DiscordNotifier] = None,
+        archive: Optional[PageArchive] = None,
+    ) -> None:
+        self.settings = settings
+        self.profile = profile
+        self.repository = repository
+        self.notifier = notifier
+        self.archive = archive
+        self._scrapers: Optional[List[BaseScraper]] = None
+        self._lock = threading.Lock()
+        self.current_run_id: Optional[int] = None
+        # Set by each run: the error that failed it, or None. The failure is already logged and stored in ScrapeLog.
+        self.last_error: Optional[str] = None
+
+    @property
+    def running(self) -> bool:
+        return self._lock.locked()
+
+    @property
+    def scrapers(self) -> List[BaseScraper]:
+        if self._scrapers is None:
+            self._scrapers = build_scrapers(self.settings, self.repository, self.notifier, self.archive)
+        return self._scrapers
+
+    def run(self, sources: Optional[List[str]] = None) -> bool:
+        if not self._lock.acquire(blocking=False):
+            return False
+        try:
+            self._run(self._open_run(sources), sources)
+            return True
+        finally:
+            self._lock.release()
+
+    def start(self, sources: Optional[List[str]] = None) -> Tuple[Optional[int], bool]:
+        """Run a cycle in a background thread; if one is already running, return its id instead."""
+        if not self._lock.acquire(blocking=False):
+            return self.current_run_id, False
+        try:
+            run_id = self._open_run(sources)
+            threading.Thread(
+                target=self._run_and_release, args=(run_id, sources), name="scrape-run", daemon=True
+            ).start()
+        except Exception:
+            self.current_run_id = None
+            self._lock.release()
+            raise
+        return run_id, True
+
+    def _open_run(self, sources: Optional[List[str]]) -> int:
+        self.current_run_id = self.repository.start_scrape_run(",".join(sources) if sources else "all")
+        return self.current_run_id
+
+    def _run_and_release(self, run_id: int, sources: Optional[List[str]]) -> None:
+        try:
+            self._run(run_id, sources)
+        finally:
+            self._lock.release()
+
+    def _run(self, run_id: int, sources: Optional[List[str]]) -> None:
+        self.last_error = None
+        try:
+            selected = [
+                scraper for scraper in self.scrapers if sources is None or scraper.source_name in sources
+            ]
+            result = run_scrape_cycle(
+                self.settings,
+                self.profile,
+                self.repository,
+                self.notifier,
+                self.archive,
+                scrapers=selected,
+                run_id=run_id,
+            )
+        except Exception as exc:
+            logging.getLogger("ScrapeCycle").exception("Scrape run %s failed", run_id)
+            self.last_error = str(exc)
+            self.repository.finish_scrape_run(run_id, "failed", error_message=self.last_error)
+        else:
+            errors = "; ".join(f"{source}: {message}" for source, message in result["errors"].items())
+            self.repository.finish_scrape_run(
+                run_id,
+                "completed",
+                jobs_found=result["jobs_found"],
+                jobs_new=result["jobs_new"],
+                error_message=errors or None,
+                bytes_downloaded=result.get("bytes_downloaded", 0),
+                rate_limit_events=result.get("rate_limit_events", 0),
+            )
+        finally:
+            self.current_run_id = None
+
+
+def build_scheduler(settings: dict, runner: ScrapeRunner) -> ScrapeScheduler:
+    sources_cfg = settings.get("scheduler", {}).get("sources", {})
+    sources = [
+        ScheduledSource(
+            name=scraper.source_name,
+            interval=float(sources_cfg.get(scraper.source_name, {}).get("interval_minutes", 1440)) * 60,
+            jitter=float(sources_cfg.get(scraper.source_name, {}).get("jitter_minutes", 0)) * 60,
+        )
+        for scraper in runner.scrapers
+    ]
+    return ScrapeScheduler(runner.run, sources)
+
+
+def _stream_offers(scraper, events: "queue.Queue", batch_size: int) -> None:
+    logger = logging.getLogger("ScrapeCycle")
+    events.put(("started", scraper, datetime.utcnow()))
+    try:
+        if not scraper.is_available():
+            logger.warning("Scraper unavailable: %s", scraper.source_name)
+            events.put(("skipped", scraper, "source unavailable, nothing scraped"))
+            return
+        batch: List[JobOffer] = []
+        for offer in scraper.iter_offers():
+            batch.append(offer)
+            if len(batch) >= batch_size:
+                events.put(("batch", scraper, batch))
+                batch = []
+        if batch:
+            events.put(("batch", scraper, batch))
+    except Exception as exc:
+        logger.error("Scraper failed (%s): %s", scraper.source_name, exc)
+        events.put(("error", scraper, str(exc)))
+    finally:
+        events.put(("done", scraper, None))
+
+
+def _stream_linkedin_details(linkedin_scraper, pending_jobs: list, events: "queue.Queue") -> None:
+    try:
+        offers = [_job_to_offer(job) for job in pending_jobs]
+        for job, offer in zip(pending_jobs, linkedin_scraper.iter_job_details(offers)):
+            events.put(("details", linkedin_scraper, (job, offer)))
+    except Exception as exc:
+        logging.getLogger("ScrapeCycle").error("LinkedIn detail fetch failed: %s", exc)
+        events.put(("error", linkedin_scraper, f"detail fetch: {exc}"))
+    finally:
+        events.put(("details_done", linkedin_scraper, None))
+
+
+def _ingest_offers(
+    repository: DatabaseManager,
+    profile: dict,
+    offers: List[JobOffer],
+    stats: ScrapeStats,
+    scoring: Optional[dict] = None,
+) -> int:
+    new_jobs = 0
+    keyword_scores: Dict[int, float] = {}
+    fetch_priorities: Dict[int, float] = {}
+    scored_offers: List[JobOffer] = []
+    with stats.timed(DB_WRITE):
+        results = repository.add_job_offers(offers)
+    for offer, (job, created) in zip(offers, results):
+        if job is None:
+            continue
+
+        if created:
+            new_jobs += 1
+
+        if not created and offer.detail_status == "fetched" and job.detail_status != "fetched":
+            with stats.timed(DB_WRITE):
+                repository.update_job_details(job.id, offer)
+
+        if offer.source == "linkedin" and offer.detail_status != "fetched":
+            if created:
+                with stats.timed(SCORING):
+                    fetch_priorities[job.id] = calculate_provisional_score(offer, profile)
+            continue
+
+        if job.keyword_score is None and job.id not in keyword_scores:
+            with stats.timed(SCORING):
+                keyword_scores[job.id] = calculate_keyword_score(offer, profile)
+            scored_offers.append(offer)
+
+    with stats.timed(DB_WRITE):
+        repository.record_description_shingles(scored_offers)
+        _save_keyword_scores(repository, profile, keyword_scores, scoring or {})
+        repository.update_fetch_priorities(fetch_priorities)
+    return new_jobs
+
+
+def _save_keyword_scores(repository: DatabaseManager, profile: dict, scores: Dict[int, float], scoring: dict) -> None:
+    """Store keyword scores, first letting reposts of recently AI-scored offers skip the agent queue."""
+    threshold = scoring.get("keyword_prefilter_threshold")
+    reuse = scoring.get("ai_score_reuse", {})
+    if threshold is not None and reuse.get("enabled", True):
+        candidates = {job_id: score for job_id, score in scores.items() if score >= threshold}
+        reused = repository.reuse_ai_scores(
+            candidates,
+            reuse.get("max_age_days", 14),
+            scoring.get("weights", {}),
+            notify_threshold=scoring.get("ai_scoring_threshold"),
+        )
+        for job in reused:
+            AI_SCORES_REUSED.inc(job.source)
+            AI_TOKENS_SAVED.inc(job.source, amount=estimate_tokens(build_scoring_prompt(job, profile)))
+    repository.update_keyword_scores(scores, threshold)
+
+
+def _store_linkedin_details(
+    repository: DatabaseManager,
+    profile: dict,
+    job,
+    offer: JobOffer,
+    stats: ScrapeStats,
+    scoring: Optional[dict] = None,
+) -> None:
+    with stats.timed(DB_WRITE):
+        repository.update_job_details(job.id, offer)
+    if offer.detail_status == "fetched" and job.keyword_score is None:
+        with stats.timed(SCORING):
+            score = calculate_keyword_score(offer, profile)
+        with stats.timed(DB_WRITE):
+            repository.record_description_shingles([offer])
+            _save_keyword_scores(repository, profile, {job.id: score}, scoring or {})
+
+
+def run_reparse(settings: dict, profile: dict, repository: DatabaseManager, archive: PageArchive) -> int:
+    from .scrapers.linkedin_email import LinkedInEmailScraper
+    from .scrapers.wttj_scraper import WttjScraper
+
+    logger = logging.getLogger("Reparse")
+    scraping = settings.get("scraping", {})
+    wttj_parser = WttjScraper(
+        base_url=scraping.get("wttj", {}).get("base_url", "https://www.welcometothejungle.com"),
+        search_queries=[],
+        location=None,
+        contract_type=None,
+    )
+    linkedin_parser = LinkedInEmailScraper(
+        email_label=scraping.get("linkedin", {}).get("email_label", "LinkedIn Jobs"),
+        max_emails_per_run=0,
+        credentials_path="",
+        token_path="",
+    )
+
+    reparsed = 0
+    keyword_scores: Dict[int, float] = {}
+    rescored_offers: List[JobOffer] = []
+    for job_hash in archive.job_hashes():
+        job = repository.get_job_by_hash(job_hash)
+        if job is None:
+            continue
+
+        refs = archive.refs(job_hash)
+        offer: Optional[JobOffer] = None
+        if JOB_PAGE in refs:
+            html = archive.load(job_hash, JOB_PAGE)
+            if html:
+                offer = linkedin_parser.apply_job_page(_job_to_offer(job), html)
+        elif ALGOLIA_HIT in refs:
+            payload = archive.load(job_hash, ALGOLIA_HIT)
+            if payload:
+                offer = wttj_parser.hit_to_job(json.loads(payload))
+        if offer is None:
+            continue
+
+        repository.update_job_details(job.id, offer)
+        if job.status == "new" and offer.description:
+            keyword_scores[job.id] = calculate_keyword_score(offer, profile)
+            rescored_offers.append(offer)
+        reparsed += 1
+
+    # Same path as freshly scraped offers: shingle counts, AI score reuse and the job event feed.
+    repository.record_description_shingles(rescored_offers)
+    _save_keyword_scores(repository, profile, keyword_scores, settings.get("scoring", {}))
+    logger.info("Reparse complete. Jobs rebuilt from archive: %s", reparsed)
+    return reparsed
+
+
+def _job_to_offer(job) -> JobOffer:
+    return JobOffer(
+        source=job.source,
+        external_id=job.external_id,
+        url=job.url,
+        title=job.title,
+        company=job.company,
+        location=job.location,
+        contract_type=job.contract_type,
+        salary_min=job.salary_min,
+        salary_max=job.salary_max,
+        description=job.description or "",
+        detail_status=job.detail_status or "pending",
+    )
+
+
+def _build_archive(settings: dict) -> Optional[PageArchive]:
+    archive_cfg = settings.get("archive", {})
+    if not archive_cfg.get("enabled", True):
+        return None
+    return PageArchive(project_root() / archive_cfg.get("path", "data/archive"))
 
 
 def main() -> None:
     parser = argparse.ArgumentParser(description="Job Hunter Automation")
-    parser.add_argument("--scrape-only", action="store_true", help="Run scraping and exit")
-    parser.add_argument("--api-only", action="store_true", help="Run API server only")
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument("--scrape-only", action="store_true", help="Run scraping and exit")
+    mode.add_argument("--api-only", action="store_true", help="Run API server only")
+    mode.add_argument("--reparse", action="store_true", help="Rebuild job details from the raw page archive")
+    mode.add_argument("--daemon", action="store_true", help="Run the resident scrape scheduler")
+    parser.add_argument("--with-api", action="store_true", help="Serve the API alongside --daemon")
     args = parser.parse_args()
 
-    if args.api_only and args.scrape_only:
-        parser.error("Choose either --api-only or --scrape-only")
+    if args.with_api and not args.daemon:
+        parser.error("--with-api requires --daemon")
 
     load_env()
     settings = load_settings()
@@ -164,19 +542,59 @@ def main() -> None:
     repository.init_db()
 
     notifier = DiscordNotifier(settings.get("notifications", {}).get("discord", {}))
+    archive = _build_archive(settings)
+
+    if args.reparse:
+        if archive is None:
+            parser.error("--reparse requires archive.enabled in settings.yaml")
+        run_reparse(settings, profile, repository, archive)
+        return
+
+    runner = ScrapeRunner(settings, profile, repository, notifier, archive)
+
+    if args.daemon:
+        scheduler = build_scheduler(settings, runner)
+        if not args.with_api:
+            try:
+                scheduler.run_forever()
+            except KeyboardInterrupt:
+                pass
+            return
+        scheduler.start()
+        try:
+            _serve_api(settings, profile, repository, notifier, runner)
+        finally:
+            scheduler.stop(timeout=5)
+        return
 
     if args.api_only:
-        app = create_app(
-            settings,
-            profile,
-            repository,
-            notifier,
-            scrape_callable=lambda: run_scrape_cycle(settings, profile, repository, notifier),
-        )
-        uvicorn.run(app, host=settings["api"]["host"], port=settings["api"]["port"])
+        _serve_api(settings, profile, repository, notifier, runner)
         return
 
-    run_scrape_cycle(settings, profile, repository, notifier)
+    runner.run()
+    if runner.last_error:
+        raise SystemExit(1)
+
+
+def _serve_api(settings: dict, profile: dict, repository: DatabaseManager, notifier, runner: ScrapeRunner) -> None:
+    import uvicorn
+
+    from .api.routes import create_app
+
+    app = create_app(settings, profile, repository, notifier, scrape_callable=runner.start)
+    server = uvicorn.Server(uvicorn.Config(app, host=settings["api"]["host"], port=settings["api"]["port"]))
+    handle_exit = server.handle_exit
+
+    def close_streams_then_exit(sig, frame) -> None:
+        # uvicorn waits for open responses before the lifespan shutdown, so SSE streams must be ended from here.
+        app.state.job_events.close()
+        handle_exit(sig, frame)
+
+    server.handle_exit = close_streams_then_exit
+    try:
+        server.run()
+    finally:
+        notifier.close()
 
 
 if __name__ == "__main__":
@@ -1,13 +1,51 @@
 from __future__ import annotations
 
-from typing import Dict
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
 
 from ..scrapers.base_scraper import JobOffer
+from ..utils.metrics import REGISTRY
+from .compaction import (
+    CHARS_PER_TOKEN,
+    ShingleFrequencies,
+    compact_description,
+    description_shingles,
+    relevance_terms,
+)
 
 
-def build_scoring_prompt(job: JobOffer, profile: Dict) -> str:
-    profile_summary = _build_profile_summary(profile)
-    description = job.description[:2000] if job.description else ""
+PROMPT_CACHE_LOOKUPS = REGISTRY.counter(
+    "jobhunter_prompt_cache_lookups_total", "Scoring prompt cache lookups.", ("result",)
+)
+AI_SCORES_REUSED = REGISTRY.counter(
+    "jobhunter_ai_scores_reused_total", "Jobs that inherited the AI score of a reposted offer.", ("source",)
+)
+AI_TOKENS_SAVED = REGISTRY.counter(
+    "jobhunter_ai_prompt_tokens_saved_total", "Estimated prompt tokens not sent to the scoring agent.", ("source",)
+)
+
+DEFAULT_DESCRIPTION_TOKENS = 500
+
+FrequencyLookup = Callable[[str, Set[int]], List[ShingleFrequencies]]
+
+
+def build_scoring_prompt(
+    job: JobOffer,
+    profile: Dict,
+    profile_summary: Optional[str] = None,
+    *,
+    terms: Optional[List[str]] = None,
+    frequencies: Iterable[ShingleFrequencies] = (),
+    description_tokens: int = DEFAULT_DESCRIPTION_TOKENS,
+) -> str:
+    if profile_summary is None:
+        profile_summary = _build_profile_summary(profile)
+    if terms is None:
+        terms = relevance_terms(profile)
+    description = compact_description(job.description, terms, description_tokens, frequencies)
 
     return (
         "Evaluate this job offer for a Data Analyst Power BI (2 years exp, Paris, CDI).\n\n"
@@ -18,6 +56,10 @@ def build_scoring_prompt(job: JobOffer, profile: Dict) -> str:
     )
 
 
+def estimate_tokens(text: str) -> int:
+    return -(-len(text) // CHARS_PER_TOKEN)
+
+
 def _build_profile_summary(profile: Dict) -> str:
     skills = profile.get("skills", {})
     required = ", ".join([item.get("keyword", "") for item in skills.get("required", [])])
@@ -37,3 +79,85 @@ def _build_profile_summary(profile: Dict) -> str:
         lines.append(f"- Preferred companies: {company_types}")
 
     return "\n".join(lines) if lines else "- Profile not configured"
+
+
+def profile_fingerprint(profile: Dict) -> str:
+    return hashlib.sha256(json.dumps(profile, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+
+class PromptCache:
+    """Bounded LRU of scoring prompts keyed by (job hash, profile hash).
+
+    The profile summary and relevance terms are rebuilt only when a different profile object is passed in and
+    its fingerprint changed. Entries remember the job fields they were built from, so a re-parsed description
+    misses instead of serving a stale prompt; jobs without a ``hash`` bypass the cache. ``frequencies`` looks up
+    boilerplate statistics (see ``DatabaseManager.get_shingle_frequencies``) for description compaction.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 2048,
+        frequencies: Optional[FrequencyLookup] = None,
+        description_tokens: int = DEFAULT_DESCRIPTION_TOKENS,
+    ) -> None:
+        self.max_entries = max_entries
+        self.frequencies = frequencies
+        self.description_tokens = description_tokens
+        self._prompts: "OrderedDict[Tuple[str, str], Tuple[int, str]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._profile: Optional[Dict] = None
+        self._profile_hash = ""
+        self._profile_summary = ""
+        self._terms: List[str] = []
+
+    def get(self, job, profile: Dict) -> str:
+        profile_hash = self._profile_version(profile)
+        job_hash = getattr(job, "hash", None)
+        if not job_hash or self.max_entries <= 0:
+            return self._build(job, profile)
+
+        key = (job_hash, profile_hash)
+        content = hash((job.title, job.company, job.location, job.contract_type, job.description))
+        with self._lock:
+            entry = self._prompts.get(key)
+            if entry is not None and entry[0] == content:
+                self._prompts.move_to_end(key)
+                PROMPT_CACHE_LOOKUPS.inc("hit")
+                return entry[1]
+
+        PROMPT_CACHE_LOOKUPS.inc("miss")
+        prompt = self._build(job, profile)
+        with self._lock:
+            self._prompts[key] = (content, prompt)
+            self._prompts.move_to_end(key)
+            while len(self._prompts) > self.max_entries:
+                self._prompts.popitem(last=False)
+        return prompt
+
+    def __len__(self) -> int:
+        return len(self._prompts)
+
+    def _build(self, job, profile: Dict) -> str:
+        frequencies: List[ShingleFrequencies] = []
+        if self.frequencies is not None and job.description:
+            frequencies = self.frequencies(job.company, description_shingles(job.description))
+        return build_scoring_prompt(
+            job,
+            profile,
+            self._profile_summary,
+            terms=self._terms,
+            frequencies=frequencies,
+            description_tokens=self.description_tokens,
+        )
+
+    def _profile_version(self, profile: Dict) -> str:
+        with self._lock:
+            if profile is not self._profile:
+                fingerprint = profile_fingerprint(profile)
+                if fingerprint != self._profile_hash:
+                    self._profile_hash = fingerprint
+                    self._profile_summary = _build_profile_summary(profile)
+                    self._terms = relevance_terms(profile)
+                    self._prompts.clear()
+                self._profile = profile
+            return self._profile_hash
@@ -0,0 +1,169 @@
+from __future__ import annotations
+
+import hashlib
+import re
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Set
+
+from .keyword_matcher import keywords_from_skill, normalize_text
+
+
+CORPUS_SCOPE = "*"
+# Rough characters-per-token ratio for mixed French/English prose; good enough for budgets and savings estimates.
+CHARS_PER_TOKEN = 4
+SHINGLE_WORDS = 5
+SKETCH_SIZE = 4
+BOILERPLATE_SHARE = 0.6
+COMPANY_MIN_DOCUMENTS = 2
+CORPUS_MIN_DOCUMENTS = 5
+CORPUS_MIN_RATIO = 0.02
+MIN_SECTION_WORDS = 4
+
+SECTION_BREAK = re.compile(r"\n+|(?<=[.!?;])\s+(?=[A-ZÀ-Ý0-9•\-–*])|\s+(?=[•–*]\s)|\s+-\s+(?=[A-ZÀ-Ý])")
+
+# Headings and phrasings that usually introduce the part of an offer an evaluator actually needs.
+REQUIREMENT_MARKERS = [
+    "profil",
+    "competences",
+    "requirements",
+    "qualifications",
+    "experience",
+    "missions",
+    "responsabilites",
+    "responsibilities",
+    "vous avez",
+    "you have",
+    "maitrise",
+    "diplome",
+    "stack",
+    "outils",
+]
+
+
+@dataclass
+class ShingleFrequencies:
+    """Document frequencies of sketch shingles within one scope (a company, or the whole corpus)."""
+
+    scope: str
+    documents: int = 0
+    counts: Dict[int, int] = field(default_factory=dict)
+
+    @property
+    def min_count(self) -> int:
+        # Counts include the offer being compacted, so a company threshold of 2 means "seen in another offer".
+        if self.scope == CORPUS_SCOPE:
+            return max(CORPUS_MIN_DOCUMENTS, int(self.documents * CORPUS_MIN_RATIO))
+        return COMPANY_MIN_DOCUMENTS
+
+
+def company_scope(company: Optional[str]) -> str:
+    return normalize_text(company or "")
+
+
+def split_sections(description: str) -> List[str]:
+    """Cut a description into sentence/bullet sized sections; scrapers store descriptions as flattened text."""
+    sections: List[str] = []
+    carry = ""
+    for part in SECTION_BREAK.split(description or ""):
+        part = part.strip()
+        if not part:
+            continue
+        if carry:
+            part = f"{carry} {part}"
+            carry = ""
+        if len(part.split()) < MIN_SECTION_WORDS:
+            carry = part
+            continue
+        sections.append(part)
+    if carry:
+        if sections:
+            sections[-1] = f"{sections[-1]} {carry}"
+        else:
+            sections.append(carry)
+    return sections
+
+
+def section_sketch(section: str) -> Set[int]:
+    """Bottom-k sketch of the section's word shingles: identical sections always share it, near-identical mostly."""
+    words = normalize_text(section).split()
+    if not words:
+        return set()
+    size = min(SHINGLE_WORDS, len(words))
+    hashes = {_hash(" ".join(words[start : start + size])) for start in range(len(words) - size + 1)}
+    return set(sorted(hashes)[:SKETCH_SIZE])
+
+
+def description_shingles(description: Optional[str]) -> Set[int]:
+    shingles: Set[int] = set()
+    for section in split_sections(description or ""):
+        shingles |= section_sketch(section)
+    return shingles
+
+
+def relevance_terms(profile: Dict) -> List[str]:
+    skills = profile.get("skills", {})
+    terms: Set[str] = set()
+    for category in ["required", "important", "nice_to_have", "not_known"]:
+        for skill in skills.get(category, []):
+            terms.update(keyword for keyword in keywords_from_skill(skill) if keyword)
+    terms.update(normalize_text(title) for title in profile.get("search", {}).get("job_titles", []) if title)
+    return sorted(terms)
+
+
+def is_boilerplate(sketch: Set[int], frequencies: Iterable[ShingleFrequencies]) -> bool:
+    if not sketch:
+        return False
+    for scope in frequencies:
+        frequent = sum(1 for shingle in sketch if scope.counts.get(shingle, 0) >= scope.min_count)
+        if frequent / len(sketch) >= BOILERPLATE_SHARE:
+            return True
+    return False
+
+
+def compact_description(
+    description: Optional[str],
+    terms: List[str],
+    token_budget: int,
+    frequencies: Iterable[ShingleFrequencies] = (),
+) -> str:
+    """Drop repeated and boilerplate sections, then keep the most relevant ones (in original order) within budget.
+
+    Sections mentioning a profile term are never treated as boilerplate, so requirement lists shared by several
+    offers of the same company survive.
+    """
+    if not description:
+        return ""
+    budget = token_budget * CHARS_PER_TOKEN
+    frequencies = list(frequencies)
+    kept = []
+    seen: Set[str] = set()
+    for position, section in enumerate(split_sections(description)):
+        text = f" {normalize_text(section)} "
+        if text in seen:
+            continue
+        seen.add(text)
+        term_hits = sum(1 for term in terms if f" {term} " in text or (len(term) > 3 and term in text))
+        if not term_hits and frequencies and is_boilerplate(section_sketch(section), frequencies):
+            continue
+        relevance = 2 * term_hits + sum(1 for marker in REQUIREMENT_MARKERS if marker in text)
+        kept.append((position, relevance, section))
+
+    if sum(len(section) + 1 for _, _, section in kept) <= budget:
+        return " ".join(section for _, _, section in kept)
+
+    chosen = []
+    remaining = budget
+    for position, relevance, section in sorted(kept, key=lambda item: (-item[1], item[0])):
+        if remaining <= 0:
+            break
+        if len(section) + 1 > remaining:
+            section = section[: remaining - 1].rsplit(" ", 1)[0]
+            if not section:
+                continue
+        chosen.append((position, section))
+        remaining -= len(section) + 1
+    return " ".join(section for _, section in sorted(chosen))
+
+
+def _hash(value: str) -> int:
+    return int.from_bytes(hashlib.blake2b(value.encode("utf-8"), digest_size=8).digest(), "big") >> 1
@@ -5,6 +5,7 @@ import unicodedata
 from typing import Dict, List
 
 from ..scrapers.base_scraper import JobOffer
+from ..utils.metrics import timed
 
 
 REQUIRED_MARKERS = [
@@ -23,6 +24,7 @@ def normalize_text(text: str) -> str:
     return re.sub(r"\s+", " ", normalized).lower().strip()
 
 
+@timed()
 def calculate_keyword_score(job: JobOffer, profile: Dict) -> float:
     skills = profile.get("skills", {})
     exclusions = profile.get("exclusions", {})
@@ -43,12 +45,12 @@ def calculate_keyword_score(job: JobOffer, profile: Dict) -> float:
 
     for category in ["required", "important", "nice_to_have"]:
         for skill in skills.get(category, []):
-            keywords = _keywords_from_skill(skill)
+            keywords = keywords_from_skill(skill)
             if _contains_any(text_to_search, keywords):
                 score += float(skill.get("weight", 0))
 
     for skill in skills.get("not_known", []):
-        keywords = _keywords_from_skill(skill)
+        keywords = keywords_from_skill(skill)
         if _contains_any(text_to_search, keywords) and _is_required_in_context(text_to_search, keywords):
             score += float(skill.get("penalty", 0))
 
@@ -63,6 +65,29 @@ def calculate_keyword_score(job: JobOffer, profile: Dict) -> float:
     return round(normalized_score, 1)
 
 
+def calculate_provisional_score(job: JobOffer, profile: Dict) -> float:
+    skills = profile.get("skills", {})
+    exclusions = profile.get("exclusions", {})
+    job_titles = profile.get("search", {}).get("job_titles", [])
+
+    text_to_search = normalize_text(f"{job.title} {job.description or ''}")
+    if _is_excluded(job, exclusions, text_to_search):
+        return 0.0
+
+    title = normalize_text(job.title)
+    title_score = 50.0 if any(normalize_text(value) in title for value in job_titles if value) else 0.0
+
+    matched = 0.0
+    for category in ["required", "important", "nice_to_have"]:
+        for skill in skills.get(category, []):
+            if _contains_any(text_to_search, keywords_from_skill(skill)):
+                matched += float(skill.get("weight", 0))
+
+    max_possible_score = _max_possible_score(skills)
+    skill_score = (matched / max_possible_score) * 50.0 if max_possible_score > 0 else 0.0
+    return round(min(100.0, title_score + skill_score), 1)
+
+
 def _max_possible_score(skills: Dict) -> float:
     total = 0.0
     for category in ["required", "important", "nice_to_have"]:
@@ -71,7 +96,8 @@ def _max_possible_score(skills: Dict) -> float:
     return total
 
 
-def _keywords_from_skill(skill: Dict) -> List[str]:
+def keywords_from_skill(skill: Dict) -> List[str]:
+    """Normalized keyword and aliases of a profile skill entry."""
     keywords = [skill.get("keyword", "")]
     keywords.extend(skill.get("aliases", []) or [])
     return [normalize_text(word) for word in keywords if word]
@@ -83,7 +109,7 @@ def _contains_any(text: str, keywords: List[str]) -> bool:
 
 def _all_required_present(text: str, required_skills: List[Dict]) -> bool:
     for skill in required_skills:
-        keywords = _keywords_from_skill(skill)
+        keywords = keywords_from_skill(skill)
         if not _contains_any(text, keywords):
             return False
     return True
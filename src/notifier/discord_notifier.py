@@ -1,78 +1,149 @@
 from __future__ import annotations
 
 import logging
+import threading
+import time
+from dataclasses import dataclass
 from datetime import date
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import httpx
 
 from ..database.models import Job
+from ..utils.metrics import REGISTRY
+
+# Discord rejects messages with more embeds, a longer embed description or more embed text in total.
+MAX_EMBEDS_PER_MESSAGE = 10
+MAX_EMBED_DESCRIPTION = 4096
+MAX_MESSAGE_EMBED_CHARS = 6000
+
+DEFAULT_TIMEOUT_SECONDS = 10.0
+DEFAULT_MAX_RETRIES = 3
+DEFAULT_MAX_RETRY_WAIT_SECONDS = 60.0
+# Fallback wait when a 429 carries neither a body nor a Retry-After header.
+DEFAULT_RETRY_AFTER_SECONDS = 1.0
+
+DISCORD_RATE_LIMITED = REGISTRY.counter(
+    "jobhunter_discord_rate_limited_total", "Discord webhook requests answered with 429.", ("scope",)
+)
+
+SOURCE_LABELS = {"wttj": "Welcome to the Jungle", "linkedin": "LinkedIn"}
+
+
+@dataclass
+class RateLimitBucket:
+    """State of the webhook's rate-limit bucket, from Discord's ``X-RateLimit-*`` headers (monotonic clock)."""
+
+    remaining: Optional[int] = None
+    reset_at: float = 0.0
+
+    def wait_time(self, now: float) -> float:
+        if self.remaining == 0 and self.reset_at > now:
+            return self.reset_at - now
+        return 0.0
+
+    def update(self, headers: httpx.Headers, now: float) -> None:
+        remaining = headers.get("x-ratelimit-remaining")
+        reset_after = headers.get("x-ratelimit-reset-after")
+        if remaining is None or reset_after is None:
+            return
+        try:
+            self.remaining = int(remaining)
+            self.reset_at = now + float(reset_after)
+        except ValueError:
+            return
+
+    def exhaust(self, retry_after: float, now: float) -> None:
+        self.remaining = 0
+        self.reset_at = max(self.reset_at, now + retry_after)
 
 
 class DiscordNotifier:
-    def __init__(self, config: Dict[str, Any]) -> None:
+    def __init__(self, config: Dict[str, Any], client: Optional[httpx.Client] = None) -> None:
         self.enabled = bool(config.get("enabled", False))
         self.webhook_url = config.get("webhook_url")
         self.embed_color = config.get("embed_color", 0x00D166)
+        self.timeout = float(config.get("timeout_seconds", DEFAULT_TIMEOUT_SECONDS))
+        self.max_retries = int(config.get("max_retries", DEFAULT_MAX_RETRIES))
+        self.max_retry_wait = float(config.get("max_retry_wait_seconds", DEFAULT_MAX_RETRY_WAIT_SECONDS))
         self.logger = logging.getLogger(self.__class__.__name__)
+        # Created on first send so that disabled notifiers never build an SSL context.
+        self._client = client
+        self._owns_client = client is None
+        self._bucket = RateLimitBucket()
+        self._global_reset_at = 0.0
+        # Senders share the bucket: the API, the scheduler and cookie alerts may all post concurrently.
+        self._lock = threading.Lock()
+
+    def close(self) -> None:
+        if self._client is not None and self._owns_client:
+            self._client.close()
+            self._client = None
 
     def send_job(self, job: Job) -> bool:
         payload = self._build_payload(job)
-        return self._send_payload(payload)
+        return self.send_payload(payload)
 
     def send_message(self, content: str) -> bool:
         payload = {"content": content}
-        return self._send_payload(payload)
-
-    def send_daily_recap(self, jobs_by_source: Dict[str, List[Job]]) -> bool:
-        if not jobs_by_source:
-            return False
+        return self.send_payload(payload)
 
+    def recap_messages(self, jobs_by_source: Dict[str, List[Job]]) -> List[Tuple[Dict[str, Any], List[Job]]]:
+        """Split the recap into Discord-compliant payloads, each paired with the jobs it lists."""
         total = sum(len(jobs) for jobs in jobs_by_source.values())
         summary_parts = [f"{len(jobs)} {source.upper()}" for source, jobs in jobs_by_source.items() if jobs]
         summary = ", ".join(summary_parts) if summary_parts else "0"
 
-        embeds: List[Dict[str, Any]] = [
-            {
-                "title": f"Job Hunter - Rapport du {date.today().strftime('%d/%m/%Y')}",
-                "description": f"**{total} offres** ({summary})",
-                "color": self.embed_color,
-            }
+        embeds: List[Tuple[Dict[str, Any], List[Job]]] = [
+            (
+                {
+                    "title": f"Job Hunter - Rapport du {date.today().strftime('%d/%m/%Y')}",
+                    "description": f"**{total} offres** ({summary})",
+                    "color": self.embed_color,
+                },
+                [],
+            )
         ]
 
         for source, jobs in jobs_by_source.items():
             if not jobs:
                 continue
 
-            source_label = {"wttj": "Welcome to the Jungle", "linkedin": "LinkedIn"}.get(source, source)
+            source_label = SOURCE_LABELS.get(source, source)
             source_color = 0xFFCD00 if source == "wttj" else 0x5865F2 if source == "linkedin" else self.embed_color
-            lines = []
-
             sorted_jobs = sorted(jobs, key=lambda job: job.final_score or 0, reverse=True)
+            chunks: List[Tuple[List[str], List[Job]]] = [([], [])]
+            length = 0
             for index, job in enumerate(sorted_jobs, 1):
-                score_str = f"**{job.final_score}%**" if job.final_score is not None else "N/A"
-                location_str = f" | {job.location}" if job.location else ""
-                contract_str = f" | {job.contract_type}" if job.contract_type else ""
-                reasoning = f"\n> {job.ai_reasoning[:150]}" if job.ai_reasoning else ""
-                lines.append(
-                    f"**{index}. [{job.title}]({job.url})** — {job.company}\n"
-                    f"Score: {score_str}{location_str}{contract_str}{reasoning}\n"
-                )
-
-            description = "\n".join(lines)
-            if len(description) > 4000:
-                description = f"{description[:3990]}..."
-
-            embeds.append(
-                {
-                    "title": f"── {source_label} ({len(jobs)} offres) ──",
-                    "description": description,
-                    "color": source_color,
-                }
-            )
+                line = _recap_line(index, job)
+                if chunks[-1][0] and length + len(line) + 1 > MAX_EMBED_DESCRIPTION:
+                    chunks.append(([], []))
+                    length = 0
+                chunks[-1][0].append(line)
+                chunks[-1][1].append(job)
+                length += len(line) + 1
+
+            for part, (lines, chunk_jobs) in enumerate(chunks):
+                count = f"{len(jobs)} offres" if part == 0 else "suite"
+                title = f"── {source_label} ({count}) ──"
+                embed = {"title": title, "description": "\n".join(lines), "color": source_color}
+                embeds.append((embed, chunk_jobs))
 
-        payload = {"embeds": embeds[:10]}
-        return self._send_payload(payload)
+        messages: List[Tuple[Dict[str, Any], List[Job]]] = []
+        size = 0
+        for embed, embed_jobs in embeds:
+            embed_size = len(embed["title"]) + len(embed["description"])
+            if (
+                not messages
+                or len(messages[-1][0]["embeds"]) >= MAX_EMBEDS_PER_MESSAGE
+                or size + embed_size > MAX_MESSAGE_EMBED_CHARS
+            ):
+                messages.append(({"embeds": []}, []))
+                size = 0
+            messages[-1][0]["embeds"].append(embed)
+            messages[-1][1].extend(embed_jobs)
+            size += embed_size
+        return messages
 
     def _build_payload(self, job: Job) -> Dict[str, Any]:
         fields = [
@@ -98,22 +169,93 @@ class DiscordNotifier:
             ]
         }
 
-    def _send_payload(self, payload: Dict[str, Any]) -> bool:
+    def send_payload(self, payload: Dict[str, Any]) -> bool:
         if not self.enabled:
             return False
         if not self.webhook_url:
             self.logger.warning("Discord webhook not configured")
             return False
 
+        with self._lock:
+            for attempt in range(self.max_retries + 1):
+                wait = self._wait_time()
+                if wait > self.max_retry_wait:
+                    self.logger.error("Discord rate limit resets in %.1fs, giving up on this message", wait)
+                    return False
+                if wait > 0:
+                    time.sleep(wait)
+
+                try:
+                    response = self._http().post(self.webhook_url, json=payload)
+                except httpx.RequestError as exc:
+                    self.logger.error("Discord webhook request failed: %s", exc)
+                    return False
+
+                now = time.monotonic()
+                self._bucket.update(response.headers, now)
+                if response.status_code == 429:
+                    retry_after, is_global = _retry_after(response)
+                    DISCORD_RATE_LIMITED.inc("global" if is_global else "webhook")
+                    if is_global:
+                        self._global_reset_at = max(self._global_reset_at, now + retry_after)
+                    else:
+                        self._bucket.exhaust(retry_after, now)
+                    self.logger.warning(
+                        "Discord rate limited (attempt %s/%s), retrying in %.2fs",
+                        attempt + 1,
+                        self.max_retries + 1,
+                        retry_after,
+                    )
+                    continue
+                if response.status_code >= 400:
+                    self.logger.error("Discord webhook error: %s", response.text)
+                    return False
+                return True
+
+        self.logger.error("Discord webhook still rate limited after %s attempts", self.max_retries + 1)
+        return False
+
+    def _wait_time(self) -> float:
+        now = time.monotonic()
+        return max(self._bucket.wait_time(now), self._global_reset_at - now, 0.0)
+
+    def _http(self) -> httpx.Client:
+        if self._client is None:
+            self._client = httpx.Client(timeout=self.timeout)
+        return self._client
+
+
+def _recap_line(index: int, job: Job) -> str:
+    score_str = f"**{job.final_score}%**" if job.final_score is not None else "N/A"
+    location_str = f" | {job.location}" if job.location else ""
+    contract_str = f" | {job.contract_type}" if job.contract_type else ""
+    reasoning = f"\n> {job.ai_reasoning[:150]}" if job.ai_reasoning else ""
+    line = (
+        f"**{index}. [{job.title}]({job.url})** — {job.company}\n"
+        f"Score: {score_str}{location_str}{contract_str}{reasoning}\n"
+    )
+    return line if len(line) <= MAX_EMBED_DESCRIPTION else f"{line[: MAX_EMBED_DESCRIPTION - 3]}..."
+
+
+def _retry_after(response: httpx.Response) -> Tuple[float, bool]:
+    """Seconds to wait after a 429, and whether the global (rather than the webhook's) limit was hit."""
+    try:
+        body = response.json()
+    except ValueError:
+        body = {}
+    if not isinstance(body, dict):
+        body = {}
+    is_global = bool(body.get("global")) or response.headers.get("x-ratelimit-global", "").lower() == "true"
+    for value in (
+        body.get("retry_after"),
+        response.headers.get("retry-after"),
+        response.headers.get("x-ratelimit-reset-after"),
+    ):
         try:
-            response = httpx.post(self.webhook_url, json=payload, timeout=10)
-            if response.status_code >= 400:
-                self.logger.error("Discord webhook error: %s", response.text)
-                return False
-        except httpx.RequestError as exc:
-            self.logger.error("Discord webhook request failed: %s", exc)
-            return False
-        return True
+            return max(0.0, float(value)), is_global
+        except (TypeError, ValueError):
+            continue
+    return DEFAULT_RETRY_AFTER_SECONDS, is_global
 
 
 def format_salary(min_value: Optional[int], max_value: Optional[int]) -> str:
@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import logging
+import threading
+from typing import Dict, List, Optional
+
+from ..database.models import Job
+from ..utils.metrics import REGISTRY
+from .discord_notifier import DiscordNotifier
+
+DEFAULT_BATCH_SIZE = 50
+DEFAULT_POLL_SECONDS = 30.0
+DEFAULT_BATCH_WINDOW_SECONDS = 2.0
+DEFAULT_RETRY_BASE_SECONDS = 30.0
+DEFAULT_RETRY_MAX_SECONDS = 3600.0
+
+OUTBOX_DELIVERIES = REGISTRY.counter(
+    "jobhunter_notification_outbox_jobs_total", "Outbox jobs by delivery outcome.", ("result",)
+)
+
+
+class NotificationWorker:
+    """Drains the notification outbox in the background, one recap per batch of due jobs.
+
+    A job is marked notified only once the Discord message listing it has been accepted; jobs of messages that
+    could not be sent stay in the outbox and are retried with exponential backoff.
+    """
+
+    def __init__(
+        self,
+        repository,
+        notifier: DiscordNotifier,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        poll_seconds: float = DEFAULT_POLL_SECONDS,
+        batch_window_seconds: float = DEFAULT_BATCH_WINDOW_SECONDS,
+        retry_base_seconds: float = DEFAULT_RETRY_BASE_SECONDS,
+        retry_max_seconds: float = DEFAULT_RETRY_MAX_SECONDS,
+    ) -> None:
+        self.repository = repository
+        self.notifier = notifier
+        self.batch_size = batch_size
+        self.poll_seconds = poll_seconds
+        self.batch_window_seconds = batch_window_seconds
+        self.retry_base_seconds = retry_base_seconds
+        self.retry_max_seconds = retry_max_seconds
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @classmethod
+    def from_settings(cls, settings: dict, repository, notifier: DiscordNotifier) -> "NotificationWorker":
+        config = settings.get("notifications", {}).get("outbox", {})
+        return cls(
+            repository,
+            notifier,
+            batch_size=int(config.get("batch_size", DEFAULT_BATCH_SIZE)),
+            poll_seconds=float(config.get("poll_seconds", DEFAULT_POLL_SECONDS)),
+            batch_window_seconds=float(config.get("batch_window_seconds", DEFAULT_BATCH_WINDOW_SECONDS)),
+            retry_base_seconds=float(config.get("retry_base_seconds", DEFAULT_RETRY_BASE_SECONDS)),
+            retry_max_seconds=float(config.get("retry_max_seconds", DEFAULT_RETRY_MAX_SECONDS)),
+        )
+
+    def wake(self) -> None:
+        """Ask for a delivery pass soon, after the batch window lets concurrent submissions accumulate."""
+        self._wake.set()
+
+    def run_once(self) -> int:
+        """Send every due job (up to ``batch_size``) and return how many were fetched from the outbox."""
+        jobs = self.repository.get_due_notifications(self.batch_size)
+        if not jobs:
+            return 0
+
+        jobs_by_source: Dict[str, List[Job]] = {}
+        for job in jobs:
+            jobs_by_source.setdefault(job.source, []).append(job)
+        messages = self.notifier.recap_messages(jobs_by_source)
+        for part, (payload, message_jobs) in enumerate(messages):
+            if not self.notifier.send_payload(payload):
+                failed = [job.id for _, later_jobs in messages[part:] for job in later_jobs]
+                self.repository.defer_notifications(failed, self.retry_base_seconds, self.retry_max_seconds)
+                OUTBOX_DELIVERIES.inc("deferred", amount=len(failed))
+                self.logger.warning("Notification delivery failed, %s job(s) kept in the outbox", len(failed))
+                break
+            if message_jobs:
+                self.repository.complete_notifications([job.id for job in message_jobs])
+                OUTBOX_DELIVERIES.inc("delivered", amount=len(message_jobs))
+        return len(jobs)
+
+    def run_forever(self) -> None:
+        while not self._stop.is_set():
+            try:
+                fetched = self.run_once()
+            except Exception as exc:
+                self.logger.error("Notification outbox pass failed: %s", exc)
+                fetched = 0
+            if fetched >= self.batch_size:
+                continue
+            if self._wake.wait(self.poll_seconds) and not self._stop.is_set():
+                self._wake.clear()
+                self._stop.wait(self.batch_window_seconds)
+
+    def start(self) -> threading.Thread:
+        self._thread = threading.Thread(target=self.run_forever, name="notification-outbox", daemon=True)
+        self._thread.start()
+        return self._thread
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
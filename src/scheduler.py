@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import logging
+import random
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional
+
+
+@dataclass
+class ScheduledSource:
+    name: str
+    interval: float
+    jitter: float = 0.0
+    next_run: float = 0.0
+
+
+class ScrapeScheduler:
+    def __init__(
+        self,
+        run_sources: Callable[[List[str]], bool],
+        sources: List[ScheduledSource],
+        busy_retry_seconds: float = 60,
+        max_sleep_seconds: float = 30,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.run_sources = run_sources
+        self.sources: Dict[str, ScheduledSource] = {source.name: source for source in sources}
+        self.busy_retry_seconds = busy_retry_seconds
+        self.max_sleep_seconds = max_sleep_seconds
+        self.clock = clock
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+        now = self.clock()
+        for source in self.sources.values():
+            source.next_run = now + random.uniform(0, source.jitter)
+
+    def run_pending(self) -> List[str]:
+        now = self.clock()
+        due = [name for name, source in self.sources.items() if source.next_run <= now]
+        if not due:
+            return []
+
+        try:
+            ran = self.run_sources(due)
+        except Exception as exc:
+            self.logger.error("Scheduled scrape failed (%s): %s", ", ".join(due), exc)
+            ran = True
+
+        if not ran:
+            self.logger.info("Scrape already running, deferring %s", ", ".join(due))
+            for name in due:
+                self.sources[name].next_run = now + self.busy_retry_seconds
+            return []
+
+        finished = self.clock()
+        for name in due:
+            source = self.sources[name]
+            offset = random.uniform(-source.jitter, source.jitter)
+            source.next_run = finished + max(0.0, source.interval + offset)
+        return due
+
+    def run_forever(self) -> None:
+        self.logger.info(
+            "Scheduler started: %s",
+            ", ".join(f"{name} every {source.interval / 60:.0f} min" for name, source in self.sources.items()),
+        )
+        while not self._stop.is_set():
+            self.run_pending()
+            self._stop.wait(self._seconds_until_next_run())
+
+    def start(self) -> threading.Thread:
+        self._thread = threading.Thread(target=self.run_forever, name="scrape-scheduler", daemon=True)
+        self._thread.start()
+        return self._thread
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def _seconds_until_next_run(self) -> float:
+        if not self.sources:
+            return self.max_sleep_seconds
+        next_run = min(source.next_run for source in self.sources.values())
+        return min(self.max_sleep_seconds, max(0.0, next_run - self.clock()))
@@ -1,9 +1,15 @@
 from __future__ import annotations
 
+import logging
 from abc import ABC, abstractmethod
+from contextlib import nullcontext
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import List, Optional
+from typing import ContextManager, Iterator, List, Optional, Union
+
+from .telemetry import ScrapeStats
+from ..utils.deduplication import generate_job_hash
+from ..utils.page_archive import PageArchive
 
 
 @dataclass
@@ -23,15 +29,42 @@ class JobOffer:
 
 
 class BaseScraper(ABC):
+    archive: Optional[PageArchive] = None
+    stats: Optional[ScrapeStats] = None
+
     @property
     @abstractmethod
     def source_name(self) -> str:
         raise NotImplementedError
 
     @abstractmethod
-    def scrape(self) -> List[JobOffer]:
+    def iter_offers(self) -> Iterator[JobOffer]:
         raise NotImplementedError
 
+    def scrape(self) -> List[JobOffer]:
+        return list(self.iter_offers())
+
     @abstractmethod
     def is_available(self) -> bool:
         raise NotImplementedError
+
+    def _archive_payload(self, offer: JobOffer, kind: str, content: Union[str, bytes]) -> None:
+        if self.archive is None:
+            return
+        try:
+            self.archive.store(generate_job_hash(offer.url, offer.title, offer.company), kind, content)
+        except (OSError, ValueError) as exc:
+            logging.getLogger(self.__class__.__name__).warning(
+                "Failed to archive %s for %s: %s", kind, offer.url, exc
+            )
+
+    def _timed(self, stage: str) -> ContextManager[None]:
+        return self.stats.timed(stage) if self.stats is not None else nullcontext()
+
+    def _count_bytes(self, count: int) -> None:
+        if self.stats is not None:
+            self.stats.add_bytes(count)
+
+    def _count_rate_limit(self) -> None:
+        if self.stats is not None:
+            self.stats.add_rate_limit_event()
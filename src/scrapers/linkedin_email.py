@@ -1,22 +1,63 @@
 from __future__ import annotations
 
+import base64
 import logging
 import random
 import re
 import time
-from typing import Callable, Dict, List, Optional, Tuple, TypedDict
+from datetime import datetime, timedelta
+from typing import Callable, Dict, Iterator, List, Optional, Tuple, TypedDict
+from urllib.parse import urlparse
 
 import requests
-from bs4 import BeautifulSoup
 from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
 from googleapiclient.discovery import build
+from googleapiclient.errors import HttpError
+from lxml import etree
 
 from .base_scraper import BaseScraper, JobOffer
+from .pacing import AimdPacer, CircuitBreaker
+from .telemetry import CONFIG, DETAIL_FETCH, GMAIL, PARSE
 from ..utils.deduplication import normalize_url
+from ..utils.metrics import timed
+from ..utils.page_archive import ALERT_EMAIL, JOB_PAGE, PageArchive
 
 
 SCOPES = ["https://www.googleapis.com/auth/gmail.modify"]
+TOKEN_REFRESH_MARGIN = timedelta(minutes=5)
+
+
+def _part_fields(depth: int) -> str:
+    fields = "partId,mimeType,body(data,attachmentId)"
+    if depth > 0:
+        fields += f",parts({_part_fields(depth - 1)})"
+    return fields
+
+
+# Drops the headers, snippet and message metadata, but not the other parts: every inline body (text/plain
+# alternatives included) still comes back, because Gmail cannot return one inline part on its own.
+MESSAGE_FIELDS = f"payload({_part_fields(4)})"
+
+NON_TEXT_TAGS = {"script", "style", "template"}
+JOB_LINK_XPATH = "//a[contains(@href, 'linkedin.com/jobs/view')]"
+DESCRIPTION_XPATHS = [
+    "(//div[contains(@class, 'show-more-less-html__markup')])[1]",
+    "(//div[contains(@class, 'description__text')])[1]",
+    "(//div[contains(@class, 'jobs-description-content__text')])[1]",
+    "(//section[@id='job-details'])[1]",
+]
+CRITERIA_ITEM_XPATH = (
+    "//li[contains(concat(' ', normalize-space(@class), ' '), ' description__job-criteria-item ')]"
+)
+CRITERIA_LABEL_XPATH = (
+    "(.//h3[contains(@class, 'description__job-criteria-subheader')]"
+    " | .//span[contains(@class, 'description__job-criteria-subheader')])[1]"
+)
+CRITERIA_VALUE_XPATH = (
+    "(.//span[contains(@class, 'description__job-criteria-text')]"
+    " | .//p[contains(@class, 'description__job-criteria-text')])[1]"
+)
 
 DEFAULT_USER_AGENTS = [
     "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
@@ -46,6 +87,14 @@ class LinkedInEmailScraper(BaseScraper):
         li_at_cookie: Optional[str] = None,
         session: Optional[requests.Session] = None,
         cookie_alert_callback: Optional[Callable[[str], bool]] = None,
+        history_id: Optional[str] = None,
+        min_delay_between_requests: float = 5,
+        max_delay_between_requests: float = 120,
+        rate_limit_cooldown_minutes: int = 60,
+        block_cooldown_minutes: int = 360,
+        archive: Optional[PageArchive] = None,
+        gmail_api_endpoint: Optional[str] = None,
+        job_page_base_url: Optional[str] = None,
     ) -> None:
         self.email_label = email_label
         self.max_emails_per_run = max_emails_per_run
@@ -53,14 +102,29 @@ class LinkedInEmailScraper(BaseScraper):
         self.token_path = token_path
         self.fetch_details_enabled = fetch_details
         self.delay_between_requests = delay_between_requests
+        self.pacer = AimdPacer(
+            delay=delay_between_requests,
+            min_delay=min(min_delay_between_requests, delay_between_requests),
+            max_delay=max(max_delay_between_requests, delay_between_requests),
+        )
+        self.breaker = CircuitBreaker()
+        self.rate_limit_cooldown = timedelta(minutes=rate_limit_cooldown_minutes)
+        self.block_cooldown = timedelta(minutes=block_cooldown_minutes)
         self.max_fetches_per_run = max_fetches_per_run
         self.user_agents = user_agents or DEFAULT_USER_AGENTS
         self.li_at_cookie = li_at_cookie.strip() if li_at_cookie else None
         self.session = session or requests.Session()
         self.cookie_alert_callback = cookie_alert_callback
+        self.archive = archive
+        self.gmail_api_endpoint = gmail_api_endpoint
+        self.job_page_base_url = job_page_base_url.rstrip("/") if job_page_base_url else None
         self.cookie_alert_sent = False
         self.cookie_issue_detected = False
         self.last_fetch_count = 0
+        self.history_id = history_id
+        self.last_history_id: Optional[str] = None
+        self._credentials: Optional[Credentials] = None
+        self._service = None
         self.logger = logging.getLogger(self.__class__.__name__)
 
     @property
@@ -73,72 +137,100 @@ class LinkedInEmailScraper(BaseScraper):
         except Exception:
             return False
 
-    def scrape(self) -> List[JobOffer]:
+    def iter_offers(self) -> Iterator[JobOffer]:
         self.cookie_issue_detected = False
         self.cookie_alert_sent = False
         self.last_fetch_count = 0
-        service = self._build_service()
+        self.last_history_id = None
+        with self._timed(CONFIG):
+            service = self._build_service()
         if service is None:
             self.logger.warning("Gmail service not available, skipping LinkedIn emails")
-            return []
-
-        label_id = self._resolve_label_id(service, self.email_label)
-        if label_id is None:
-            self.logger.warning("Label '%s' not found, using INBOX", self.email_label)
-            label_id = "INBOX"
+            return
 
-        messages = self._list_messages(service, label_id)
-        if not messages:
-            return []
+        with self._timed(GMAIL):
+            label_id = self._resolve_label_id(service, self.email_label)
+            if label_id is None:
+                self.logger.warning("Label '%s' not found, using INBOX", self.email_label)
+                label_id = "INBOX"
+            messages, next_history_id = self._list_new_messages(service, label_id)
 
-        offers: List[JobOffer] = []
-        message_ids_to_mark: List[str] = []
         for message_id in messages:
-            html = self._get_message_html(service, message_id)
-            if not html:
+            with self._timed(GMAIL):
+                html = self._get_message_html(service, message_id)
+            if html:
+                with self._timed(PARSE):
+                    offers = self._parse_jobs_from_html(html)
+                for offer in offers:
+                    self._archive_payload(offer, ALERT_EMAIL, html)
+                    yield offer
+            with self._timed(GMAIL):
                 self._mark_as_read(service, message_id)
-                continue
 
-            offers.extend(self._parse_jobs_from_html(html))
-            message_ids_to_mark.append(message_id)
-
-        if not offers:
-            return []
-
-        offers = self.fetch_job_details(offers)
-
-        if not self.cookie_issue_detected:
-            for message_id in message_ids_to_mark:
-                self._mark_as_read(service, message_id)
-
-        return offers
+        self.last_history_id = next_history_id
 
     def fetch_job_details(self, offers: List[JobOffer], max_fetches: Optional[int] = None) -> List[JobOffer]:
+        return list(self.iter_job_details(offers, max_fetches))
+
+    def iter_job_details(self, offers: List[JobOffer], max_fetches: Optional[int] = None) -> Iterator[JobOffer]:
         self.last_fetch_count = 0
         if not offers:
-            return []
+            return
         if not self.fetch_details_enabled:
-            return offers
+            yield from offers
+            return
         if not self.li_at_cookie:
             self._mark_offers_failed(offers)
             self._notify_cookie_issue("missing")
-            return offers
+            yield from offers
+            return
         limit = self.max_fetches_per_run if max_fetches is None else max_fetches
         if limit <= 0:
-            return offers
-        return self._fetch_job_details(offers, limit)
+            yield from offers
+            return
+        if not self.breaker.allow_request():
+            self.logger.warning("LinkedIn circuit open until %s, skipping detail fetches", self.breaker.opened_until)
+            yield from offers
+            return
+        yield from self._iter_job_details(offers, limit)
 
-    def _build_service(self):
-        try:
-            creds = Credentials.from_authorized_user_file(self.token_path, SCOPES)
-        except Exception:
-            self.logger.error("Missing Gmail token file: %s", self.token_path)
-            return None
+    def fetch_state(self) -> Dict[str, object]:
+        return {"breaker": self.breaker.to_dict(), "delay": self.pacer.delay}
+
+    def restore_fetch_state(self, state: Dict[str, object]) -> None:
+        self.breaker = CircuitBreaker.from_dict(state.get("breaker") or {})
+        delay = state.get("delay")
+        if delay is not None:
+            self.pacer.delay = min(self.pacer.max_delay, max(self.pacer.min_delay, float(delay)))
 
-        if creds and creds.expired and creds.refresh_token:
+    def _build_service(self):
+        if self._credentials is None:
+            try:
+                self._credentials = Credentials.from_authorized_user_file(self.token_path, SCOPES)
+            except Exception:
+                self.logger.error("Missing Gmail token file: %s", self.token_path)
+                return None
+
+        creds = self._credentials
+        if self._needs_refresh(creds) and creds.refresh_token:
             creds.refresh(Request())
 
-        return build("gmail", "v1", credentials=creds)
+        if self._service is None:
+            client_options = {"api_endpoint": self.gmail_api_endpoint} if self.gmail_api_endpoint else None
+            self._service = build(
+                "gmail",
+                "v1",
+                credentials=creds,
+                static_discovery=True,
+                cache_discovery=False,
+                client_options=client_options,
+            )
+        return self._service
+
+    def _needs_refresh(self, creds: Credentials) -> bool:
+        if not creds.token or creds.expiry is None:
+            return not creds.valid
+        return creds.expiry - datetime.utcnow() < TOKEN_REFRESH_MARGIN
 
     def _resolve_label_id(self, service, label_name: str) -> Optional[str]:
         results = service.users().labels().list(userId="me").execute()
@@ -147,48 +239,131 @@ class LinkedInEmailScraper(BaseScraper):
                 return label.get("id")
         return None
 
+    def _list_new_messages(self, service, label_id: str) -> Tuple[List[str], Optional[str]]:
+        if self.history_id:
+            result = self._list_history_messages(service, label_id, self.history_id)
+            if result is not None:
+                return result
+            self.logger.info("Gmail history %s expired, falling back to full label listing", self.history_id)
+
+        current_history_id = self._get_current_history_id(service)
+        return self._list_messages(service, label_id), current_history_id
+
+    def _list_history_messages(
+        self, service, label_id: str, start_history_id: str
+    ) -> Optional[Tuple[List[str], Optional[str]]]:
+        message_ids: List[str] = []
+        seen = set()
+        page_token: Optional[str] = None
+        latest_history_id: Optional[str] = None
+        previous_record_id = start_history_id
+
+        while True:
+            try:
+                results = (
+                    service.users()
+                    .history()
+                    .list(
+                        userId="me",
+                        startHistoryId=start_history_id,
+                        labelId=label_id,
+                        historyTypes=["messageAdded"],
+                        pageToken=page_token,
+                    )
+                    .execute()
+                )
+            except HttpError as exc:
+                if exc.resp.status == 404:
+                    return None
+                raise
+
+            latest_history_id = str(results.get("historyId") or latest_history_id or start_history_id)
+            for record in results.get("history", []):
+                for added in record.get("messagesAdded", []):
+                    message = added.get("message", {})
+                    message_id = message.get("id")
+                    if not message_id or message_id in seen:
+                        continue
+                    if label_id not in (message.get("labelIds") or [label_id]):
+                        continue
+                    if len(message_ids) >= self.max_emails_per_run:
+                        return message_ids, previous_record_id
+                    seen.add(message_id)
+                    message_ids.append(message_id)
+                previous_record_id = str(record.get("id", start_history_id))
+
+            page_token = results.get("nextPageToken")
+            if not page_token:
+                break
+
+        return message_ids, latest_history_id
+
+    def _get_current_history_id(self, service) -> Optional[str]:
+        try:
+            profile = service.users().getProfile(userId="me").execute()
+        except Exception as exc:
+            self.logger.warning("Failed to read Gmail history id: %s", exc)
+            return None
+        history_id = profile.get("historyId")
+        return str(history_id) if history_id else None
+
     def _list_messages(self, service, label_id: str) -> List[str]:
         results = (
             service.users()
             .messages()
-            .list(userId="me", labelIds=[label_id], q="is:unread", maxResults=self.max_emails_per_run)
+            .list(userId="me", labelIds=[label_id], maxResults=self.max_emails_per_run)
             .execute()
         )
         return [msg["id"] for msg in results.get("messages", [])]
 
     def _get_message_html(self, service, message_id: str) -> Optional[str]:
-        message = service.users().messages().get(userId="me", id=message_id, format="full").execute()
-        payload = message.get("payload", {})
-        html_part = self._extract_html(payload)
-        if html_part:
-            return html_part
-        return None
+        message = (
+            service.users()
+            .messages()
+            .get(userId="me", id=message_id, format="full", fields=MESSAGE_FIELDS)
+            .execute()
+        )
+        part = self._find_html_part(message.get("payload", {}))
+        if not part:
+            return None
 
-    def _extract_html(self, payload: dict) -> Optional[str]:
-        mime_type = payload.get("mimeType")
-        body = payload.get("body", {})
+        body = part.get("body", {})
         data = body.get("data")
+        if not data and body.get("attachmentId"):
+            attachment = (
+                service.users()
+                .messages()
+                .attachments()
+                .get(userId="me", messageId=message_id, id=body["attachmentId"])
+                .execute()
+            )
+            data = attachment.get("data")
+        if not data:
+            return None
+        raw = base64.urlsafe_b64decode(data.encode("utf-8"))
+        self._count_bytes(len(raw))
+        return raw.decode("utf-8", errors="ignore")
 
-        if mime_type == "text/html" and data:
-            import base64
-
-            return base64.urlsafe_b64decode(data.encode("utf-8")).decode("utf-8", errors="ignore")
+    def _find_html_part(self, payload: dict) -> Optional[dict]:
+        body = payload.get("body", {})
+        if payload.get("mimeType") == "text/html" and (body.get("data") or body.get("attachmentId")):
+            return payload
 
         for part in payload.get("parts", []) or []:
-            html = self._extract_html(part)
-            if html:
-                return html
+            found = self._find_html_part(part)
+            if found:
+                return found
         return None
 
     def _parse_jobs_from_html(self, html: str) -> List[JobOffer]:
-        soup = BeautifulSoup(html, "lxml")
+        root = self._parse_html(html)
         offers: List[JobOffer] = []
         seen_urls = set()
+        if root is None:
+            return offers
 
-        for link in soup.find_all("a", href=True):
-            href = link["href"]
-            if "linkedin.com/jobs/view" not in href:
-                continue
+        for link in root.xpath(JOB_LINK_XPATH):
+            href = link.get("href")
             url = self._normalize_href(href)
             if url in seen_urls:
                 continue
@@ -235,14 +410,14 @@ class LinkedInEmailScraper(BaseScraper):
         for attr in ["aria-label", "title"]:
             if link.get(attr):
                 return link.get(attr).strip()
-        text = link.get_text(" ", strip=True)
+        text = " ".join(self._stripped_strings(link))
         return text if text else None
 
     def _extract_block_text(self, link) -> str:
-        parent = link.parent
-        if not parent:
+        parent = link.getparent()
+        if parent is None:
             return ""
-        text = " ".join(parent.stripped_strings)
+        text = " ".join(self._stripped_strings(parent))
         text = re.sub(r"\s+", " ", text).strip()
         return text
 
@@ -255,60 +430,66 @@ class LinkedInEmailScraper(BaseScraper):
         location = parts[1] if len(parts) > 1 else None
         return company, location
 
-    def _fetch_job_details(self, offers: List[JobOffer], max_fetches: int) -> List[JobOffer]:
-        updated: List[JobOffer] = []
+    def _iter_job_details(self, offers: List[JobOffer], max_fetches: int) -> Iterator[JobOffer]:
         fetch_count = 0
 
         for index, offer in enumerate(offers):
             if fetch_count >= max_fetches:
                 offer.detail_status = "pending"
-                updated.append(offer)
+                yield offer
                 continue
 
-            html, status = self._fetch_linkedin_page(offer.url)
+            with self._timed(DETAIL_FETCH):
+                html, status = self._fetch_linkedin_page(offer.url)
             if status == "ok" and html:
-                details = self._parse_job_page(html)
-                description = details.get("description")
-                if description:
-                    offer.description = description
-                contract_type = details.get("contract_type")
-                if contract_type:
-                    offer.contract_type = contract_type
-                salary_min = details.get("salary_min")
-                if salary_min is not None:
-                    offer.salary_min = salary_min
-                salary_max = details.get("salary_max")
-                if salary_max is not None:
-                    offer.salary_max = salary_max
-                offer.detail_status = "fetched"
-            elif status == "auth":
-                offer.detail_status = "failed"
-                updated.append(offer)
-                self._notify_cookie_issue("expired")
-                for remaining in offers[index + 1 :]:
-                    remaining.detail_status = "failed"
-                    updated.append(remaining)
-                self.last_fetch_count = fetch_count
-                return updated
-            elif status == "rate_limited":
-                offer.detail_status = "failed"
-                updated.append(offer)
-                self.logger.warning("LinkedIn rate limited (429). Stopping fetches for this run.")
-                for remaining in offers[index + 1 :]:
-                    remaining.detail_status = "failed"
-                    updated.append(remaining)
-                self.last_fetch_count = fetch_count
-                return updated
+                self._archive_payload(offer, JOB_PAGE, html)
+                with self._timed(PARSE):
+                    self.apply_job_page(offer, html)
+                self.breaker.record_success()
+                self.pacer.on_success()
+            elif status in ("auth", "rate_limited", "blocked"):
+                if status == "auth":
+                    self._notify_cookie_issue("expired")
+                else:
+                    cooldown = self.block_cooldown if status == "blocked" else self.rate_limit_cooldown
+                    self.breaker.record_failure(cooldown)
+                    self.pacer.on_throttle()
+                    self.logger.warning(
+                        "LinkedIn %s. Circuit open until %s, next delay %.1fs.",
+                        "blocked the session (999)" if status == "blocked" else "rate limited (429)",
+                        self.breaker.opened_until,
+                        self.pacer.delay,
+                    )
+                for remaining in offers[index:]:
+                    remaining.detail_status = "pending"
+                    yield remaining
+                return
             else:
                 offer.detail_status = "failed"
 
-            updated.append(offer)
             fetch_count += 1
-            time.sleep(self.delay_between_requests)
+            self.last_fetch_count = fetch_count
+            yield offer
+            time.sleep(self.pacer.delay)
 
-        self.last_fetch_count = fetch_count
-        return updated
+    def apply_job_page(self, offer: JobOffer, html: str) -> JobOffer:
+        details = self._parse_job_page(html)
+        description = details.get("description")
+        if description:
+            offer.description = description
+        contract_type = details.get("contract_type")
+        if contract_type:
+            offer.contract_type = contract_type
+        salary_min = details.get("salary_min")
+        if salary_min is not None:
+            offer.salary_min = salary_min
+        salary_max = details.get("salary_max")
+        if salary_max is not None:
+            offer.salary_max = salary_max
+        offer.detail_status = "fetched"
+        return offer
 
+    @timed()
     def _fetch_linkedin_page(self, url: str) -> Tuple[Optional[str], str]:
         if not self.li_at_cookie:
             return None, "auth"
@@ -319,6 +500,10 @@ class LinkedInEmailScraper(BaseScraper):
             "Connection": "keep-alive",
         }
 
+        if self.job_page_base_url:
+            parsed = urlparse(url)
+            url = f"{self.job_page_base_url}{parsed.path}"
+
         try:
             response = self.session.get(
                 url,
@@ -331,6 +516,9 @@ class LinkedInEmailScraper(BaseScraper):
             self.logger.warning("LinkedIn fetch failed for %s: %s", url, exc)
             return None, "error"
 
+        self._count_bytes(len(response.content))
+        if response.status_code in (429, 999):
+            self._count_rate_limit()
         if response.status_code == 200:
             if "linkedin.com/login" in response.url or "linkedin.com/signup" in response.url:
                 return None, "auth"
@@ -347,10 +535,12 @@ class LinkedInEmailScraper(BaseScraper):
         return None, "error"
 
     def _parse_job_page(self, html: str) -> "JobDetails":
-        soup = BeautifulSoup(html, "lxml")
+        root = self._parse_html(html)
+        if root is None:
+            return {}
 
-        description = self._extract_description(soup)
-        criteria = self._extract_criteria(soup)
+        description = self._extract_description(root)
+        criteria = self._extract_criteria(root)
         contract_type = criteria.get("contract_type")
         salary_text = criteria.get("salary")
         salary_min, salary_max = self._parse_salary_range(salary_text or "")
@@ -366,30 +556,24 @@ class LinkedInEmailScraper(BaseScraper):
             details["salary_max"] = salary_max
         return details
 
-    def _extract_description(self, soup: BeautifulSoup) -> str:
-        selectors = [
-            ("div", {"class": re.compile(r"show-more-less-html__markup")}),
-            ("div", {"class": re.compile(r"description__text")}),
-            ("div", {"class": re.compile(r"jobs-description-content__text")}),
-            ("section", {"id": "job-details"}),
-        ]
-        for tag, attrs in selectors:
-            node = soup.find(tag, attrs=attrs)
-            if node:
-                text = node.get_text(" ", strip=True)
+    def _extract_description(self, root) -> str:
+        for xpath in DESCRIPTION_XPATHS:
+            nodes = root.xpath(xpath)
+            if nodes:
+                text = " ".join(self._stripped_strings(nodes[0]))
                 if text:
                     return self._clean_text(text)
         return ""
 
-    def _extract_criteria(self, soup: BeautifulSoup) -> Dict[str, str]:
+    def _extract_criteria(self, root) -> Dict[str, str]:
         criteria: Dict[str, str] = {}
-        for item in soup.select("li.description__job-criteria-item"):
-            label = item.find(["h3", "span"], class_=re.compile(r"description__job-criteria-subheader"))
-            value = item.find(["span", "p"], class_=re.compile(r"description__job-criteria-text"))
-            if not label or not value:
+        for item in root.xpath(CRITERIA_ITEM_XPATH):
+            labels = item.xpath(CRITERIA_LABEL_XPATH)
+            values = item.xpath(CRITERIA_VALUE_XPATH)
+            if not labels or not values:
                 continue
-            label_text = label.get_text(" ", strip=True).lower()
-            value_text = value.get_text(" ", strip=True)
+            label_text = " ".join(self._stripped_strings(labels[0])).lower()
+            value_text = " ".join(self._stripped_strings(values[0]))
             if ("type" in label_text and "contrat" in label_text) or "employment" in label_text or "emploi" in label_text:
                 criteria["contract_type"] = value_text
             if "salary" in label_text or "salaire" in label_text:
@@ -397,6 +581,31 @@ class LinkedInEmailScraper(BaseScraper):
 
         return criteria
 
+    def _parse_html(self, html: str):
+        if not html or not html.strip():
+            return None
+        parser = etree.HTMLParser(encoding="utf-8")
+        try:
+            return etree.fromstring(html.encode("utf-8", errors="ignore"), parser)
+        except etree.LxmlError:
+            return None
+
+    def _stripped_strings(self, node) -> Iterator[str]:
+        for text in self._iter_text(node):
+            text = text.strip()
+            if text:
+                yield text
+
+    def _iter_text(self, node) -> Iterator[str]:
+        if not isinstance(node.tag, str) or node.tag in NON_TEXT_TAGS:
+            return
+        if node.text:
+            yield node.text
+        for child in node:
+            yield from self._iter_text(child)
+            if child.tail:
+                yield child.tail
+
     def _parse_salary_range(self, text: str) -> Tuple[Optional[int], Optional[int]]:
         if not text:
             return None, None
@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, Dict, Optional
+
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+MAX_COOLDOWN = timedelta(hours=48)
+
+
+@dataclass
+class CircuitBreaker:
+    state: str = CLOSED
+    opened_until: Optional[datetime] = None
+    trips: int = 0
+
+    def allow_request(self, now: Optional[datetime] = None) -> bool:
+        now = now or datetime.utcnow()
+        if self.state == OPEN:
+            if self.opened_until and now < self.opened_until:
+                return False
+            self.state = HALF_OPEN
+        return True
+
+    def record_success(self) -> None:
+        self.state = CLOSED
+        self.opened_until = None
+        self.trips = 0
+
+    def record_failure(self, cooldown: timedelta, now: Optional[datetime] = None) -> None:
+        now = now or datetime.utcnow()
+        self.trips += 1
+        backoff = min(cooldown * (2 ** (self.trips - 1)), MAX_COOLDOWN)
+        self.state = OPEN
+        self.opened_until = now + backoff
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "state": self.state,
+            "opened_until": self.opened_until.isoformat() if self.opened_until else None,
+            "trips": self.trips,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "CircuitBreaker":
+        opened_until = data.get("opened_until")
+        return cls(
+            state=data.get("state", CLOSED),
+            opened_until=datetime.fromisoformat(opened_until) if opened_until else None,
+            trips=int(data.get("trips", 0)),
+        )
+
+
+@dataclass
+class AimdPacer:
+    delay: float
+    min_delay: float
+    max_delay: float
+    decrease_step: float = 1.0
+    backoff_factor: float = 2.0
+
+    def on_success(self) -> None:
+        self.delay = max(self.min_delay, self.delay - self.decrease_step)
+
+    def on_throttle(self) -> None:
+        self.delay = min(self.max_delay, self.delay * self.backoff_factor)
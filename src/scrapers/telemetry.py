@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator
+
+
+CONFIG = "config"
+SEARCH = "search"
+GMAIL = "gmail"
+DETAIL_FETCH = "detail_fetch"
+PARSE = "parse"
+DB_WRITE = "db_write"
+SCORING = "scoring"
+
+
+class ScrapeStats:
+    """Per-source counters for one scrape cycle, shared by the scraper and the DB writer threads."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.stage_seconds: Dict[str, float] = {}
+        self.bytes_downloaded = 0
+        self.rate_limit_events = 0
+
+    @contextmanager
+    def timed(self, stage: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_time(stage, time.perf_counter() - start)
+
+    def add_time(self, stage: str, seconds: float) -> None:
+        with self._lock:
+            self.stage_seconds[stage] = self.stage_seconds.get(stage, 0.0) + seconds
+
+    def add_bytes(self, count: int) -> None:
+        with self._lock:
+            self.bytes_downloaded += count
+
+    def add_rate_limit_event(self) -> None:
+        with self._lock:
+            self.rate_limit_events += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "stage_seconds": {stage: round(seconds, 4) for stage, seconds in self.stage_seconds.items()},
+                "bytes_downloaded": self.bytes_downloaded,
+                "rate_limit_events": self.rate_limit_events,
+            }
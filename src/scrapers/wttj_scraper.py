@@ -4,12 +4,14 @@ import json
 import logging
 import re
 import time
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional
 
 import requests
-from bs4 import BeautifulSoup
 
 from .base_scraper import BaseScraper, JobOffer
+from .telemetry import CONFIG, PARSE, SEARCH
+from ..utils.metrics import timed
+from ..utils.page_archive import ALGOLIA_HIT, PageArchive
 
 
 class WttjScraper(BaseScraper):
@@ -22,6 +24,8 @@ class WttjScraper(BaseScraper):
         max_pages: int = 5,
         delay_between_requests: int = 2,
         session: Optional[requests.Session] = None,
+        archive: Optional[PageArchive] = None,
+        algolia_url: Optional[str] = None,
     ) -> None:
         self.base_url = base_url.rstrip("/")
         self.search_queries = search_queries
@@ -30,6 +34,8 @@ class WttjScraper(BaseScraper):
         self.max_pages = max_pages
         self.delay_between_requests = delay_between_requests
         self.session = session or requests.Session()
+        self.archive = archive
+        self.algolia_url = algolia_url.rstrip("/") if algolia_url else None
         self.logger = logging.getLogger(self.__class__.__name__)
         self._algolia_config: Optional[Dict[str, str]] = None
         self.session.headers.update(
@@ -49,18 +55,15 @@ class WttjScraper(BaseScraper):
         except requests.RequestException:
             return False
 
-    def scrape(self) -> List[JobOffer]:
+    def iter_offers(self) -> Iterator[JobOffer]:
         if not self._ensure_algolia_config():
             self.logger.warning("Algolia config unavailable, skipping WTTJ scraping")
-            return []
+            return
 
-        offers: List[JobOffer] = []
         for query in self.search_queries:
-            offers.extend(self._scrape_query(query))
-        return offers
+            yield from self._iter_query(query)
 
-    def _scrape_query(self, query: str) -> List[JobOffer]:
-        offers: List[JobOffer] = []
+    def _iter_query(self, query: str) -> Iterator[JobOffer]:
         page = 0
         while page < self.max_pages:
             payload = self._algolia_search(query, page)
@@ -69,12 +72,12 @@ class WttjScraper(BaseScraper):
                 break
 
             for hit in hits:
-                job = self._hit_to_job(hit)
-                if not job:
-                    continue
-                if self._should_skip(job):
-                    continue
-                offers.append(job)
+                with self._timed(PARSE):
+                    job = self.hit_to_job(hit)
+                    if not job or self._should_skip(job):
+                        continue
+                self._archive_payload(job, ALGOLIA_HIT, json.dumps(hit, sort_keys=True, ensure_ascii=False))
+                yield job
 
             nb_pages = payload.get("nbPages", 0)
             if nb_pages and page >= nb_pages - 1:
@@ -83,14 +86,14 @@ class WttjScraper(BaseScraper):
             page += 1
             time.sleep(self.delay_between_requests)
 
-        return offers
-
     def _ensure_algolia_config(self) -> bool:
         if self._algolia_config:
             return True
 
         try:
-            response = self.session.get(f"{self.base_url}/en/jobs", timeout=15)
+            with self._timed(CONFIG):
+                response = self.session.get(f"{self.base_url}/en/jobs", timeout=15)
+            self._count_bytes(len(response.content))
             response.raise_for_status()
         except requests.RequestException as exc:
             self.logger.error("Failed to load WTTJ page: %s", exc)
@@ -117,13 +120,15 @@ class WttjScraper(BaseScraper):
         match = re.search(pattern, text)
         return match.group(1) if match else None
 
+    @timed()
     def _algolia_search(self, query: str, page: int) -> Dict[str, Any]:
         assert self._algolia_config is not None
         app_id = self._algolia_config["app_id"]
         api_key = self._algolia_config["api_key"]
         index = self._algolia_config["index"]
 
-        url = f"https://{app_id}-dsn.algolia.net/1/indexes/{index}/query"
+        algolia_url = self.algolia_url or f"https://{app_id}-dsn.algolia.net"
+        url = f"{algolia_url}/1/indexes/{index}/query"
         headers = {
             "X-Algolia-Application-Id": app_id,
             "X-Algolia-API-Key": api_key,
@@ -138,14 +143,20 @@ class WttjScraper(BaseScraper):
         }
 
         try:
-            response = self.session.post(url, headers=headers, data=json.dumps(body), timeout=20)
+            with self._timed(SEARCH):
+                response = self.session.post(url, headers=headers, data=json.dumps(body), timeout=20)
+            self._count_bytes(len(response.content))
             response.raise_for_status()
             return response.json()
         except requests.RequestException as exc:
+            if exc.response is not None and exc.response.status_code == 429:
+                self._count_rate_limit()
+            if exc.response is not None and exc.response.status_code in (401, 403):
+                self._algolia_config = None
             self.logger.error("Algolia search failed: %s", exc)
             return {}
 
-    def _hit_to_job(self, hit: Dict[str, Any]) -> Optional[JobOffer]:
+    def hit_to_job(self, hit: Dict[str, Any]) -> Optional[JobOffer]:
         title = self._first_value(hit, ["title", "name", "job_title"])
         company = self._first_value(hit, ["company_name", "organization_name", "company", "organization"])
         if isinstance(company, dict):
@@ -215,6 +226,8 @@ class WttjScraper(BaseScraper):
 
     def _clean_text(self, text: str) -> str:
         if "<" in text and ">" in text:
+            from bs4 import BeautifulSoup
+
             soup = BeautifulSoup(text, "lxml")
             text = soup.get_text(" ")
         return " ".join(text.split())
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import hashlib
+import re
+import unicodedata
 from typing import Optional
 from urllib.parse import parse_qs, urlencode, urlparse, urlunparse
 
@@ -33,3 +35,19 @@ def generate_job_hash(url: str, title: Optional[str] = None, company: Optional[s
         raise ValueError("Cannot generate hash: url or title+company required")
 
     return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+def generate_content_fingerprint(
+    title: Optional[str], company: Optional[str], description: Optional[str]
+) -> Optional[str]:
+    """Hash of the normalized title, company and description, shared by reposts of the same offer under new URLs."""
+    if not description or not description.strip():
+        return None
+    content = "|".join(_normalize_content(value) for value in (title, company, description))
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+def _normalize_content(value: Optional[str]) -> str:
+    text = unicodedata.normalize("NFKD", value or "")
+    text = "".join(ch for ch in text if not unicodedata.combining(ch)).lower()
+    return " ".join(re.findall(r"\w+", text))
@@ -0,0 +1,212 @@
+from __future__ import annotations
+
+import functools
+import threading
+import time
+from bisect import bisect_left
+from typing import Callable, Dict, Iterable, List, Optional, Tuple, TypeVar
+
+F = TypeVar("F", bound=Callable)
+
+DEFAULT_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+LabelValues = Tuple[str, ...]
+
+
+class Counter:
+    def __init__(self, name: str, documentation: str, labelnames: Iterable[str] = ()) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values: Dict[LabelValues, float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, *labels: str, amount: float = 1.0) -> None:
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0.0) + amount
+
+    def value(self, *labels: str) -> float:
+        return self._values.get(labels, 0.0)
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} counter"]
+        with self._lock:
+            items = sorted(self._values.items())
+        for labels, value in items:
+            lines.append(f"{self.name}{_format_labels(self.labelnames, labels)} {_format_value(value)}")
+        return lines
+
+
+class Histogram:
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Iterable[str] = (),
+        buckets: Tuple[float, ...] = DEFAULT_BUCKETS,
+    ) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(sorted(buckets))
+        self._series: Dict[LabelValues, List[float]] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, *labels: str) -> None:
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(labels)
+            if series is None:
+                # One slot per bucket, then +Inf, sum and count.
+                series = self._series[labels] = [0.0] * (len(self.buckets) + 3)
+            series[index] += 1
+            series[-2] += value
+            series[-1] += 1
+
+    def count(self, *labels: str) -> int:
+        series = self._series.get(labels)
+        return int(series[-1]) if series else 0
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            items = sorted((labels, list(series)) for labels, series in self._series.items())
+        for labels, series in items:
+            cumulative = 0.0
+            for bound, hits in zip(self.buckets + (float("inf"),), series):
+                cumulative += hits
+                bucket_labels = _format_labels(self.labelnames + ("le",), labels + (_format_bound(bound),))
+                lines.append(f"{self.name}_bucket{bucket_labels} {_format_value(cumulative)}")
+            suffix = _format_labels(self.labelnames, labels)
+            lines.append(f"{self.name}_sum{suffix} {series[-2]!r}")
+            lines.append(f"{self.name}_count{suffix} {_format_value(series[-1])}")
+        return lines
+
+
+class Registry:
+    def __init__(self) -> None:
+        self._metrics: Dict[str, object] = {}
+        self._lock = threading.Lock()
+
+    def counter(self, name: str, documentation: str, labelnames: Iterable[str] = ()) -> Counter:
+        return self._get_or_create(name, lambda: Counter(name, documentation, labelnames))
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Iterable[str] = (),
+        buckets: Tuple[float, ...] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        return self._get_or_create(name, lambda: Histogram(name, documentation, labelnames, buckets))
+
+    def render(self) -> str:
+        with self._lock:
+            metrics = list(self._metrics.values())
+        lines: List[str] = []
+        for metric in metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+    def _get_or_create(self, name: str, factory: Callable):
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = self._metrics[name] = factory()
+            return metric
+
+
+REGISTRY = Registry()
+
+FUNCTION_DURATION = REGISTRY.histogram(
+    "jobhunter_function_duration_seconds", "Time spent in instrumented functions.", ("function",)
+)
+FUNCTION_ERRORS = REGISTRY.counter(
+    "jobhunter_function_errors_total", "Exceptions raised by instrumented functions.", ("function",)
+)
+HTTP_DURATION = REGISTRY.histogram(
+    "jobhunter_http_request_duration_seconds", "API request latency.", ("method", "route", "status")
+)
+
+
+def timed(name: Optional[str] = None) -> Callable[[F], F]:
+    """Record call latency and exceptions of the decorated function in FUNCTION_DURATION/FUNCTION_ERRORS."""
+
+    def decorator(func: F) -> F:
+        label = name or func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            except Exception:
+                FUNCTION_ERRORS.inc(label)
+                raise
+            finally:
+                FUNCTION_DURATION.observe(time.perf_counter() - start, label)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
+
+
+def instrument_methods(*, exclude: Iterable[str] = ()) -> Callable[[type], type]:
+    """Class decorator applying ``timed`` to every public method defined on the class."""
+    skipped = set(exclude)
+
+    def decorator(cls: type) -> type:
+        for attr, value in list(vars(cls).items()):
+            if attr.startswith("_") or attr in skipped or not callable(value):
+                continue
+            setattr(cls, attr, timed(f"{cls.__name__}.{attr}")(value))
+        return cls
+
+    return decorator
+
+
+class MetricsMiddleware:
+    """ASGI middleware timing each HTTP request, labelled by route template rather than raw path."""
+
+    def __init__(self, app) -> None:
+        self.app = app
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status = "500"
+
+        async def send_wrapper(message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = str(message["status"])
+            await send(message)
+
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            route = scope.get("route")
+            path = getattr(route, "path", None) or "unmatched"
+            HTTP_DURATION.observe(time.perf_counter() - start, scope["method"], path, status)
+
+
+def _format_labels(names: Tuple[str, ...], values: LabelValues) -> str:
+    if not names:
+        return ""
+    pairs = ",".join(f'{name}="{_escape(value)}"' for name, value in zip(names, values))
+    return "{" + pairs + "}"
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_bound(bound: float) -> str:
+    return "+Inf" if bound == float("inf") else repr(bound)
+
+
+def _format_value(value: float) -> str:
+    return str(int(value)) if value == int(value) else repr(value)
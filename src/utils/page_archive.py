@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import gzip
+import hashlib
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Iterator, Optional, Union
+
+
+ALERT_EMAIL = "alert_email"
+JOB_PAGE = "job_page"
+ALGOLIA_HIT = "algolia_hit"
+
+
+class PageArchive:
+    def __init__(self, root: Union[str, Path]) -> None:
+        self.root = Path(root)
+        self.objects_path = self.root / "objects"
+        self.index_path = self.root / "index"
+        self._lock = threading.Lock()
+
+    def store(self, job_hash: str, kind: str, content: Union[str, bytes]) -> str:
+        digest = self.put(content)
+        self.attach(job_hash, kind, digest)
+        return digest
+
+    def load(self, job_hash: str, kind: str) -> Optional[str]:
+        digest = self.refs(job_hash).get(kind)
+        if not digest:
+            return None
+        data = self.get(digest)
+        return data.decode("utf-8", errors="ignore") if data is not None else None
+
+    def put(self, content: Union[str, bytes]) -> str:
+        data = content.encode("utf-8") if isinstance(content, str) else content
+        digest = hashlib.sha256(data).hexdigest()
+        path = self._object_path(digest)
+        if not path.exists():
+            path.parent.mkdir(parents=True, exist_ok=True)
+            self._write_atomic(path, gzip.compress(data))
+        return digest
+
+    def get(self, digest: str) -> Optional[bytes]:
+        path = self._object_path(digest)
+        if not path.exists():
+            return None
+        return gzip.decompress(path.read_bytes())
+
+    def attach(self, job_hash: str, kind: str, digest: str) -> None:
+        with self._lock:
+            refs = self.refs(job_hash)
+            if refs.get(kind) == digest:
+                return
+            refs[kind] = digest
+            path = self.index_path / f"{job_hash}.json"
+            path.parent.mkdir(parents=True, exist_ok=True)
+            self._write_atomic(path, json.dumps(refs, sort_keys=True).encode("utf-8"))
+
+    def refs(self, job_hash: str) -> Dict[str, str]:
+        path = self.index_path / f"{job_hash}.json"
+        if not path.exists():
+            return {}
+        return json.loads(path.read_text(encoding="utf-8"))
+
+    def job_hashes(self) -> Iterator[str]:
+        if not self.index_path.exists():
+            return
+        for path in sorted(self.index_path.glob("*.json")):
+            yield path.stem
+
+    def prune(self, days: int) -> int:
+        cutoff = time.time() - days * 86400
+        removed = 0
+        with self._lock:
+            referenced = set()
+            for path in list(self.index_path.glob("*.json")) if self.index_path.exists() else []:
+                if path.stat().st_mtime < cutoff:
+                    path.unlink()
+                    removed += 1
+                    continue
+                referenced.update(json.loads(path.read_text(encoding="utf-8")).values())
+
+            for path in list(self.objects_path.glob("*/*.gz")) if self.objects_path.exists() else []:
+                if path.name[:-3] not in referenced:
+                    path.unlink()
+        return removed
+
+    def _object_path(self, digest: str) -> Path:
+        return self.objects_path / digest[:2] / f"{digest}.gz"
+
+    def _write_atomic(self, path: Path, data: bytes) -> None:
+        tmp_path = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, path)
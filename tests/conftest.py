@@ -0,0 +1,66 @@
+import itertools
+from typing import Callable, List, Optional
+
+import pytest
+
+from src.database.repository import DatabaseManager
+from src.scrapers.base_scraper import JobOffer
+
+
+@pytest.fixture()
+def repository(tmp_path) -> DatabaseManager:
+    repository = DatabaseManager(str(tmp_path / "jobs.db"))
+    repository.init_db()
+    return repository
+
+
+@pytest.fixture()
+def make_offer() -> Callable[..., JobOffer]:
+    """Build a WTTJ offer whose URL and external id derive from ``key``."""
+
+    def make(
+        key: str, title: str = "Data Analyst", company: str = "Example", description: str = "Power BI"
+    ) -> JobOffer:
+        return JobOffer(
+            source="wttj",
+            external_id=key,
+            url=f"https://example.com/jobs/{key}",
+            title=title,
+            company=company,
+            location="Paris",
+            contract_type="CDI",
+            salary_min=None,
+            salary_max=None,
+            description=description,
+        )
+
+    return make
+
+
+@pytest.fixture()
+def seed_jobs(repository, make_offer) -> Callable[..., List[int]]:
+    """Add ``count`` WTTJ offers and return their ids.
+
+    Titles default to ``Data Analyst 0``, ``Data Analyst 1``, ... With ``score``, the jobs also get keyword scores
+    ``score``, ``score + step``, ... in insertion order.
+    """
+    keys = itertools.count()
+
+    def seed(
+        count: int = 3,
+        score: Optional[float] = None,
+        step: float = 0.0,
+        title: Optional[str] = None,
+        company: str = "Example",
+        description: str = "Power BI",
+    ) -> List[int]:
+        offers = []
+        for _ in range(count):
+            key = next(keys)
+            offers.append(make_offer(str(key), title or f"Data Analyst {key}", company, description))
+        job_ids = [job.id for job, _ in repository.add_job_offers(offers)]
+        if score is not None:
+            repository.update_keyword_scores({job_id: score + step * index for index, job_id in enumerate(job_ids)})
+        return job_ids
+
+    return seed
@@ -0,0 +1,49 @@
+from types import SimpleNamespace
+
+from src.matcher import ai_scorer
+from src.matcher.ai_scorer import PromptCache, build_scoring_prompt
+
+
+def _job(job_hash="h1", description="Power BI et SQL."):
+    return SimpleNamespace(
+        hash=job_hash,
+        title="Data Analyst",
+        company="Example",
+        location="Paris",
+        contract_type="CDI",
+        description=description,
+    )
+
+
+def _profile():
+    return {"skills": {"required": [{"keyword": "Power BI"}], "important": [{"keyword": "SQL"}]}}
+
+
+def test_cached_prompt_matches_uncached_and_builds_summary_once(monkeypatch):
+    calls = []
+    original = ai_scorer._build_profile_summary
+    monkeypatch.setattr(ai_scorer, "_build_profile_summary", lambda profile: calls.append(1) or original(profile))
+    cache = PromptCache()
+    profile = _profile()
+
+    prompts = [cache.get(_job(), profile) for _ in range(3)] + [cache.get(_job("h2"), profile)]
+
+    assert len(calls) == 1
+    assert len(set(prompts[:3])) == 1
+    assert prompts[0] == build_scoring_prompt(_job(), profile)
+
+
+def test_cache_invalidates_on_profile_or_description_change_and_stays_bounded():
+    cache = PromptCache(max_entries=2)
+    profile = _profile()
+    first = cache.get(_job(), profile)
+
+    assert cache.get(_job(description="Tableau."), profile) != first
+
+    edited = _profile()
+    edited["skills"]["important"].append({"keyword": "DAX"})
+    assert "DAX" in cache.get(_job(), edited)
+
+    for index in range(5):
+        cache.get(_job(f"extra-{index}"), edited)
+    assert len(cache) == 2
@@ -0,0 +1,87 @@
+from sqlalchemy import text
+
+from src.matcher.ai_scorer import build_scoring_prompt
+from src.matcher.compaction import compact_description, description_shingles, relevance_terms, split_sections
+
+PROFILE = {"skills": {"required": [{"keyword": "Power BI"}], "important": [{"keyword": "SQL", "aliases": ["PostgreSQL"]}]}}
+INTRO = "Example est le leader européen de la logistique du dernier kilomètre depuis quinze ans."
+PERKS = "Nous offrons une mutuelle prise en charge à cent pour cent et des tickets restaurant."
+
+
+def test_split_sections_cuts_sentences_and_bullets_but_merges_fragments():
+    sections = split_sections("Vos missions : • Construire des dashboards Power BI. • Requêtes SQL avancées. Top.")
+
+    assert sections == ["Vos missions : • Construire des dashboards Power BI.", "• Requêtes SQL avancées. Top."]
+
+
+def test_company_boilerplate_is_stripped_but_relevant_shared_sections_survive(repository, make_offer):
+    shared_stack = "Vous maîtrisez Power BI et le SQL au quotidien avec les équipes métier."
+    offers = [
+        make_offer(str(index), description=f"{INTRO} {mission} {shared_stack} {PERKS}")
+        for index, mission in enumerate(
+            [
+                "Vous piloterez le reporting des flux de livraison en Île-de-France.",
+                "Vous accompagnerez la direction financière sur le suivi des coûts de transport.",
+            ]
+        )
+    ]
+    other = make_offer("other", company="Other", description=f"{INTRO} {PERKS}")
+    repository.record_description_shingles(offers + [other])
+
+    frequencies = repository.get_shingle_frequencies("Example", description_shingles(offers[0].description))
+    compacted = compact_description(offers[0].description, relevance_terms(PROFILE), 500, frequencies)
+
+    assert INTRO not in compacted and PERKS not in compacted
+    assert "reporting des flux" in compacted
+    assert shared_stack in compacted
+
+
+def test_budget_keeps_late_requirements_over_early_filler(make_offer):
+    filler = " ".join(f"Notre histoire commence en {year} avec une équipe passionnée." for year in range(1900, 1960))
+    description = f"{filler} Profil recherché : vous maîtrisez Power BI, DAX et PostgreSQL."
+
+    prompt = build_scoring_prompt(make_offer("late", description=description), PROFILE, description_tokens=100)
+
+    assert "Power BI, DAX et PostgreSQL" in prompt
+    assert len(compact_description(description, relevance_terms(PROFILE), 100)) <= 400
+
+
+def test_cross_posted_offer_is_counted_once(repository, make_offer):
+    mission = "Vous piloterez le reporting des flux de livraison en Île-de-France."
+    description = f"{INTRO} {mission} {PERKS}"
+    repository.record_description_shingles([make_offer("wttj-1", description=description)])
+    repository.record_description_shingles(
+        [make_offer("linkedin-1", description=description), make_offer("repost", description=description)]
+    )
+
+    frequencies = repository.get_shingle_frequencies("Example", description_shingles(description))
+    compacted = compact_description(description, relevance_terms(PROFILE), 500, frequencies)
+
+    assert [scope.documents for scope in frequencies] == [1, 1]
+    assert mission in compacted
+
+
+def test_cleanup_uncounts_descriptions_of_deleted_jobs(repository, make_offer):
+    kept = make_offer("kept", description=f"{INTRO} Mission de reporting.")
+    expired = make_offer("old", description=f"{INTRO} {PERKS}")
+    results = repository.add_job_offers([kept, expired])
+    repository.record_description_shingles([kept, expired])
+    with repository.engine.begin() as conn:
+        conn.execute(text("UPDATE jobs SET scraped_at = '2000-01-01' WHERE id = :id"), {"id": results[1][0].id})
+
+    repository.cleanup_old_jobs(30)
+
+    frequencies = repository.get_shingle_frequencies("Example", description_shingles(expired.description))
+    assert [scope.documents for scope in frequencies] == [1, 1]
+    assert all(count == 1 for scope in frequencies for count in scope.counts.values())
+    assert not any(shingle in frequencies[0].counts for shingle in description_shingles(PERKS))
+
+    with repository.engine.begin() as conn:
+        conn.execute(text("UPDATE jobs SET scraped_at = '2000-01-01'"))
+    repository.cleanup_old_jobs(30)
+
+    with repository.engine.connect() as conn:
+        assert [
+            conn.execute(text(f"SELECT COUNT(*) FROM {table}")).scalar()
+            for table in ("shingle_documents", "shingle_scopes", "shingle_counts")
+        ] == [0, 0, 0]
@@ -0,0 +1,69 @@
+from datetime import datetime, timedelta
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+
+from src.api.routes import create_app
+
+SETTINGS = {"scoring": {"keyword_prefilter_threshold": 30}}
+
+
+@pytest.fixture()
+def setup(repository, seed_jobs):
+    (job_id,) = seed_jobs(1, score=50.0)
+    return TestClient(create_app(SETTINGS, {}, repository, None)), repository, job_id
+
+
+def test_unchanged_poll_gets_304_without_running_queries(setup, monkeypatch):
+    client, repository, job_id = setup
+    first = client.get("/api/jobs/pending")
+    etag = first.headers["etag"]
+
+    def fail(*args, **kwargs):
+        raise AssertionError("pending query should not run for a fresh cache entry")
+
+    monkeypatch.setattr(repository, "get_pending_jobs", fail)
+    cached = client.get("/api/jobs/pending", headers={"If-None-Match": etag})
+
+    assert cached.status_code == 304
+    assert cached.content == b""
+    assert cached.headers["etag"] == etag
+    monkeypatch.undo()
+    assert client.get("/api/jobs/pending?limit=5", headers={"If-None-Match": etag}).status_code != 304
+
+
+def test_writes_and_lapsed_leases_change_the_validators(setup):
+    client, repository, job_id = setup
+    stats_etag = client.get("/api/stats").headers["etag"]
+    pending_etag = client.get("/api/jobs/pending").headers["etag"]
+
+    repository.claim_jobs("agent", 30, limit=1, ttl_seconds=60)
+    assert client.get("/api/stats", headers={"If-None-Match": stats_etag}).status_code == 200
+    assert client.get("/api/jobs/pending").json() == []
+    leased_etag = client.get("/api/jobs/pending").headers["etag"]
+    assert leased_etag != pending_etag
+
+    # Time passing is not a write: simulate the lease lapsing behind the repository's back.
+    with repository.engine.begin() as conn:
+        conn.execute(text("UPDATE jobs SET lease_expires_at = :at"), {"at": datetime.utcnow() - timedelta(seconds=1)})
+
+    released = client.get("/api/jobs/pending", headers={"If-None-Match": leased_etag})
+    assert released.status_code == 200
+    assert [row["id"] for row in released.json()] == [job_id]
+
+
+def test_if_modified_since(setup):
+    client, repository, _ = setup
+    with repository.engine.begin() as conn:
+        conn.execute(
+            text("UPDATE sync_state SET updated_at = :then WHERE key = 'db_generation'"),
+            {"then": datetime(2026, 1, 1, 12, 0, 0, 500000)},
+        )
+
+    last_modified = client.get("/api/stats").headers["last-modified"]
+
+    assert last_modified == "Thu, 01 Jan 2026 12:00:00 GMT"
+    assert client.get("/api/stats", headers={"If-Modified-Since": last_modified}).status_code == 304
+    stale = client.get("/api/stats", headers={"If-Modified-Since": "Thu, 01 Jan 2026 11:59:59 GMT"})
+    assert stale.status_code == 200
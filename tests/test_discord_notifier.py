@@ -0,0 +1,99 @@
+import httpx
+
+from src.database.models import Job
+from src.fakes.server import FakeServices, FakeServicesConfig
+from src.notifier import discord_notifier
+from src.notifier.discord_notifier import (
+    MAX_EMBED_DESCRIPTION,
+    MAX_EMBEDS_PER_MESSAGE,
+    MAX_MESSAGE_EMBED_CHARS,
+    DiscordNotifier,
+)
+
+WEBHOOK_URL = "https://discord.test/api/webhooks/1/token"
+
+
+def _notifier(handler, **config):
+    client = httpx.Client(transport=httpx.MockTransport(handler))
+    return DiscordNotifier({"enabled": True, "webhook_url": WEBHOOK_URL, **config}, client=client)
+
+
+def _job(index: int, source: str) -> Job:
+    return Job(
+        id=index,
+        source=source,
+        url=f"https://example.com/{source}/{index}",
+        title=f"Data Analyst Power BI {index}",
+        company="Example",
+        location="Paris",
+        contract_type="CDI",
+        final_score=90 - index % 20,
+        ai_reasoning="Stack Power BI / SQL alignée avec le profil, mission orientée reporting. " * 3,
+    )
+
+
+def test_large_recap_is_split_into_compliant_messages():
+    jobs_by_source = {
+        "wttj": [_job(index, "wttj") for index in range(120)],
+        "linkedin": [_job(index, "linkedin") for index in range(5)],
+    }
+
+    messages = _notifier(lambda request: httpx.Response(204)).recap_messages(jobs_by_source)
+
+    assert len(messages) > 1
+    listed = []
+    for payload, jobs in messages:
+        embeds = payload["embeds"]
+        assert len(embeds) <= MAX_EMBEDS_PER_MESSAGE
+        assert sum(len(embed["title"]) + len(embed["description"]) for embed in embeds) <= MAX_MESSAGE_EMBED_CHARS
+        lines = []
+        for embed in embeds:
+            assert len(embed["description"]) <= MAX_EMBED_DESCRIPTION
+            lines.extend(line for line in embed["description"].splitlines() if line.startswith("**") and "](" in line)
+        assert [job.url for job in jobs] == [line.rsplit("](", 1)[1].split(")", 1)[0] for line in lines]
+        listed.extend(jobs)
+    assert len(listed) == 125
+    assert messages[-1][0]["embeds"][-1]["title"].startswith("── LinkedIn")
+
+
+def test_rate_limited_message_is_retried_after_the_advertised_wait(monkeypatch):
+    sleeps = []
+    monkeypatch.setattr(discord_notifier.time, "sleep", sleeps.append)
+    responses = [
+        httpx.Response(429, json={"message": "You are being rate limited.", "retry_after": 1.5, "global": False}),
+        httpx.Response(204, headers={"X-RateLimit-Remaining": "0", "X-RateLimit-Reset-After": "2"}),
+        httpx.Response(204),
+    ]
+    notifier = _notifier(lambda request: responses.pop(0))
+
+    assert notifier.send_message("first")
+    assert notifier.send_message("second")
+
+    assert not responses
+    assert len(sleeps) == 2
+    assert 1.4 < sleeps[0] <= 1.5
+    assert 1.9 < sleeps[1] <= 2
+
+
+def test_gives_up_when_the_rate_limit_outlasts_the_retry_budget(monkeypatch):
+    monkeypatch.setattr(discord_notifier.time, "sleep", lambda seconds: None)
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        return httpx.Response(429, headers={"Retry-After": "600", "X-RateLimit-Global": "true"})
+
+    assert not _notifier(handler, max_retry_wait_seconds=30).send_message("hello")
+    assert len(calls) == 1
+
+
+def test_notifier_stays_within_the_fake_webhook_bucket():
+    with FakeServices(FakeServicesConfig(discord_bucket_size=2, discord_bucket_seconds=0.2)) as services:
+        notifier = DiscordNotifier({"enabled": True, "webhook_url": services.discord_webhook_url})
+        try:
+            assert all(notifier.send_message(f"message {index}") for index in range(5))
+        finally:
+            notifier.close()
+
+        assert [message["content"] for message in services.discord_messages] == [f"message {i}" for i in range(5)]
+        assert services.requests["discord_429"] == 0
@@ -0,0 +1,42 @@
+import json
+
+from src import main as main_module
+from src.database.repository import DatabaseManager
+from src.fakes.server import FakeServices, FakeServicesConfig
+from src.notifier.discord_notifier import DiscordNotifier
+
+
+def _settings():
+    return {
+        "scraping": {
+            "wttj": {"enabled": True, "search_queries": ["Data Analyst"], "max_pages": 2},
+            "linkedin": {"enabled": True, "max_fetches_per_run": 10, "rate_limit_cooldown_minutes": 1},
+        },
+        "database": {"cleanup_days": 30},
+    }
+
+
+def test_scrape_cycle_runs_end_to_end_against_fake_services(tmp_path, monkeypatch):
+    config = FakeServicesConfig(algolia_pages=2, hits_per_page=5, emails=3, jobs_per_email=4, rate_limit_every=6)
+    with FakeServices(config) as services:
+        settings = services.apply_to_settings(_settings())
+        monkeypatch.setenv("GMAIL_TOKEN_PATH", str(services.write_gmail_token(tmp_path / "token.json")))
+        monkeypatch.setenv("LINKEDIN_LI_AT_COOKIE", "fake-cookie")
+        repository = DatabaseManager(str(tmp_path / "jobs.db"))
+        repository.init_db()
+        run_id = repository.start_scrape_run("all")
+
+        result = main_module.run_scrape_cycle(settings, {"skills": {}}, repository, run_id=run_id)
+
+        assert result["jobs_new"] == 10 + 12
+        assert repository.get_sync_state(main_module.LINKEDIN_HISTORY_KEY) == "1003"
+        assert services.stats()["read_messages"] == 3
+        assert services.requests["linkedin"] == 6
+        rows = {row.source: row for row in repository.get_source_runs([run_id])[run_id]}
+        assert rows["linkedin"].rate_limit_events == 1
+        assert "detail_fetch" in json.loads(rows["linkedin"].stage_timings)
+        assert json.loads(repository.get_sync_state(main_module.LINKEDIN_FETCH_STATE_KEY))["breaker"]["state"] == "open"
+
+        notifier = DiscordNotifier({"enabled": True, "webhook_url": services.discord_webhook_url})
+        assert notifier.send_message("hello")
+        assert services.discord_messages == [{"content": "hello"}]
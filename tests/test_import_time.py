@@ -0,0 +1,34 @@
+import os
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+IMPORT_BUDGET_US = int(os.getenv("IMPORT_TIME_BUDGET_US", "900000"))
+LAZY_MODULES = {"uvicorn", "fastapi", "googleapiclient", "google.oauth2", "bs4", "src.api.routes"}
+
+IMPORTTIME_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$")
+
+
+def _import_times(module: str) -> dict:
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        if match:
+            times[match.group(4)] = int(match.group(2))
+    return times
+
+
+def test_cli_import_skips_heavy_dependencies_and_stays_within_budget():
+    times = _import_times("src.main")
+
+    assert not LAZY_MODULES & set(times)
+    assert times["src.main"] < IMPORT_BUDGET_US
@@ -0,0 +1,153 @@
+import asyncio
+import threading
+
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+
+from src.api.events import JobEventSignal, job_event_stream
+from src.api.routes import create_app
+
+
+class FakeRequest:
+    def __init__(self):
+        self.disconnected = False
+
+    async def is_disconnected(self):
+        return self.disconnected
+
+
+def _stream(repository, cursor, poll_seconds, request=None):
+    signal = JobEventSignal()
+    repository.subscribe_job_events(signal.notify)
+    return signal, job_event_stream(request or FakeRequest(), repository, signal, cursor, poll_seconds)
+
+
+def test_only_scores_above_threshold_are_published(repository, seed_jobs):
+    ids = seed_jobs()
+
+    repository.update_keyword_scores({ids[0]: 10.0, ids[1]: 30.0}, publish_threshold=30)
+    repository.update_keyword_scores({ids[2]: 80.0})
+
+    assert [event.job_id for event in repository.get_job_events(0)] == [ids[1]]
+
+
+def test_stream_resumes_after_cursor(repository, seed_jobs):
+    ids = seed_jobs()
+    repository.update_keyword_scores({job_id: 50.0 for job_id in ids}, publish_threshold=30)
+    first_event = repository.get_job_events(0)[0].id
+
+    async def scenario():
+        _, stream = _stream(repository, first_event, poll_seconds=0.01)
+        assert (await anext(stream)).startswith("retry:")
+        assert await anext(stream) == (
+            f'id: {first_event + 1}\nevent: job\ndata: {{"job_id": {ids[1]}, "keyword_score": 50.0}}\n\n'
+        )
+        assert (await anext(stream)).startswith(f"id: {first_event + 2}\n")
+        assert await anext(stream) == ": keepalive\n\n"
+
+    asyncio.run(scenario())
+
+
+def test_stream_wakes_up_on_publish_from_another_thread(repository, seed_jobs):
+    ids = seed_jobs(1)
+
+    async def scenario():
+        _, stream = _stream(repository, repository.latest_job_event_id(), poll_seconds=30)
+        await anext(stream)
+        timer = threading.Timer(0.05, repository.update_keyword_scores, ({ids[0]: 90.0}, 30))
+        timer.start()
+        try:
+            assert f'"job_id": {ids[0]}' in await asyncio.wait_for(anext(stream), 5)
+        finally:
+            timer.cancel()
+
+    asyncio.run(scenario())
+
+
+def test_stream_ends_on_shutdown_and_disconnect(repository):
+
+    async def scenario():
+        signal, stream = _stream(repository, 0, poll_seconds=30)
+        await anext(stream)
+        asyncio.get_running_loop().call_later(0.05, signal.close)
+        assert [chunk async for chunk in stream] == []
+
+        request = FakeRequest()
+        _, stream = _stream(repository, 0, poll_seconds=0.01, request=request)
+        await anext(stream)
+        request.disconnected = True
+        assert [chunk async for chunk in stream] == []
+
+    asyncio.run(scenario())
+
+
+def test_empty_fetch_waits_instead_of_spinning(repository, seed_jobs):
+    ids = seed_jobs(1)
+    repository.update_keyword_scores({ids[0]: 90.0}, 30)
+    fetches = []
+    get_job_events = repository.get_job_events
+    repository.get_job_events = lambda after_id: fetches.append(after_id) or get_job_events(after_id)
+
+    async def scenario():
+        signal, stream = _stream(repository, repository.latest_job_event_id(), poll_seconds=0.05)
+        await anext(stream)
+        # The event row is gone (cleanup), yet publishes keep signalling: each wake-up costs one fetch.
+        with repository.engine.begin() as conn:
+            conn.execute(text("DELETE FROM job_events"))
+        signal.notify(signal.last_id + 1)
+        assert await anext(stream) == ": keepalive\n\n"
+
+    asyncio.run(scenario())
+    assert len(fetches) <= 3
+
+
+def test_job_event_ids_are_not_reused_after_cleanup(repository, seed_jobs):
+    ids = seed_jobs(2)
+    repository.update_keyword_scores({ids[0]: 90.0}, 30)
+    last = repository.latest_job_event_id()
+    with repository.engine.begin() as conn:
+        conn.execute(text("DELETE FROM job_events"))
+
+    repository.update_keyword_scores({ids[1]: 90.0}, 30)
+
+    assert repository.get_job_events(0)[0].id > last
+
+
+def test_init_db_rebuilds_job_events_with_autoincrement(repository, seed_jobs):
+    ids = seed_jobs(1)
+    with repository.engine.begin() as conn:
+        conn.execute(text("DROP TABLE job_events"))
+        conn.execute(
+            text(
+                "CREATE TABLE job_events "
+                "(id INTEGER PRIMARY KEY, job_id INTEGER NOT NULL, keyword_score FLOAT, created_at DATETIME)"
+            )
+        )
+        conn.execute(text("INSERT INTO job_events (id, job_id, keyword_score) VALUES (7, :id, 90)"), {"id": ids[0]})
+
+    repository.init_db()
+
+    with repository.engine.connect() as conn:
+        ddl = conn.execute(text("SELECT sql FROM sqlite_master WHERE name = 'job_events'")).scalar()
+    assert "AUTOINCREMENT" in ddl
+    assert [event.id for event in repository.get_job_events(0)] == [7]
+
+
+def test_only_new_event_ids_wake_the_streams():
+    async def scenario():
+        signal = JobEventSignal()
+        signal.bind(asyncio.get_running_loop())
+        for last_id in (5, 5, 3, 6):
+            signal.notify(last_id)
+        await asyncio.sleep(0)
+        return signal.version, signal.last_id
+
+    assert asyncio.run(scenario()) == (2, 6)
+
+
+def test_app_shutdown_unsubscribes_its_event_listener(repository):
+    for _ in range(2):
+        with TestClient(create_app({}, {}, repository, None)):
+            pass
+
+    assert repository._job_event_listeners == []
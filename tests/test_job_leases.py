@@ -0,0 +1,55 @@
+from datetime import datetime, timedelta
+
+from fastapi.testclient import TestClient
+from sqlalchemy import update
+
+from src.api.routes import create_app
+from src.database.models import Job
+
+SETTINGS = {
+    "scoring": {"keyword_prefilter_threshold": 30, "ai_scoring_threshold": 101, "weights": {"ai_score": 1.0}},
+    "api": {"lease_ttl_seconds": 600},
+}
+
+
+def _client(repository, seed_jobs, count=5):
+    seed_jobs(count, score=50.0, step=1.0)
+    return TestClient(create_app(SETTINGS, {}, repository, None))
+
+
+def test_concurrent_agents_receive_disjoint_jobs(repository, seed_jobs):
+    client = _client(repository, seed_jobs)
+
+    first = client.post("/api/jobs/claim", params={"agent_id": "a", "n": 3}).json()
+    second = client.post("/api/jobs/claim", params={"agent_id": "b", "n": 3}).json()
+
+    first_ids = {job["id"] for job in first["jobs"]}
+    second_ids = {job["id"] for job in second["jobs"]}
+    assert len(first_ids) == 3 and len(second_ids) == 2
+    assert not first_ids & second_ids
+    assert first["lease_expires_at"] is not None
+    assert client.get("/api/jobs/pending").json() == []
+
+
+def test_scores_and_expiry_return_leases(repository, seed_jobs):
+    client = _client(repository, seed_jobs, count=2)
+    claimed = [job["id"] for job in client.post("/api/jobs/claim", params={"agent_id": "a", "n": 2}).json()["jobs"]]
+
+    client.post("/api/jobs/scores", json={"scores": [{"job_id": claimed[0], "ai_score": 40, "reasoning": "meh"}]})
+    with repository.session_scope() as session:
+        session.execute(update(Job).values(lease_expires_at=datetime.utcnow() - timedelta(seconds=1)))
+
+    reclaimed = client.post("/api/jobs/claim", params={"agent_id": "b", "n": 5}).json()["jobs"]
+
+    assert [job["id"] for job in reclaimed] == [claimed[1]]
+    with repository.session_scope() as session:
+        assert session.get(Job, claimed[0]).leased_by is None
+
+
+def test_release_only_frees_the_agents_own_leases(repository, seed_jobs):
+    client = _client(repository, seed_jobs, count=1)
+    job_id = client.post("/api/jobs/claim", params={"agent_id": "a"}).json()["jobs"][0]["id"]
+
+    assert client.post("/api/jobs/release", json={"agent_id": "b", "job_ids": [job_id]}).json() == {"released": 0}
+    assert client.post("/api/jobs/release", json={"agent_id": "a", "job_ids": [job_id]}).json() == {"released": 1}
+    assert [job["id"] for job in client.get("/api/jobs/pending").json()] == [job_id]
@@ -0,0 +1,68 @@
+import json
+
+import pytest
+from fastapi.testclient import TestClient
+
+from src.api import responses
+from src.api.routes import create_app
+
+SETTINGS = {"scoring": {"keyword_prefilter_threshold": 30}}
+
+
+@pytest.fixture()
+def client(repository, seed_jobs):
+    seed_jobs(score=50.0, step=1.0, description="Reporting Power BI et requêtes SQL pour les équipes finance. " * 20)
+    return TestClient(create_app(SETTINGS, {}, repository, None))
+
+
+def test_fields_projection_and_unknown_fields(client):
+    response = client.get("/api/jobs/pending", params={"fields": "id,title"})
+
+    assert response.json() == [
+        {"id": 3, "title": "Data Analyst 2"},
+        {"id": 2, "title": "Data Analyst 1"},
+        {"id": 1, "title": "Data Analyst 0"},
+    ]
+    assert client.get("/api/jobs/pending", params={"fields": "id,salary"}).status_code == 422
+
+
+def test_ndjson_stream_matches_json_listing(client):
+    listing = client.get("/api/jobs/pending").json()
+
+    by_param = client.get("/api/jobs/pending", params={"format": "ndjson"})
+    by_accept = client.get("/api/jobs/pending", headers={"Accept": "application/x-ndjson"})
+
+    assert by_param.headers["content-type"] == "application/x-ndjson"
+    assert [json.loads(line) for line in by_param.text.splitlines()] == listing
+    assert by_accept.text == by_param.text
+    assert listing[0]["prompt"] is None and listing[0]["keyword_score"] == 52.0
+
+
+def test_large_listings_are_compressed(client, monkeypatch):
+    response = client.get("/api/jobs/pending", headers={"Accept-Encoding": "gzip"})
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.json()[0]["id"] == 3
+
+    raw = client.get("/api/jobs/pending", params={"format": "ndjson"}, headers={"Accept-Encoding": "gzip"})
+    assert raw.headers["content-encoding"] == "gzip"
+
+    monkeypatch.setattr(responses, "brotli", None)
+    fallback = client.get("/api/jobs/pending", headers={"Accept-Encoding": "br, gzip"})
+    assert fallback.headers["content-encoding"] == "gzip"
+
+
+def test_brotli_is_preferred_when_available(client):
+    pytest.importorskip("brotli")
+
+    response = client.get("/api/jobs/pending", params={"format": "ndjson"}, headers={"Accept-Encoding": "gzip, br"})
+
+    assert response.headers["content-encoding"] == "br"
+    assert len(response.text.splitlines()) == 3
+
+    listing = client.get("/api/jobs/pending", headers={"Accept-Encoding": "br"})
+    assert listing.headers["content-encoding"] == "br"
+    assert listing.headers["vary"] == "Accept-Encoding"
+    assert listing.json()[0]["id"] == 3
+
+    small = client.get("/api/stats", headers={"Accept-Encoding": "br"})
+    assert "content-encoding" not in small.headers
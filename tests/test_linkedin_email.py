@@ -0,0 +1,192 @@
+from types import SimpleNamespace
+
+from googleapiclient.errors import HttpError
+
+from src.scrapers.linkedin_email import LinkedInEmailScraper
+
+
+class _Call:
+    def __init__(self, result):
+        self._result = result
+
+    def execute(self):
+        if isinstance(self._result, Exception):
+            raise self._result
+        return self._result
+
+
+class _FakeGmail:
+    def __init__(self, history_pages=None, messages=None, profile_history_id="500"):
+        self.history_pages = list(history_pages or [])
+        self.label_messages = messages or []
+        self.profile_history_id = profile_history_id
+        self.history_calls = []
+
+    def users(self):
+        return self
+
+    def history(self):
+        return self
+
+    def messages(self):
+        return SimpleNamespace(
+            list=lambda **kwargs: _Call({"messages": [{"id": msg_id} for msg_id in self.label_messages]})
+        )
+
+    def getProfile(self, userId):
+        return _Call({"historyId": self.profile_history_id})
+
+    def list(self, **kwargs):
+        self.history_calls.append(kwargs)
+        return _Call(self.history_pages.pop(0))
+
+
+def _scraper(history_id=None, max_emails=50):
+    return LinkedInEmailScraper(
+        email_label="LinkedIn Jobs",
+        max_emails_per_run=max_emails,
+        credentials_path="unused",
+        token_path="unused",
+        history_id=history_id,
+    )
+
+
+def test_history_listing_returns_added_messages_and_new_cursor():
+    service = _FakeGmail(
+        history_pages=[
+            {
+                "history": [
+                    {"id": "101", "messagesAdded": [{"message": {"id": "a", "labelIds": ["L1"]}}]},
+                    {"id": "102", "messagesAdded": [{"message": {"id": "b", "labelIds": ["L1"]}}]},
+                ],
+                "nextPageToken": "next",
+                "historyId": "110",
+            },
+            {
+                "history": [
+                    {"id": "103", "messagesAdded": [{"message": {"id": "a", "labelIds": ["L1"]}}]},
+                    {"id": "104", "messagesAdded": [{"message": {"id": "c", "labelIds": ["OTHER"]}}]},
+                ],
+                "historyId": "120",
+            },
+        ]
+    )
+
+    messages, cursor = _scraper(history_id="100")._list_new_messages(service, "L1")
+
+    assert messages == ["a", "b"]
+    assert cursor == "120"
+    assert service.history_calls[0]["startHistoryId"] == "100"
+    assert service.history_calls[1]["pageToken"] == "next"
+
+
+def test_history_listing_stops_at_cap_and_resumes_after_last_full_record():
+    service = _FakeGmail(
+        history_pages=[
+            {
+                "history": [
+                    {"id": "101", "messagesAdded": [{"message": {"id": "a"}}]},
+                    {"id": "102", "messagesAdded": [{"message": {"id": "b"}}]},
+                ],
+                "historyId": "110",
+            }
+        ]
+    )
+
+    messages, cursor = _scraper(history_id="100", max_emails=1)._list_new_messages(service, "L1")
+
+    assert messages == ["a"]
+    assert cursor == "101"
+
+
+def test_expired_history_falls_back_to_label_listing():
+    expired = HttpError(SimpleNamespace(status=404, reason="Not Found"), b"{}")
+    service = _FakeGmail(history_pages=[expired], messages=["x", "y"], profile_history_id="900")
+
+    messages, cursor = _scraper(history_id="1")._list_new_messages(service, "L1")
+
+    assert messages == ["x", "y"]
+    assert cursor == "900"
+
+
+def test_gmail_service_is_built_once_and_reused(monkeypatch):
+    from src.scrapers import linkedin_email
+
+    builds = []
+    creds = SimpleNamespace(token="t", expiry=None, valid=True, refresh_token="r")
+    monkeypatch.setattr(
+        linkedin_email.Credentials, "from_authorized_user_file", staticmethod(lambda path, scopes: creds)
+    )
+    monkeypatch.setattr(linkedin_email, "build", lambda *args, **kwargs: builds.append(kwargs) or object())
+
+    scraper = _scraper()
+    first = scraper._build_service()
+    second = scraper._build_service()
+
+    assert first is second
+    assert len(builds) == 1
+    assert builds[0]["static_discovery"] is True
+
+
+def test_message_html_is_read_from_attachment_when_not_inline():
+    import base64
+
+    html = "<html><body>alert</body></html>"
+    requests = []
+
+    class _Messages:
+        def get(self, **kwargs):
+            requests.append(("get", kwargs))
+            return _Call(
+                {
+                    "payload": {
+                        "mimeType": "multipart/alternative",
+                        "parts": [
+                            {"partId": "0", "mimeType": "text/plain", "body": {"data": "eA=="}},
+                            {"partId": "1", "mimeType": "text/html", "body": {"attachmentId": "att-1"}},
+                        ],
+                    }
+                }
+            )
+
+        def attachments(self):
+            return SimpleNamespace(
+                get=lambda **kwargs: requests.append(("attachment", kwargs))
+                or _Call({"data": base64.urlsafe_b64encode(html.encode()).decode()})
+            )
+
+    service = SimpleNamespace(users=lambda: SimpleNamespace(messages=_Messages))
+
+    assert _scraper()._get_message_html(service, "m1") == html
+    assert "fields" in requests[0][1]
+    assert requests[1] == ("attachment", {"userId": "me", "messageId": "m1", "id": "att-1"})
+
+
+def test_blocked_fetch_opens_circuit_and_keeps_remaining_offers_pending(monkeypatch):
+    from src.scrapers import linkedin_email
+    from src.scrapers.base_scraper import JobOffer
+    from src.scrapers.pacing import OPEN
+
+    monkeypatch.setattr(linkedin_email.time, "sleep", lambda seconds: None)
+    scraper = LinkedInEmailScraper(
+        email_label="LinkedIn Jobs",
+        max_emails_per_run=50,
+        credentials_path="unused",
+        token_path="unused",
+        li_at_cookie="cookie",
+        delay_between_requests=10,
+    )
+    responses = iter([("<html></html>", "ok"), (None, "blocked")])
+    monkeypatch.setattr(scraper, "_fetch_linkedin_page", lambda url: next(responses))
+    offers = [
+        JobOffer("linkedin", None, f"https://www.linkedin.com/jobs/view/{index}", "Job", "Co", None, None, None, None, "")
+        for index in range(3)
+    ]
+
+    updated = scraper.fetch_job_details(offers)
+
+    assert [offer.detail_status for offer in updated] == ["fetched", "pending", "pending"]
+    assert scraper.breaker.state == OPEN
+    assert scraper.pacer.delay == 18
+    assert scraper.fetch_job_details(offers) == offers
+    assert scraper.last_fetch_count == 0
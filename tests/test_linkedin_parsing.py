@@ -0,0 +1,41 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from src.scrapers.linkedin_email import LinkedInEmailScraper
+
+
+FIXTURES = Path(__file__).parent / "fixtures" / "linkedin"
+EXPECTED = json.loads((FIXTURES / "expected.json").read_text(encoding="utf-8"))
+
+
+def _scraper():
+    return LinkedInEmailScraper(
+        email_label="LinkedIn Jobs", max_emails_per_run=50, credentials_path="unused", token_path="unused"
+    )
+
+
+@pytest.mark.parametrize("name", sorted(EXPECTED["alerts"]))
+def test_alert_email_parsing_matches_fixture(name):
+    offers = _scraper()._parse_jobs_from_html((FIXTURES / name).read_text(encoding="utf-8"))
+
+    parsed = [
+        {key: getattr(offer, key) for key in ("url", "title", "company", "location", "description")}
+        for offer in offers
+    ]
+    assert parsed == EXPECTED["alerts"][name]
+
+
+@pytest.mark.parametrize("name", sorted(EXPECTED["job_pages"]))
+def test_job_page_parsing_matches_fixture(name):
+    details = _scraper()._parse_job_page((FIXTURES / name).read_text(encoding="utf-8"))
+
+    assert details == EXPECTED["job_pages"][name]
+
+
+def test_parsers_handle_empty_documents():
+    scraper = _scraper()
+
+    assert scraper._parse_jobs_from_html("") == []
+    assert scraper._parse_job_page("   ") == {}
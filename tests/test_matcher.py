@@ -1,4 +1,4 @@
-from src.matcher.keyword_matcher import calculate_keyword_score
+from src.matcher.keyword_matcher import calculate_keyword_score, calculate_provisional_score
 from src.scrapers.base_scraper import JobOffer
 
 
@@ -50,3 +50,35 @@ def test_keyword_score_positive_match():
 
     score = calculate_keyword_score(job, profile)
     assert score > 0
+
+
+def test_provisional_score_ranks_title_matches_without_required_skills():
+    profile = _profile()
+    profile["search"] = {"job_titles": ["Data Analyst"]}
+    matching = JobOffer(
+        source="linkedin",
+        external_id=None,
+        url="https://example.com/a",
+        title="Data Analyst",
+        company="Example",
+        location=None,
+        contract_type=None,
+        salary_min=None,
+        salary_max=None,
+        description="Data Analyst Example · Paris",
+    )
+    unrelated = JobOffer(
+        source="linkedin",
+        external_id=None,
+        url="https://example.com/b",
+        title="Sales Manager",
+        company="Example",
+        location=None,
+        contract_type=None,
+        salary_min=None,
+        salary_max=None,
+        description="Sales Manager Example · Paris",
+    )
+
+    assert calculate_keyword_score(matching, profile) == 0.0
+    assert calculate_provisional_score(matching, profile) > calculate_provisional_score(unrelated, profile)
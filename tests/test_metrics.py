@@ -0,0 +1,50 @@
+import pytest
+from fastapi.testclient import TestClient
+
+from src.api.routes import create_app
+from src.database.repository import DatabaseManager
+from src.utils.metrics import FUNCTION_DURATION, FUNCTION_ERRORS, Registry, timed
+
+
+def test_histogram_renders_cumulative_buckets():
+    registry = Registry()
+    histogram = registry.histogram("latency_seconds", "Latency.", ("op",), buckets=(0.1, 1.0))
+    histogram.observe(0.05, "read")
+    histogram.observe(0.1, "read")
+    histogram.observe(3.0, "read")
+
+    lines = registry.render().splitlines()
+
+    assert 'latency_seconds_bucket{op="read",le="0.1"} 2' in lines
+    assert 'latency_seconds_bucket{op="read",le="1.0"} 2' in lines
+    assert 'latency_seconds_bucket{op="read",le="+Inf"} 3' in lines
+    assert 'latency_seconds_count{op="read"} 3' in lines
+
+
+def test_timed_counts_errors():
+    @timed("test_metrics.failing")
+    def failing():
+        raise ValueError("boom")
+
+    with pytest.raises(ValueError):
+        failing()
+
+    assert FUNCTION_ERRORS.value("test_metrics.failing") == 1
+    assert FUNCTION_DURATION.count("test_metrics.failing") == 1
+
+
+def test_metrics_endpoint_exposes_handler_and_repository_latency(tmp_path):
+    repository = DatabaseManager(str(tmp_path / "jobs.db"))
+    repository.init_db()
+    client = TestClient(create_app({}, {}, repository, None))
+
+    client.get("/api/stats")
+    response = client.get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    assert (
+        'jobhunter_http_request_duration_seconds_count{method="GET",route="/api/stats",status="200"}'
+        in response.text
+    )
+    assert 'jobhunter_function_duration_seconds_count{function="DatabaseManager.get_stats"}' in response.text
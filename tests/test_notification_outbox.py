@@ -0,0 +1,111 @@
+import json
+import time
+
+import httpx
+from fastapi.testclient import TestClient
+
+from src.api.routes import create_app
+from src.notifier.discord_notifier import DiscordNotifier
+from src.notifier.outbox import NotificationWorker
+
+SETTINGS = {
+    "scoring": {"keyword_prefilter_threshold": 30, "ai_scoring_threshold": 70, "weights": {"ai_score": 1.0}},
+    "notifications": {"outbox": {"poll_seconds": 0.05, "batch_window_seconds": 0.3, "retry_base_seconds": 0}},
+}
+
+
+class Webhook:
+    """MockTransport handler recording delivered payloads; ``fail_after`` messages are accepted before 500s."""
+
+    def __init__(self, fail_after=None):
+        self.payloads = []
+        self.fail_after = fail_after
+
+    def __call__(self, request):
+        if self.fail_after is not None and len(self.payloads) >= self.fail_after:
+            return httpx.Response(500, text="webhook down")
+        self.payloads.append(json.loads(request.content))
+        return httpx.Response(204)
+
+
+def _app(repository, webhook):
+    notifier = DiscordNotifier(
+        {"enabled": True, "webhook_url": "https://discord.test/api/webhooks/1/token"},
+        client=httpx.Client(transport=httpx.MockTransport(webhook)),
+    )
+    return create_app(SETTINGS, {}, repository, notifier)
+
+
+def _scores(job_ids, ai_score=90):
+    return {"scores": [{"job_id": job_id, "ai_score": ai_score, "reasoning": "Power BI et SQL."} for job_id in job_ids]}
+
+
+def test_score_submission_only_enqueues(repository, seed_jobs):
+    webhook = Webhook()
+    app = _app(repository, webhook)
+    job_ids = seed_jobs()
+
+    response = TestClient(app).post("/api/jobs/scores", json=_scores(job_ids[:2]))
+
+    assert response.json() == {"updated": 2}
+    assert webhook.payloads == []
+    assert repository.count_pending_notifications() == 2
+    assert repository.get_stats()["scored"] == 2
+
+
+def test_failed_delivery_stays_in_the_outbox_until_confirmed(repository, seed_jobs):
+    webhook = Webhook(fail_after=0)
+    app = _app(repository, webhook)
+    job_ids = seed_jobs()
+    repository.update_ai_scores(_scores(job_ids)["scores"], SETTINGS["scoring"]["weights"], notify_threshold=70)
+    worker = NotificationWorker(repository, app.state.notifier, retry_base_seconds=0)
+
+    assert worker.run_once() == 3
+    assert repository.count_pending_notifications() == 3
+    assert repository.get_stats()["notified"] == 0
+
+    webhook.fail_after = None
+    worker.run_once()
+
+    assert repository.count_pending_notifications() == 0
+    assert repository.get_stats()["notified"] == 3
+    assert len(webhook.payloads) == 1
+
+
+def test_partially_delivered_recap_only_marks_the_sent_jobs(repository, seed_jobs):
+    webhook = Webhook(fail_after=1)
+    app = _app(repository, webhook)
+    job_ids = seed_jobs(30)
+    repository.update_ai_scores(
+        [{"job_id": job_id, "ai_score": 90, "reasoning": "Power BI et SQL. " * 20} for job_id in job_ids],
+        SETTINGS["scoring"]["weights"],
+        notify_threshold=70,
+    )
+    worker = NotificationWorker(repository, app.state.notifier, retry_base_seconds=3600)
+
+    worker.run_once()
+
+    listed = sum(
+        embed["description"].count("](https://") for payload in webhook.payloads for embed in payload["embeds"]
+    )
+    assert 0 < listed < 30
+    assert repository.get_stats()["notified"] == listed
+    assert repository.count_pending_notifications() == 30 - listed
+    assert repository.get_due_notifications(50) == []
+
+
+def test_background_worker_delivers_submitted_scores(repository, seed_jobs):
+    webhook = Webhook()
+    app = _app(repository, webhook)
+    job_ids = seed_jobs()
+
+    with TestClient(app) as client:
+        client.post("/api/jobs/scores", json=_scores(job_ids))
+        client.post("/api/jobs/scores", json=_scores(job_ids[:1], ai_score=95))
+        deadline = time.monotonic() + 5
+        while repository.count_pending_notifications() and time.monotonic() < deadline:
+            time.sleep(0.05)
+
+    assert repository.get_stats()["notified"] == 3
+    assert repository.count_pending_notifications() == 0
+    assert len(webhook.payloads) == 1
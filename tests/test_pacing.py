@@ -0,0 +1,42 @@
+from datetime import datetime, timedelta
+
+from src.scrapers.pacing import CLOSED, HALF_OPEN, OPEN, AimdPacer, CircuitBreaker
+
+
+def test_circuit_breaker_cycles_through_open_and_half_open():
+    now = datetime(2024, 3, 12, 9, 0)
+    breaker = CircuitBreaker()
+
+    breaker.record_failure(timedelta(hours=1), now=now)
+    assert breaker.state == OPEN
+    assert not breaker.allow_request(now=now + timedelta(minutes=30))
+
+    assert breaker.allow_request(now=now + timedelta(hours=2))
+    assert breaker.state == HALF_OPEN
+
+    breaker.record_failure(timedelta(hours=1), now=now + timedelta(hours=2))
+    assert breaker.opened_until == now + timedelta(hours=4)
+
+    breaker.record_success()
+    assert breaker.state == CLOSED
+    assert breaker.trips == 0
+
+
+def test_circuit_breaker_round_trips_through_dict():
+    breaker = CircuitBreaker()
+    breaker.record_failure(timedelta(minutes=10), now=datetime(2024, 3, 12, 9, 0))
+
+    assert CircuitBreaker.from_dict(breaker.to_dict()) == breaker
+
+
+def test_aimd_pacer_shrinks_additively_and_backs_off_multiplicatively():
+    pacer = AimdPacer(delay=6, min_delay=5, max_delay=20)
+
+    pacer.on_success()
+    pacer.on_success()
+    assert pacer.delay == 5
+
+    pacer.on_throttle()
+    pacer.on_throttle()
+    pacer.on_throttle()
+    assert pacer.delay == 20
@@ -0,0 +1,59 @@
+from pathlib import Path
+
+from src.database.repository import DatabaseManager
+from src.main import run_reparse
+from src.scrapers.base_scraper import JobOffer
+from src.utils.deduplication import generate_job_hash
+from src.utils.page_archive import JOB_PAGE, PageArchive
+
+
+FIXTURES = Path(__file__).parent / "fixtures" / "linkedin"
+
+
+def test_archive_deduplicates_identical_content(tmp_path):
+    archive = PageArchive(tmp_path)
+
+    first = archive.store("job-a", "alert_email", "<html>same</html>")
+    second = archive.store("job-b", "alert_email", "<html>same</html>")
+
+    assert first == second
+    assert len(list((tmp_path / "objects").glob("*/*.gz"))) == 1
+    assert archive.load("job-b", "alert_email") == "<html>same</html>"
+    assert sorted(archive.job_hashes()) == ["job-a", "job-b"]
+
+
+def test_reparse_rebuilds_linkedin_details_without_network(tmp_path):
+    repository = DatabaseManager(str(tmp_path / "jobs.db"))
+    repository.init_db()
+    archive = PageArchive(tmp_path / "archive")
+    offer = JobOffer(
+        source="linkedin",
+        external_id=None,
+        url="https://www.linkedin.com/jobs/view/3812345601",
+        title="Data Analyst Power BI H/F",
+        company="Capgemini",
+        location="Paris",
+        contract_type=None,
+        salary_min=None,
+        salary_max=None,
+        description="",
+        detail_status="failed",
+    )
+    job, _ = repository.add_job_offer(offer)
+    archive.store(
+        generate_job_hash(offer.url, offer.title, offer.company),
+        JOB_PAGE,
+        (FIXTURES / "job_page_guest.html").read_text(encoding="utf-8"),
+    )
+    settings = {"scraping": {}, "scoring": {"keyword_prefilter_threshold": 30}}
+    profile = {"skills": {"required": [{"keyword": "Power BI", "weight": 10}]}}
+
+    assert run_reparse(settings, profile, repository, archive) == 1
+
+    rebuilt = repository.get_job_by_hash(job.hash)
+    assert rebuilt.detail_status == "fetched"
+    assert rebuilt.contract_type == "CDI"
+    assert rebuilt.salary_min == 42000
+    assert rebuilt.description.startswith("Votre mission")
+    assert rebuilt.keyword_score == 100.0
+    assert [event.job_id for event in repository.get_job_events(0)] == [job.id]
@@ -0,0 +1,56 @@
+from datetime import datetime, timedelta
+
+from src.database.repository import DatabaseManager
+from src.scrapers.base_scraper import JobOffer
+
+
+def _repository(tmp_path):
+    repository = DatabaseManager(str(tmp_path / "jobs.db"))
+    repository.init_db()
+    return repository
+
+
+def _linkedin_offer(job_id: str, scraped_at: datetime) -> JobOffer:
+    return JobOffer(
+        source="linkedin",
+        external_id=None,
+        url=f"https://www.linkedin.com/jobs/view/{job_id}",
+        title=f"Job {job_id}",
+        company="Example",
+        location=None,
+        contract_type=None,
+        salary_min=None,
+        salary_max=None,
+        description="",
+        detail_status="pending",
+        scraped_at=scraped_at,
+    )
+
+
+def test_pending_linkedin_jobs_are_ranked_by_decayed_priority(tmp_path):
+    repository = _repository(tmp_path)
+    now = datetime.utcnow()
+    priorities = {"old-high": (80.0, 10), "fresh-mid": (60.0, 0), "fresh-low": (10.0, 0)}
+    seeded = {}
+    for job_id, (priority, age_days) in priorities.items():
+        job, _ = repository.add_job_offer(_linkedin_offer(job_id, now - timedelta(days=age_days)))
+        seeded[job.id] = priority
+    repository.update_fetch_priorities(seeded)
+
+    ranked = repository.get_pending_linkedin_jobs(limit=2, decay_per_day=5)
+
+    assert [job.title for job in ranked] == ["Job fresh-mid", "Job old-high"]
+
+
+def test_add_job_offers_deduplicates_within_and_across_batches(tmp_path):
+    repository = _repository(tmp_path)
+    now = datetime.utcnow()
+    repository.add_job_offer(_linkedin_offer("known", now))
+
+    results = repository.add_job_offers(
+        [_linkedin_offer("known", now), _linkedin_offer("new", now), _linkedin_offer("new", now)]
+    )
+
+    assert [created for _, created in results] == [False, True, False]
+    assert results[1][0].id == results[2][0].id
+    assert repository.get_stats()["total"] == 2
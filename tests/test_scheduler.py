@@ -0,0 +1,77 @@
+import threading
+
+from src import main as main_module
+from src.database.repository import DatabaseManager
+from src.scheduler import ScheduledSource, ScrapeScheduler
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_sources_run_on_their_own_interval():
+    clock = _Clock()
+    runs = []
+    scheduler = ScrapeScheduler(
+        lambda sources: runs.append(sorted(sources)) or True,
+        [ScheduledSource("wttj", interval=300), ScheduledSource("linkedin", interval=100)],
+        clock=clock,
+    )
+
+    for now in range(0, 601, 50):
+        clock.now = now
+        scheduler.run_pending()
+
+    assert runs == [
+        ["linkedin", "wttj"],
+        ["linkedin"],
+        ["linkedin"],
+        ["linkedin", "wttj"],
+        ["linkedin"],
+        ["linkedin"],
+        ["linkedin", "wttj"],
+    ]
+
+
+def test_busy_runner_defers_sources():
+    clock = _Clock()
+    scheduler = ScrapeScheduler(
+        lambda sources: False,
+        [ScheduledSource("wttj", interval=300)],
+        busy_retry_seconds=30,
+        clock=clock,
+    )
+
+    assert scheduler.run_pending() == []
+    assert scheduler.sources["wttj"].next_run == 30
+
+
+def test_runner_refuses_overlapping_cycles(tmp_path, monkeypatch):
+    started = threading.Event()
+    release = threading.Event()
+
+    def slow_cycle(*args, **kwargs):
+        started.set()
+        release.wait(5)
+        return {"jobs_found": 0, "jobs_new": 0, "errors": {}}
+
+    monkeypatch.setattr(main_module, "run_scrape_cycle", slow_cycle)
+    monkeypatch.setattr(main_module, "build_scrapers", lambda *args, **kwargs: [])
+    repository = DatabaseManager(str(tmp_path / "jobs.db"))
+    repository.init_db()
+    runner = main_module.ScrapeRunner({}, {}, repository)
+
+    results = []
+    worker = threading.Thread(target=lambda: results.append(runner.run()))
+    worker.start()
+    assert started.wait(5)
+
+    assert runner.run() is False
+    release.set()
+    worker.join(5)
+    assert results == [True]
+    assert runner.run() is True
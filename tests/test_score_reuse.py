@@ -0,0 +1,102 @@
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import update
+
+from src.database.models import Job
+from src.main import _save_keyword_scores
+from src.matcher.ai_scorer import AI_TOKENS_SAVED
+from src.utils.deduplication import generate_content_fingerprint
+
+SCORING = {
+    "keyword_prefilter_threshold": 30,
+    "weights": {"keyword_score": 0.5, "ai_score": 0.5},
+    "ai_score_reuse": {"enabled": True, "max_age_days": 14},
+}
+DESCRIPTION = "Mission Power BI / SQL chez un client grand compte."
+
+
+@pytest.fixture()
+def seed_offer(seed_jobs):
+    """Add one offer sharing the title and company of every other, so only ``description`` sets its fingerprint."""
+
+    def seed(description: str = DESCRIPTION) -> int:
+        (job_id,) = seed_jobs(1, title="Data Analyst", description=description)
+        return job_id
+
+    return seed
+
+
+@pytest.fixture()
+def scored_original(repository, seed_offer):
+    def score(scored_days_ago: float = 1) -> int:
+        original = seed_offer()
+        repository.update_keyword_scores({original: 60.0})
+        repository.update_ai_scores([{"job_id": original, "ai_score": 80, "reasoning": "Bon match"}], {})
+        with repository.session_scope() as session:
+            session.execute(update(Job).values(scored_at=datetime.utcnow() - timedelta(days=scored_days_ago)))
+        return original
+
+    return score
+
+
+def test_fingerprint_ignores_case_accents_and_punctuation():
+    assert generate_content_fingerprint("Data Analyst", "Exemple", "Créer des rapports !") == (
+        generate_content_fingerprint("DATA analyst", "exemple", "Creer  des rapports")
+    )
+    assert generate_content_fingerprint("Data Analyst", "Exemple", "Autre mission") != (
+        generate_content_fingerprint("Data Analyst", "Exemple", "Créer des rapports")
+    )
+    assert generate_content_fingerprint("Data Analyst", "Exemple", "") is None
+
+
+def test_repost_inherits_ai_score_and_skips_agent_queue(repository, scored_original, seed_offer):
+    original = scored_original()
+    repost = seed_offer(DESCRIPTION.upper())
+    saved_before = AI_TOKENS_SAVED.value("wttj")
+
+    _save_keyword_scores(repository, {}, {repost: 40.0}, SCORING)
+
+    with repository.session_scope() as session:
+        job = session.get(Job, repost)
+        assert (job.status, job.ai_score, job.ai_reasoning) == ("scored", 80.0, "Bon match")
+        assert job.final_score == 60.0
+        assert job.ai_score_reused_from == original
+    assert repository.get_pending_jobs(0) == []
+    assert repository.get_job_events(0) == []
+    assert AI_TOKENS_SAVED.value("wttj") > saved_before
+
+
+def test_stale_or_different_offers_are_sent_to_the_agent(repository, scored_original, seed_offer):
+    scored_original(scored_days_ago=30)
+    repost = seed_offer()
+    other = seed_offer("Contrôle de gestion SAP.")
+
+    _save_keyword_scores(repository, {}, {repost: 40.0, other: 40.0}, SCORING)
+
+    assert {job.id for job in repository.get_pending_jobs(0)} == {repost, other}
+    assert [event.job_id for event in repository.get_job_events(0)] == [repost, other]
+
+
+def test_repost_of_an_unannounced_offer_is_queued_for_notification(repository, scored_original, seed_offer):
+    scored_original()
+    repost = seed_offer()
+
+    _save_keyword_scores(repository, {}, {repost: 40.0}, {**SCORING, "ai_scoring_threshold": 60})
+
+    assert [job.id for job in repository.get_due_notifications(10)] == [repost]
+    assert repository.get_stats()["notifications_pending"] == 1
+
+
+def test_repost_of_an_announced_offer_is_marked_notified(repository, scored_original, seed_offer):
+    original = scored_original()
+    repository.mark_notified(original)
+    repost = seed_offer()
+
+    _save_keyword_scores(repository, {}, {repost: 40.0}, {**SCORING, "ai_scoring_threshold": 60})
+
+    with repository.session_scope() as session:
+        job = session.get(Job, repost)
+        assert job.status == "notified"
+        assert job.notified_at == session.get(Job, original).notified_at
+    assert repository.count_pending_notifications() == 0
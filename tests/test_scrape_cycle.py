@@ -0,0 +1,174 @@
+import json
+import threading
+from datetime import timedelta
+
+from src import main as main_module
+from src.database.repository import DatabaseManager
+from src.scrapers import linkedin_email, wttj_scraper
+from src.scrapers.base_scraper import JobOffer
+
+
+def _offer(source: str, job_id: str) -> JobOffer:
+    return JobOffer(
+        source=source,
+        external_id=None,
+        url=f"https://example.com/{source}/{job_id}",
+        title="Data Analyst",
+        company="Example",
+        location="Paris",
+        contract_type="CDI",
+        salary_min=None,
+        salary_max=None,
+        description="Power BI and SQL",
+    )
+
+
+class _FakeScraper:
+    def __init__(self, source_name, scrape, available=True):
+        self.source_name = source_name
+        self._scrape = scrape
+        self._available = available
+        self.last_history_id = None
+        self.max_fetches_per_run = 0
+
+    def is_available(self):
+        return self._available
+
+    def iter_offers(self):
+        yield from self._scrape()
+
+    def restore_fetch_state(self, state):
+        pass
+
+
+def test_slow_source_does_not_delay_ingestion_of_other_sources(tmp_path, monkeypatch):
+    repository = DatabaseManager(str(tmp_path / "jobs.db"))
+    repository.init_db()
+    wttj_ingested = threading.Event()
+    original_add = repository.add_job_offers
+
+    def add_job_offers(offers):
+        result = original_add(offers)
+        if any(offer.source == "wttj" for offer in offers):
+            wttj_ingested.set()
+        return result
+
+    monkeypatch.setattr(repository, "add_job_offers", add_job_offers)
+
+    def slow_linkedin():
+        assert wttj_ingested.wait(timeout=5)
+        return [_offer("linkedin", "1")]
+
+    def fast_wttj():
+        return [_offer("wttj", "1")]
+
+    monkeypatch.setattr(
+        wttj_scraper, "WttjScraper", lambda **kwargs: _FakeScraper("wttj", fast_wttj)
+    )
+    monkeypatch.setattr(
+        linkedin_email, "LinkedInEmailScraper", lambda **kwargs: _FakeScraper("linkedin", slow_linkedin)
+    )
+    settings = {
+        "scraping": {"wttj": {"enabled": True}, "linkedin": {"enabled": True, "fetch_details": False}},
+        "database": {"cleanup_days": 30},
+    }
+    profile = {"skills": {"required": [{"keyword": "Power BI", "weight": 10}]}}
+
+    main_module.run_scrape_cycle(settings, profile, repository)
+
+    assert repository.get_stats()["total"] == 2
+    assert repository.get_scrape_runs() == []
+
+
+def test_offers_are_committed_in_batches_while_scraper_is_still_running(tmp_path, monkeypatch):
+    repository = DatabaseManager(str(tmp_path / "jobs.db"))
+    repository.init_db()
+    committed_before_end = []
+
+    def streaming_wttj():
+        yield _offer("wttj", "1")
+        yield _offer("wttj", "2")
+        for _ in range(50):
+            if repository.get_stats()["total"] == 2:
+                break
+            threading.Event().wait(0.05)
+        committed_before_end.append(repository.get_stats()["total"])
+        yield _offer("wttj", "3")
+
+    monkeypatch.setattr(wttj_scraper, "WttjScraper", lambda **kwargs: _FakeScraper("wttj", streaming_wttj))
+    settings = {"scraping": {"batch_size": 2, "wttj": {"enabled": True}}, "database": {"cleanup_days": 30}}
+
+    main_module.run_scrape_cycle(settings, {"skills": {}}, repository)
+
+    assert committed_before_end == [2]
+    assert repository.get_stats()["total"] == 3
+
+
+def test_cycle_logs_one_row_per_source_with_stage_timings(tmp_path, monkeypatch):
+    repository = DatabaseManager(str(tmp_path / "jobs.db"))
+    repository.init_db()
+    run_id = repository.start_scrape_run("all")
+
+    def wttj():
+        wttj_fake.stats.add_bytes(2048)
+        wttj_fake.stats.add_rate_limit_event()
+        yield _offer("wttj", "1")
+        yield _offer("wttj", "1")
+
+    wttj_fake = _FakeScraper("wttj", wttj)
+    monkeypatch.setattr(wttj_scraper, "WttjScraper", lambda **kwargs: wttj_fake)
+    settings = {"scraping": {"wttj": {"enabled": True}}, "database": {"cleanup_days": 30}}
+    profile = {"skills": {"required": [{"keyword": "SQL", "weight": 10}]}}
+
+    result = main_module.run_scrape_cycle(settings, profile, repository, run_id=run_id)
+
+    assert (result["bytes_downloaded"], result["rate_limit_events"]) == (2048, 1)
+    [row] = repository.get_source_runs([run_id])[run_id]
+    assert (row.source, row.status) == ("wttj", "completed")
+    assert (row.jobs_found, row.jobs_new, row.jobs_duplicate) == (2, 1, 1)
+    assert (row.bytes_downloaded, row.rate_limit_events) == (2048, 1)
+    assert {"db_write", "scoring"} <= set(json.loads(row.stage_timings))
+    assert [run.id for run in repository.get_scrape_runs()] == [run_id]
+
+
+def test_unavailable_source_is_logged_as_skipped(tmp_path, monkeypatch):
+    repository = DatabaseManager(str(tmp_path / "jobs.db"))
+    repository.init_db()
+    run_id = repository.start_scrape_run("all")
+    monkeypatch.setattr(wttj_scraper, "WttjScraper", lambda **kwargs: _FakeScraper("wttj", list, available=False))
+    settings = {"scraping": {"wttj": {"enabled": True}}, "database": {"cleanup_days": 30}}
+
+    result = main_module.run_scrape_cycle(settings, {"skills": {}}, repository, run_id=run_id)
+
+    assert result["skipped"] == {"wttj": "source unavailable, nothing scraped"}
+    [row] = repository.get_source_runs([run_id])[run_id]
+    assert (row.status, row.jobs_found, row.error_message) == ("skipped", 0, "source unavailable, nothing scraped")
+
+
+def test_each_source_row_records_its_own_start(tmp_path, monkeypatch):
+    repository = DatabaseManager(str(tmp_path / "jobs.db"))
+    repository.init_db()
+    run_id = repository.start_scrape_run("all")
+
+    def slow_wttj():
+        threading.Event().wait(0.05)
+        return [_offer("wttj", "1")]
+
+    monkeypatch.setattr(wttj_scraper, "WttjScraper", lambda **kwargs: _FakeScraper("wttj", slow_wttj))
+    monkeypatch.setattr(
+        linkedin_email, "LinkedInEmailScraper", lambda **kwargs: _FakeScraper("linkedin", lambda: [])
+    )
+    settings = {
+        "scraping": {
+            "max_workers": 1,
+            "wttj": {"enabled": True},
+            "linkedin": {"enabled": True, "fetch_details": False},
+        },
+        "database": {"cleanup_days": 30},
+    }
+
+    main_module.run_scrape_cycle(settings, {"skills": {}}, repository, run_id=run_id)
+
+    wttj, linkedin = repository.get_source_runs([run_id])[run_id]
+    assert (wttj.source, linkedin.source) == ("wttj", "linkedin")
+    assert linkedin.started_at - wttj.started_at >= timedelta(seconds=0.05)
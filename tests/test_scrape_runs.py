@@ -0,0 +1,65 @@
+import threading
+
+from fastapi.testclient import TestClient
+
+from src import main as main_module
+from src.api.routes import create_app
+from src.database.repository import DatabaseManager
+
+
+def _runner(tmp_path, monkeypatch, cycle):
+    monkeypatch.setattr(main_module, "run_scrape_cycle", cycle)
+    monkeypatch.setattr(main_module, "build_scrapers", lambda *args, **kwargs: [])
+    repository = DatabaseManager(str(tmp_path / "jobs.db"))
+    repository.init_db()
+    return main_module.ScrapeRunner({}, {}, repository), repository
+
+
+def test_trigger_returns_run_id_immediately_and_coalesces(tmp_path, monkeypatch):
+    release = threading.Event()
+    finished = threading.Event()
+
+    def cycle(*args, **kwargs):
+        release.wait(5)
+        finished.set()
+        return {"jobs_found": 5, "jobs_new": 3, "errors": {"linkedin": "boom"}}
+
+    runner, repository = _runner(tmp_path, monkeypatch, cycle)
+    client = TestClient(create_app({}, {}, repository, None, scrape_callable=runner.start))
+
+    first = client.post("/api/trigger-scrape")
+    second = client.post("/api/trigger-scrape")
+
+    assert first.status_code == 202
+    assert first.json()["status"] == "started"
+    assert second.json() == {"status": "already_running", "run_id": first.json()["run_id"]}
+    assert client.get(f"/api/scrape-runs/{first.json()['run_id']}").json()["status"] == "running"
+
+    release.set()
+    assert finished.wait(5)
+    for _ in range(50):
+        if not runner.running:
+            break
+        threading.Event().wait(0.02)
+
+    run = client.get(f"/api/scrape-runs/{first.json()['run_id']}").json()
+    assert run["status"] == "completed"
+    assert (run["jobs_found"], run["jobs_new"], run["jobs_duplicate"]) == (5, 3, 2)
+    assert run["error_message"] == "linkedin: boom"
+    assert client.get("/api/scrape-runs/999").status_code == 404
+    assert [item["id"] for item in client.get("/api/scrape-runs").json()] == [first.json()["run_id"]]
+
+
+def test_failed_cycle_is_recorded(tmp_path, monkeypatch):
+    def cycle(*args, **kwargs):
+        raise RuntimeError("database locked")
+
+    runner, repository = _runner(tmp_path, monkeypatch, cycle)
+
+    assert runner.run()
+
+    run = repository.get_scrape_run(1)
+    assert run.status == "failed"
+    assert run.error_message == "database locked"
+    assert runner.last_error == "database locked"
+    assert not runner.running